@@ -0,0 +1,62 @@
+"""
+Benchmark: ``parseASCII`` throughput of the C and pyarrow CSV engines on
+synthetic comma-delimited exports, with and without delimiter sniffing.
+
+Usage:
+    python benchmarks/bench_ascii_engine.py [size_gb ...]     # default: 0.1 0.5
+"""
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from LASMnemonicsID.ASCII.ASCII import parseASCII
+
+N_CURVES = 12
+NAMES = ["GR", "RHOB", "NPHI", "DT", "SP", "CALI", "ILD"] + [f"C{i:03d}" for i in range(N_CURVES - 7)]
+
+
+def write_csv(path, size_gb, null=-999.25, block_rows=200_000):
+    """Write a DEPTH + curves CSV of about ``size_gb`` with a unit row and NULL values sprinkled in."""
+    rng = np.random.default_rng(0)
+    target = size_gb * 1e9
+    with open(path, "w") as f:
+        f.write(",".join(["DEPTH"] + NAMES) + "\n")
+        f.write(",".join(["m"] + ["unitless"] * N_CURVES) + "\n")
+        start = 0
+        while f.tell() < target:
+            depth = 1000.0 + 0.1524 * (start + np.arange(block_rows))
+            data = rng.random((block_rows, N_CURVES)) * 100.0
+            data[rng.random(data.shape) < 0.01] = null
+            np.savetxt(f, np.column_stack([depth, data]), fmt="%.4f", delimiter=",")
+            start += block_rows
+
+
+def main(sizes):
+    engines = ["c"] + (["pyarrow"] if importlib.util.find_spec("pyarrow") else [])
+    if len(engines) == 1:
+        print("pyarrow is not installed; timing the C engine only")
+    runs = [(engine, delimiter) for engine in engines for delimiter in (",", None)]
+    print(f"{'GB':>6} " + " ".join(f"{engine + (' sniff' if d is None else ''):>14}" for engine, d in runs)
+          + "   (MB/s)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_gb in sizes:
+            path = Path(tmp) / f"bench_{size_gb}.csv"
+            write_csv(path, size_gb)
+            size_mb = path.stat().st_size / 1e6
+            rates = []
+            for engine, delimiter in runs:
+                start = time.perf_counter()
+                parseASCII(path, verbose=False, engine=engine, delimiter=delimiter)
+                rates.append(size_mb / (time.perf_counter() - start))
+            print(f"{size_mb / 1e3:>6.2f} " + " ".join(f"{rate:>14.0f}" for rate in rates))
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main([float(arg) for arg in sys.argv[1:]] or [0.1, 0.5])
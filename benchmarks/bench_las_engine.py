@@ -0,0 +1,57 @@
+"""
+Benchmark: ``parseLAS(engine="fast")`` vs. the lasio reader on synthetic
+unwrapped LAS 2.0 files.
+
+Usage:
+    python benchmarks/bench_las_engine.py
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from LASMnemonicsID.LAS.LAS import parseLAS
+
+
+def write_las(path, n_rows, n_curves, null=-999.25):
+    """Write an unwrapped, whitespace-delimited LAS 2.0 file with NULL values sprinkled in."""
+    rng = np.random.default_rng(0)
+    depth = 1000.0 + 0.5 * np.arange(n_rows)
+    data = rng.random((n_rows, n_curves)) * 100.0
+    data[rng.random(data.shape) < 0.01] = null
+    names = ["GR", "RHOB", "NPHI", "DT", "SP", "CALI", "ILD"]
+    names += [f"C{i:03d}" for i in range(max(0, n_curves - len(names)))]
+    with open(path, "w") as f:
+        f.write("~Version Information\n VERS. 2.0 :\n WRAP. NO :\n")
+        f.write("~Well Information\n")
+        f.write(f" STRT.FT {depth[0]:.4f} :\n STOP.FT {depth[-1]:.4f} :\n STEP.FT 0.5 :\n")
+        f.write(f" NULL. {null} :\n WELL. BENCH-1 :\n")
+        f.write("~Curve Information\n DEPT.FT :\n")
+        for name in names[:n_curves]:
+            f.write(f" {name}. :\n")
+        f.write("~A\n")
+        np.savetxt(f, np.column_stack([depth, data]), fmt="%.4f")
+
+
+def main():
+    print(f"{'rows':>8} {'curves':>7} {'MB':>7} {'lasio (s)':>10} {'fast (s)':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows, n_curves in ((10_000, 10), (100_000, 10), (100_000, 50), (500_000, 20)):
+            path = Path(tmp) / f"bench_{n_rows}_{n_curves}.las"
+            write_las(path, n_rows, n_curves)
+            size_mb = path.stat().st_size / 1e6
+            timings = {}
+            for engine in ("lasio", "fast"):
+                start = time.perf_counter()
+                parseLAS(path, verbose=False, engine=engine)
+                timings[engine] = time.perf_counter() - start
+            print(f"{n_rows:>8} {n_curves:>7} {size_mb:>7.1f} {timings['lasio']:>10.2f} "
+                  f"{timings['fast']:>9.2f} {timings['lasio'] / timings['fast']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: alias index lookup vs. the per-column alias scan in
+``_standardize_all_curves`` on wide DataFrames.
+
+Usage:
+    python benchmarks/bench_standardize.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import LASMnemonicsID.utils.mnemonics as mnm
+from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+
+
+STD_NAMES = {
+    "gamma": "GR",
+    "sp": "SP",
+    "caliper": "CALI",
+    "deepres": "RT",
+    "rxo": "RXO",
+    "density": "RHOB",
+    "density_correction": "DRHO",
+    "neutron": "NPHI",
+    "dtc": "DT",
+    "dts": "DTS",
+    "pe": "PEF"
+}
+
+
+def _legacy_standardize(df, std_names):
+    """Previous implementation: rebuild the alias list per type and per column."""
+    mnem_dict = mnm.create_mnemonic_dict(
+        mnm.gamma_names, mnm.sp_names, mnm.caliper_names, mnm.deepres_names,
+        mnm.rxo_names, mnm.density_names, mnm.density_correction_names,
+        mnm.neutron_names, mnm.dtc_names, mnm.dts_names, mnm.pe_names
+    )
+    for curve_type, aliases in mnem_dict.items():
+        matching = [col for col in df.columns if col.lower() in [a.lower() for a in aliases]]
+        if not matching:
+            continue
+        target_name = std_names.get(curve_type, curve_type.upper())
+        df.rename(columns={matching[0]: target_name}, inplace=True)
+        for col in matching:
+            if col != target_name and col in df.columns:
+                df.drop(columns=[col], inplace=True)
+
+
+def make_wide_frame(n_curves, n_rows=100):
+    """Wide frame mixing known aliases with vendor-specific unknown curves."""
+    aliases = [a for names in mnm.mnemonic_dict.values() for a in names]
+    columns = []
+    for i in range(n_curves):
+        if i % 4 == 0:
+            columns.append(aliases[i % len(aliases)].upper())
+        else:
+            columns.append(f"CURVE_{i:04d}")
+    columns = list(dict.fromkeys(columns))
+    data = np.random.default_rng(0).random((n_rows, len(columns)))
+    return pd.DataFrame(data, columns=columns)
+
+
+def main():
+    print(f"{'curves':>8} {'legacy (ms)':>12} {'index (ms)':>12} {'speedup':>8}")
+    for n_curves in (20, 50, 200, 500):
+        base = make_wide_frame(n_curves)
+        number = 20
+        legacy = timeit.timeit(lambda: _legacy_standardize(base.copy(), STD_NAMES), number=number)
+        index = timeit.timeit(lambda: _standardize_all_curves(None, base.copy(), STD_NAMES), number=number)
+        legacy_ms = legacy / number * 1e3
+        index_ms = index / number * 1e3
+        print(f"{n_curves:>8} {legacy_ms:>12.2f} {index_ms:>12.2f} {legacy_ms / index_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
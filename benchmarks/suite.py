@@ -0,0 +1,252 @@
+"""
+Benchmark suite for ``parseLAS``, ``parseDLIS``, ``parseASCII`` and
+``_standardize_all_curves``.
+
+Synthetic inputs are generated locally and every case runs in a fresh
+subprocess, so the reported peak RSS belongs to that case alone. Each case
+scales one dimension (depth samples, curves or files) with the others held at
+a small base value. Results are reported as time per file, MB/s and peak RSS
+and compared against a stored baseline (``benchmarks/baseline.json``).
+
+DLIS files cannot be synthesized (dlisio only reads), so the DLIS cases copy
+the sample files from ``tests/data`` and scale the file count only.
+
+Usage:
+    python benchmarks/suite.py                    # quick scale, compare with baseline
+    python benchmarks/suite.py --scale full       # 10-2,000 curves, 1k-5M samples, 1-10k files
+    python benchmarks/suite.py --save-baseline    # store the results as the new baseline
+    python benchmarks/suite.py --filter las       # only cases whose id contains "las"
+    python benchmarks/suite.py --fail-on-regression
+"""
+import argparse
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+BASELINE = Path(__file__).parent / "baseline.json"
+
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_las_engine import write_las
+from bench_standardize import STD_NAMES, make_wide_frame
+
+# Values of each axis per scale; the first value of each axis is the shared base of the other cases
+SCALES = {
+    "quick": {
+        "rows": (1_000, 100_000),
+        "curves": (10, 200),
+        "files": (1, 100),
+    },
+    "full": {
+        "rows": (1_000, 100_000, 1_000_000, 5_000_000),
+        "curves": (10, 200, 2_000),
+        "files": (1, 100, 1_000, 10_000),
+    },
+}
+KINDS = ("las", "las-fast", "ascii", "dlis", "standardize")
+
+
+def build_cases(scale):
+    """Cases varying one axis at a time from the (rows, curves, files) base."""
+    axes = SCALES[scale]
+    base = {"rows": axes["rows"][0], "curves": axes["curves"][0], "files": axes["files"][0]}
+    cases = {}
+    for kind in KINDS:
+        for axis, values in axes.items():
+            if kind == "dlis" and axis != "files":
+                continue
+            if kind == "standardize" and axis == "files":
+                continue
+            for value in values:
+                params = dict(base, **{axis: value})
+                if kind == "dlis":
+                    params["rows"] = params["curves"] = None
+                    shape = "sample"
+                else:
+                    shape = f"{params['rows']}x{params['curves']}"
+                case_id = f"{kind}/{shape}/{params['files']}f"
+                cases[case_id] = dict(params, kind=kind)
+    return cases
+
+
+def write_ascii(path, n_rows, n_curves):
+    """Write a comma-separated file with a DEPTH column and a mix of known and unknown curves."""
+    rng = np.random.default_rng(0)
+    depth = 1000.0 + 0.5 * np.arange(n_rows)
+    names = ["GR", "RHOB", "NPHI", "DT", "SP", "CALI", "ILD"]
+    names += [f"C{i:03d}" for i in range(max(0, n_curves - len(names)))]
+    with open(path, "w") as f:
+        f.write(",".join(["DEPTH"] + names[:n_curves]) + "\n")
+        np.savetxt(f, np.column_stack([depth, rng.random((n_rows, n_curves)) * 100.0]),
+                   fmt="%.4f", delimiter=",")
+
+
+def generate(case, work_dir):
+    """Materialize the input files of a case once; returns the input path (file or directory)."""
+    kind, rows, curves, files = case["kind"], case["rows"], case["curves"], case["files"]
+    if kind == "standardize":
+        return None
+    if kind == "dlis":
+        target = work_dir / f"dlis_{files}"
+        if not target.exists():
+            target.mkdir()
+            samples = sorted(DATA_DIR.glob("*.DLIS")) + sorted(DATA_DIR.glob("*.dlis"))
+            for i in range(files):
+                shutil.copyfile(samples[i % len(samples)], target / f"well_{i:05d}.dlis")
+        return target if files > 1 else next(target.iterdir())
+
+    suffix, writer = (".csv", write_ascii) if kind == "ascii" else (".las", write_las)
+    target = work_dir / f"{suffix[1:]}_{rows}x{curves}_{files}"
+    if not target.exists():
+        target.mkdir()
+        first = target / f"well_00000{suffix}"
+        writer(first, rows, curves)
+        for i in range(1, files):
+            # Identical content parses at the same speed; copying keeps generation cheap
+            shutil.copyfile(first, target / f"well_{i:05d}{suffix}")
+    return target if files > 1 else next(target.iterdir())
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def run_case(case, path, repeat):
+    """Time one case in this process (called in the benchmark subprocess)."""
+    from LASMnemonicsID.ASCII import parseASCII
+    from LASMnemonicsID.DLIS import parseDLIS
+    from LASMnemonicsID.LAS import parseLAS
+    from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+
+    kind = case["kind"]
+    if kind == "standardize":
+        base = make_wide_frame(case["curves"], n_rows=case["rows"])
+        n_bytes = base.memory_usage(index=True).sum()
+        run = lambda: _standardize_all_curves(None, base.copy(), STD_NAMES)
+    else:
+        path = Path(path)
+        inputs = [path] if path.is_file() else list(path.iterdir())
+        n_bytes = sum(p.stat().st_size for p in inputs)
+        if kind == "ascii":
+            run = lambda: parseASCII(path, verbose=False)
+        elif kind == "dlis":
+            run = lambda: parseDLIS(path, verbose=False)
+        else:
+            engine = "fast" if kind == "las-fast" else "lasio"
+            run = lambda: parseLAS(path, verbose=False, engine=engine)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "seconds": best,
+        "per_file_ms": best / case["files"] * 1e3,
+        "mb_per_s": n_bytes / 1e6 / best if best else float("inf"),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_isolated(case, path, repeat):
+    """Run a case in a fresh interpreter so its peak RSS is not polluted by earlier cases."""
+    payload = json.dumps({"case": case, "path": str(path) if path else None, "repeat": repeat})
+    proc = subprocess.run([sys.executable, __file__, "--run-case", payload],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "benchmark failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    """Print a table against the baseline → list of regressed case ids."""
+    regressions = []
+    print(f"{'case':<36} {'ms/file':>10} {'MB/s':>9} {'RSS MB':>8} {'baseline':>10} {'change':>8}")
+    for case_id, res in results.items():
+        base = baseline.get(case_id)
+        change = ""
+        if base:
+            ratio = res["per_file_ms"] / base["per_file_ms"]
+            change = f"{(ratio - 1) * 100:+.0f}%"
+            if ratio > 1 + threshold:
+                regressions.append(case_id)
+                change += " !"
+        base_ms = f"{base['per_file_ms']:.2f}" if base else "-"
+        print(f"{case_id:<36} {res['per_file_ms']:>10.2f} {res['mb_per_s']:>9.1f} "
+              f"{res['peak_rss_mb']:>8.1f} {base_ms:>10} {change:>8}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="quick")
+    parser.add_argument("--filter", default="", help="only run cases whose id contains this string")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the best is kept")
+    parser.add_argument("--data-dir", help="keep generated inputs here between runs")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs. the baseline")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        spec = json.loads(args.run_case)
+        print(json.dumps(run_case(spec["case"], spec["path"], spec["repeat"])))
+        return 0
+
+    cases = {k: v for k, v in build_cases(args.scale).items() if args.filter in k}
+    baseline_path = Path(args.baseline)
+    stored = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    baseline = stored.get("results", {})
+
+    tmp = None
+    if args.data_dir:
+        work_dir = Path(args.data_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        work_dir = Path(tmp.name)
+    try:
+        results = {}
+        for case_id, case in cases.items():
+            path = generate(case, work_dir)
+            # Large cases are dominated by parsing, not noise; one run is enough
+            repeat = 1 if (case["rows"] or 0) * (case["curves"] or 0) * case["files"] > 5e7 else args.repeat
+            results[case_id] = run_isolated(case, path, repeat)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    regressions = compare(results, baseline, args.threshold)
+    if args.save_baseline:
+        stored = {
+            "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                        "processor": platform.processor()},
+            "results": dict(baseline, **results),
+        }
+        baseline_path.write_text(json.dumps(stored, indent=1, sort_keys=True) + "\n")
+        print(f"Baseline saved to {baseline_path}")
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,122 +13,718 @@ from LASMnemonicsID.utils.mnemonics import (
     dts_names,
     pe_names,
 )
+import asyncio
+import csv
+import functools
+import importlib.util
 import os
+import re
+from collections import Counter, namedtuple
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 # Import helper functions from LAS module
-from ..LAS.LAS import create_mnemonic_dict, _standardize_all_curves
+from ..LAS.LAS import (
+    create_mnemonic_dict,
+    _standardize_all_curves,
+    _batch_return,
+    _build_std_names,
+    _resolve_curve_types,
+    _check_depth_range,
+    _depth_rows,
+    _slice_depth,
+    _read_depth_window,
+    DEPTH_CHUNK_ROWS,
+)
+from ..utils.parallel import prefetch as _prefetch
+from ..utils.cache import _as_cache
+from ..utils.aio import aread_files
+from ..utils.manifest import _as_manifest
+from ..utils.units import resolve_units as _resolve_units
+from ..utils.memory import compact_frame as _compact_frame, resolve_dtype as _resolve_dtype
+from ..utils.batch import read_batch as _read_batch, rerun_with as _rerun_with
+from ..utils.compression import (
+    find_sources as _find_sources,
+    is_plain_file as _is_plain_file,
+    is_single_source as _is_single_source,
+    open_source as _open_source,
+    source_handle as _source_handle,
+    source_stem as _source_stem,
+)
+from ..utils.instrument import (
+    measure as _measure,
+    report as _report,
+    phase as _phase,
+    skip as _skip,
+    _as_instrumentation,
+)
+
+# All supported ASCII extensions (case-insensitive)
+ASCII_EXTENSIONS = ['.csv', '.txt', '.asc', '.dat', '.ascii']
+
+# CSV readers: pandas' C parser, its Python parser, or the multithreaded pyarrow reader
+ASCII_ENGINES = ("c", "python", "pyarrow")
+
+# Bytes read to sniff the layout (delimiter, header row, unit row, null sentinel)
+SNIFF_BYTES = 64 * 1024
+# Delimiters tried by the sniffer, in order; whitespace-aligned files fall back to r"\s+"
+SNIFF_DELIMITERS = [",", "\t", ";", "|"]
+# Null sentinels recognised in the sampled data rows
+NULL_SENTINELS = (-999.25, -999.0, -9999.0, -99999.0)
+
+# ``delimiter`` of fixed-width files, whose columns are inferred from the blank gaps between them
+FIXED_WIDTH = "fixed"
+# Lines per block when cutting fixed-width columns out of the memory-mapped file
+FIXED_WIDTH_BLOCK_LINES = 1 << 18
+# Data lines start with a number (header, unit and preamble lines do not)
+_DATA_LINE = re.compile(r"^\s*[+\-]?\.?\d")
+# Numbers written with a decimal comma ("1000,5"), in files not delimited by ","
+_DECIMAL_COMMA = re.compile(r"^\s*[+\-]?\d+,\d+\s*$")
+
+AsciiLayout = namedtuple("AsciiLayout",
+                         ["delimiter", "columns", "units", "data_row", "null_values", "colspecs", "decimal"],
+                         defaults=(None, "."))
+AsciiLayout.__doc__ = """
+Layout of an ASCII log sniffed from its first bytes.
 
+Attributes:
+    delimiter (str): Field delimiter (r"\\s+" for whitespace-aligned columns).
+    columns (list): Column names of the header row (duplicates suffixed .1, .2, ...).
+    units (dict or None): {column: unit} from a unit row under the header.
+    data_row (int): Line number (0-based) of the first data row.
+    null_values (list): Null sentinels found in the sampled data rows, e.g. ["-999.25"].
+    colspecs (list or None): Fixed-width files only: (start, stop) character range of each
+        column; the last one runs to the end of the line (stop None).
+    decimal (str): Decimal separator of the numbers ("," in e.g. "1000,5;50,1" exports).
+"""
 
-def parseASCII(input_path, verbose=True, preferred_names=None, depth_col="DEPTH", delimiter=","):
+
+def parseASCII(input_path, verbose=True, preferred_names=None, depth_col="DEPTH", delimiter=None,
+               workers=None, executor=None, errors=None, cache=None, curve_types=None, depth_range=None,
+               instrument=None, as_result=False, fail_fast=False, manifest=None, units=None,
+               dtype=None, compact=False, engine="c", fuzzy=False):
     """
     Parse ASCII/CSV/TXT well log file or all in directory → DataFrame or {filename: df}.
     
     Args:
-        input_path (str/Path): ASCII/CSV/TXT file or directory
+        input_path (str/Path or list): ASCII/CSV/TXT file, directory or list of files. Compressed
+            files and zip/tar containers are read in place (see ``parseLAS``).
         verbose (bool): Print info
         preferred_names (dict, optional): Mapping of curve types to preferred column names.
             Example: {"deepres": "RT", "gamma": "GR"}
             If not provided, defaults to standard petrophysical names.
         depth_col (str): Name of depth column (default: "DEPTH")
-        delimiter (str): CSV delimiter (default: ",")
+        delimiter (str, optional): CSV delimiter. By default it is sniffed per file from the
+            first ``SNIFF_BYTES`` (",", tab, ";", "|" or whitespace-aligned columns), together
+            with the header row (preamble lines are skipped), a unit row and a null sentinel
+            such as -999.25. Aligned files with blank cells are read as fixed-width columns
+            (``"fixed"`` forces that): the column boundaries are inferred from the sampled
+            lines and the columns are sliced out of the memory-mapped file with NumPy.
+        workers (int, optional): Directory mode only. Read files in a process pool of this size.
+        executor (concurrent.futures.Executor, optional): Directory mode only. Executor to fan
+            the per-file reads out to (takes precedence over ``workers``).
+        errors (list, optional): Per-file failures are appended here as
+            (path, exception class name, message).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        curve_types (list, optional): Only read curves of these types, given as curve types
+            ("gamma", "density") or standard names ("GR", "RHOB"). The depth column is
+            always read; other columns are skipped by the CSV reader.
+        depth_range (tuple, optional): (top, base) depth window. The file is read in chunks
+            and reading stops once depth has passed the window.
+        instrument (Instrumentation or callable, optional): Receives the FileMetrics (phase
+            timings, bytes, shape, error) of every file; see ``utils.instrument``.
+        as_result (bool): Return a ``BatchResult`` with successes, failures and skipped
+            files (see ``parseLAS``); e.g. ``retry_failed(delimiter=";")``.
+        fail_fast (bool): Raise ``BatchReadError`` at the first file that fails.
+        manifest (Manifest or str/Path, optional): Only read files added or changed since the
+            last run (see ``parseLAS``).
+        units (str or dict, optional): Convert to canonical units (see ``parseLAS``). Source
+            units come from an optional unit row under the header (detected when its depth
+            value is not numeric).
+        dtype (str or numpy dtype, optional): Float dtype of the curves, e.g. "float32" (see
+            ``parseLAS``). Numeric columns are parsed straight into it; the depth index stays
+            float64.
+        compact (bool): Shorthand for ``dtype="float32"``.
+        engine (str): CSV reader: "c" (default), "python" or "pyarrow". "pyarrow" parses each
+            file with the multithreaded Arrow reader (requires pyarrow); whitespace-aligned
+            files still go through the C reader, and with ``depth_range`` the whole file is
+            read before slicing. It does not skip "#" comment lines between the data rows.
+        fuzzy (bool): Pattern-based mnemonic matching of vendor column names (see ``parseLAS``).
         
     Returns:
-        DataFrame (single) or dict {filename: df} (multiple/dir)
+        DataFrame (single) or dict {filename: df} (multiple/dir), or BatchResult
     """
-    input_path = Path(input_path)
+    if not isinstance(input_path, list):
+        input_path = Path(input_path)
     
-    # Define default standard names
-    std_names = {
-        "gamma": "GR",
-        "sp": "SP",
-        "caliper": "CALI",
-        "deepres": "RT",
-        "rxo": "RXO",
-        "density": "RHOB",
-        "density_correction": "DRHO",
-        "neutron": "NPHI",
-        "dtc": "DT",
-        "dts": "DTS",
-        "pe": "PEF"
+    std_names = _build_std_names(preferred_names)
+    
+    read_opts = {
+        "depth_col": depth_col,
+        "delimiter": delimiter,
+        "cache": _as_cache(cache),
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "engine": _check_ascii_engine(engine),
+        "fuzzy": bool(fuzzy),
     }
     
-    # Update with user preferences if provided
-    if preferred_names:
-        std_names.update(preferred_names)
+    instrument = _as_instrumentation(instrument)
+    manifest = _as_manifest(manifest)
     
-    # All supported ASCII extensions (case-insensitive)
-    ascii_extensions = ['.csv', '.txt', '.asc', '.dat', '.ascii']
+    # Case 1: Single File; Case 2: list of files or directory (recursive)
+    single = not isinstance(input_path, list) and _is_single_source(input_path, tuple(ASCII_EXTENSIONS))
+    ascii_files = [Path(path) for path in input_path] if isinstance(input_path, list) else _find_ascii_files(input_path)
+    if not ascii_files and verbose:
+        print(f"No ASCII/CSV files found in {input_path}")
+    # Deletions are only detected for a scanned directory
+    root = None if single or isinstance(input_path, list) else input_path
     
-    # Case 1: Single File
-    if input_path.is_file() and input_path.suffix.lower() in ascii_extensions:
-        df = _read_single_ascii(input_path, verbose, std_names, depth_col, delimiter)
-        return df if df is not None else None
+    rerun = _rerun_with(parseASCII, verbose=verbose, preferred_names=preferred_names, depth_col=depth_col,
+                       delimiter=delimiter, workers=workers, executor=executor, cache=cache,
+                       curve_types=curve_types, depth_range=depth_range, instrument=instrument,
+                       fail_fast=fail_fast, manifest=manifest, units=units,
+                       dtype=dtype, compact=compact, engine=engine, fuzzy=fuzzy)
+    result = _read_batch(_load_single_ascii, ascii_files, dict(std_names=std_names, **read_opts), verbose,
+                        None if single else workers, None if single else executor, instrument,
+                        fail_fast, rerun, manifest, "ascii", root)
+    return _batch_return(result, single, errors, as_result)
+
+
+def iter_ascii(input_path, verbose=True, preferred_names=None, depth_col="DEPTH", delimiter=None, prefetch=0,
+               cache=None, curve_types=None, depth_range=None, instrument=None, units=None, dtype=None,
+               compact=False, engine="c", fuzzy=False):
+    """
+    Lazily parse an ASCII/CSV/TXT file or all in directory → yields (filename, df) one well at a time.
     
-    # Case 2: Directory (Recursive) - CASE-INSENSITIVE
-    ascii_files = [f for f in input_path.rglob("*") if f.suffix.lower() in ascii_extensions]
-    if not ascii_files:
-        if verbose:
-            print(f"No ASCII/CSV files found in {input_path}")
-        return {}
+    Args:
+        input_path (str/Path): ASCII/CSV/TXT file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        depth_col (str): Name of depth column (default: "DEPTH")
+        delimiter (str, optional): CSV delimiter (default: sniffed, see ``parseASCII``)
+        prefetch (int): Number of wells to read ahead on a background thread (0 = no read-ahead).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        curve_types (list, optional): Only read curves of these types (see ``parseASCII``).
+        depth_range (tuple, optional): (top, base) depth window (see ``parseASCII``).
+        instrument (Instrumentation or callable, optional): Per-file metrics sink (see ``parseASCII``).
+        units (str or dict, optional): Convert to canonical units (see ``parseLAS``).
+        dtype, compact: Float dtype of the curves (see ``parseLAS``).
+        engine (str): CSV reader (see ``parseASCII``).
+        fuzzy (bool): Pattern-based mnemonic matching (see ``parseLAS``).
+        
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    read_opts = {
+        "depth_col": depth_col,
+        "delimiter": delimiter,
+        "cache": _as_cache(cache),
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "engine": _check_ascii_engine(engine),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    ascii_files = _find_ascii_files(Path(input_path))
     
-    ascii_dict = {}
-    for ascii_file in ascii_files:
-        df = _read_single_ascii(ascii_file, verbose, std_names, depth_col, delimiter)
-        if df is not None:
-            filename = ascii_file.name
-            ascii_dict[filename] = df
+    def _wells():
+        for ascii_file in ascii_files:
+            df = _read_single_ascii(ascii_file, verbose, std_names, instrument, **read_opts)
+            if df is not None:
+                yield ascii_file.name, df
     
-    # Return single DF if only 1 file found, else dict
-    if len(ascii_dict) == 1:
-        return next(iter(ascii_dict.values()))
+    yield from _prefetch(_wells(), prefetch)
+
+
+async def aparseASCII(input_path, verbose=True, preferred_names=None, depth_col="DEPTH", delimiter=None,
+                      executor=None, max_concurrency=None, semaphore=None, cache=None, curve_types=None,
+                      depth_range=None, instrument=None, units=None, dtype=None, compact=False, engine="c",
+                      fuzzy=False):
+    """
+    Async ``parseASCII`` for asyncio services → DataFrame or {filename: df}.
     
+    File discovery and parsing run on ``executor``, so the event loop is never blocked.
+    
+    Args:
+        input_path (str/Path): ASCII/CSV/TXT file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        depth_col (str): Name of depth column (default: "DEPTH")
+        delimiter (str, optional): CSV delimiter (default: sniffed, see ``parseASCII``)
+        executor (concurrent.futures.Executor, optional): Executor for the blocking reads
+            (default: the loop's thread pool).
+        max_concurrency (int, optional): Files parsed at the same time (default: number of CPUs).
+        semaphore (asyncio.Semaphore, optional): Concurrency limit shared with other calls.
+        cache, curve_types, depth_range, instrument, units, dtype, compact, engine, fuzzy: See
+            ``parseASCII``.
+        
+    Returns:
+        DataFrame (single) or dict {filename: df} (multiple/dir)
+    """
+    input_path = Path(input_path)
+    ascii_dict = {
+        name: df async for name, df in aiter_ascii(input_path, verbose, preferred_names, depth_col, delimiter,
+                                                   executor, max_concurrency, semaphore, cache, curve_types,
+                                                   depth_range, instrument, units, dtype, compact, engine,
+                                                   fuzzy)
+    }
+    if len(ascii_dict) == 1 or await asyncio.to_thread(_is_single_source, input_path, tuple(ASCII_EXTENSIONS)):
+        return next(iter(ascii_dict.values()), None)
+    if not ascii_dict and verbose:
+        print(f"No ASCII/CSV files found in {input_path}")
     return ascii_dict
 
 
-def _read_single_ascii(ascii_file_path, verbose, std_names, depth_col, delimiter):
-    """Read single ASCII/CSV file to DataFrame and standardize ALL curves."""
-    try:
-        # Try reading the file
-        df = pd.read_csv(ascii_file_path, delimiter=delimiter)
-        
-        if df.empty:
-            if verbose:
-                print(f"✗ Empty DataFrame: {ascii_file_path.name}")
-            return None
-        
-        # Handle depth column (case-insensitive)
-        depth_cols = [col for col in df.columns if col.upper() == depth_col.upper()]
-        if depth_cols:
-            df.set_index(depth_cols[0], inplace=True)
+async def aiter_ascii(input_path, verbose=True, preferred_names=None, depth_col="DEPTH", delimiter=None,
+                      executor=None, max_concurrency=None, semaphore=None, cache=None, curve_types=None,
+                      depth_range=None, instrument=None, units=None, dtype=None, compact=False, engine="c",
+                      fuzzy=False):
+    """
+    Async iterator over an ASCII file or directory → yields (filename, df) in file order.
+    
+    See ``aparseASCII`` for the arguments.
+    
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    read_opts = {
+        "depth_col": depth_col,
+        "delimiter": delimiter,
+        "cache": _as_cache(cache),
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "engine": _check_ascii_engine(engine),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    ascii_files = await asyncio.to_thread(_find_ascii_files, Path(input_path))
+    async for ascii_file, (df, metrics) in aread_files(functools.partial(_measure, _load_single_ascii),
+                                                       ascii_files, dict(std_names=std_names, **read_opts),
+                                                       executor, max_concurrency, semaphore):
+        _report(metrics, verbose, instrument)
+        if df is not None:
+            yield ascii_file.name, df
+
+
+def _find_ascii_files(input_path):
+    """ASCII file itself, or all ASCII files under a directory (recursive, case-insensitive; also inside containers)."""
+    return _find_sources(input_path, tuple(ASCII_EXTENSIONS))
+
+
+def _read_single_ascii(ascii_file_path, verbose, std_names, instrument=None, **read_opts):
+    """Read single ASCII/CSV file to DataFrame and standardize ALL curves; failures are reported, not raised."""
+    df, metrics = _measure(_load_single_ascii, ascii_file_path, std_names=std_names, **read_opts)
+    _report(metrics, verbose, instrument)
+    return df
+
+
+def _load_single_ascii(ascii_file_path, std_names, depth_col="DEPTH", delimiter=None, cache=None,
+                       curve_types=None, depth_range=None, units=None, dtype=None, engine="c", fuzzy=False):
+    """Load and standardize a single ASCII/CSV file; raises on errors, None if empty."""
+    if cache is not None:
+        params = {"reader": "ascii", "std_names": std_names, "depth_col": depth_col, "delimiter": delimiter,
+                  "curve_types": curve_types, "depth_range": depth_range, "units": units,
+                  "dtype": dtype, "engine": engine, "fuzzy": fuzzy}
+        return cache.fetch(ascii_file_path, params,
+                           lambda: _load_single_ascii(ascii_file_path, std_names, depth_col, delimiter,
+                                                      curve_types=curve_types, depth_range=depth_range,
+                                                      units=units, dtype=dtype, engine=engine, fuzzy=fuzzy))
+    
+    with _phase("header"):
+        # Sniff delimiter, header row, unit row and null sentinel from the first bytes
+        layout = _sniff_ascii(ascii_file_path, depth_col, delimiter)
+    if layout is None:
+        _skip("Empty DataFrame")
+        return None
+    columns = layout.columns
+    depth = _depth_column(columns, depth_col)
+    source_units = layout.units
+    
+    usecols = None
+    if curve_types is not None:
+        # Let the CSV reader skip the unwanted columns
+        usecols = [depth] + [col for col in mnm.columns_for_curve_types(columns, curve_types, fuzzy) if col != depth]
+    
+    column_dtypes = None
+    if dtype is not None:
+        # Parse the curves straight into ``dtype``; the depth column stays float64
+        column_dtypes = {col: np.float64 if col == depth else dtype for col in usecols or columns}
+    
+    # The Arrow reader takes single-character delimiters only
+    if engine == "pyarrow" and len(layout.delimiter) > 1:
+        engine = "c"
+    # "#" comment lines among the data rows are skipped (the Arrow reader has no comment option)
+    comment = None if engine == "pyarrow" else "#"
+    read = functools.partial(pd.read_csv, sep=layout.delimiter, header=None, names=columns,
+                             skiprows=layout.data_row, usecols=usecols, na_values=layout.null_values or None,
+                             decimal=layout.decimal, comment=comment, engine=engine)
+    # Chunked reads stop past the depth window; the Arrow reader reads the file at once
+    chunked = depth_range is not None and engine != "pyarrow"
+    with _phase("data"):
+        if layout.delimiter == FIXED_WIDTH:
+            df = _read_fixed_width(ascii_file_path, layout, depth, usecols, depth_range, dtype)
         else:
-            # Use first column as depth
-            df.set_index(df.columns[0], inplace=True)
+            try:
+                df = _read_ascii_data(read, ascii_file_path, depth, depth_range if chunked else None,
+                                      column_dtypes)
+            except ValueError:
+                if column_dtypes is None:
+                    raise
+                # Text columns: read with inferred dtypes, then downcast the float curves
+                df = _compact_frame(_read_ascii_data(read, ascii_file_path, depth,
+                                                     depth_range if chunked else None), dtype)
+    
+    if df.empty:
+        _skip("Empty DataFrame")
+        return None
+    
+    with _phase("build"):
+        df.set_index(depth, inplace=True)
+        
+        if source_units:
+            source_units["DEPTH"] = source_units.pop(df.index.name, "")
+            df.attrs["units"] = {col: unit for col, unit in source_units.items() if unit}
         
         # Ensure index is float
         df.index = df.index.astype(float)
         df.index.name = "DEPTH"
         
-        # Create fake las_data object for standardization
-        class FakeLASData:
-            pass
-        
-        fake_las = FakeLASData()
-        
-        # Standardize ALL curves (GR, RHOB, NPHI, etc.)
-        _standardize_all_curves(fake_las, df, std_names)
-        
-        if verbose:
-            print(f"✓ {ascii_file_path.name}")
-        return df
-        
-    except Exception as e:
-        if verbose:
-            print(f"✗ Error in {ascii_file_path.name}: {type(e).__name__}: {e}")
-    return None
+        if depth_range is not None:
+            df = _slice_depth(df, depth_range)
+    
+    if df.empty:
+        _skip("Empty DataFrame")
+        return None
+    
+    # Create fake las_data object for standardization
+    class FakeLASData:
+        pass
+    
+    fake_las = FakeLASData()
+    
+    # Standardize ALL curves (GR, RHOB, NPHI, etc.)
+    with _phase("standardize"):
+        df = _standardize_all_curves(fake_las, df, std_names, units, fuzzy)
+    return df
+
+
+def _check_ascii_engine(engine):
+    """Validate the CSV reader engine name (pyarrow must be installed for "pyarrow")."""
+    if engine not in ASCII_ENGINES:
+        raise ValueError(f"engine must be one of {ASCII_ENGINES}, got {engine!r}")
+    if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("engine='pyarrow' requires pyarrow (pip install lasmnemonicsid[parquet]); "
+                          "use engine='c' without it")
+    return engine
+
+
+def _read_ascii_data(read, ascii_file_path, depth_col, depth_range, dtypes=None):
+    """Read the data rows with ``read`` (a bound ``pd.read_csv``), stopping past ``depth_range``."""
+    with _source_handle(ascii_file_path) as source:
+        if depth_range is None:
+            return read(source, dtype=dtypes)
+        with read(source, dtype=dtypes, chunksize=DEPTH_CHUNK_ROWS) as chunks:
+            return _read_depth_window(chunks, depth_col, depth_range)
+
+
+def _depth_column(columns, depth_col):
+    """Depth column: ``depth_col`` (case-insensitive), else the first column."""
+    return next((col for col in columns if col.upper() == depth_col.upper()), columns[0])
+
+
+def _sniff_ascii(ascii_file_path, depth_col="DEPTH", delimiter=None):
+    """
+    Layout of an ASCII log from its first ``SNIFF_BYTES`` → AsciiLayout, or None if it has no rows.
+    
+    Blank lines and "#" comments are skipped. The header is the first line whose
+    field count matches the data rows (and of the line after it), so preamble lines
+    such as "WELL: 15/9-F-11" are skipped; a line under it whose depth field is not
+    numeric is a unit row. Raises ValueError when no line qualifies as the header.
+    Fixed-width files are sniffed by ``_sniff_fixed_width``.
+    """
+    with _open_source(ascii_file_path) as f:
+        sample = f.read(SNIFF_BYTES)
+        complete = not f.read(1)
+    # utf-8-sig drops the byte-order mark of BOM-prefixed exports from the first column name
+    lines = sample.decode("utf-8-sig", errors="replace").split("\n")
+    if not complete:
+        # Last line may be cut off
+        lines = lines[:-1]
+    content = [(number, line.rstrip("\r")) for number, line in enumerate(lines)
+               if line.strip() and not line.lstrip().startswith("#")]
+    if not content:
+        return None
+    
+    if delimiter is None:
+        # The last line that is not a data row is the header (or the unit row under it)
+        header_line = next((line for _, line in reversed(content) if not _DATA_LINE.match(line)), None)
+        delimiter = _sniff_delimiter([line for _, line in content[-50:]], header_line)
+    if delimiter == FIXED_WIDTH:
+        return _sniff_fixed_width(content, depth_col)
+    split = _field_splitter(delimiter)
+    rows = [split(line) for _, line in content]
+    width = Counter(len(row) for row in rows[-50:]).most_common(1)[0][0]
+    header = next((i for i in range(len(rows))
+                   if len(rows[i]) == width and (i + 1 == len(rows) or len(rows[i + 1]) == width)), None)
+    if header is None:
+        raise ValueError(f"No header row with the {width} columns of the data rows")
+    columns = _header_names(rows[header])
+    decimal = "," if delimiter != "," and any(_DECIMAL_COMMA.match(field)
+                                              for row in rows[header + 1:] for field in row) else "."
+    
+    units = None
+    data = header + 1
+    if data < len(rows):
+        depth = columns.index(_depth_column(columns, depth_col))
+        if depth < len(rows[data]) and not _is_number(rows[data][depth], decimal):
+            units = {col: unit.strip().strip("()[]") for col, unit in zip(columns, rows[data])}
+            data += 1
+    data_row = content[data][0] if data < len(content) else content[header][0] + 1
+    
+    # Null sentinels, with the spelling used in the file
+    null_values = sorted({field.strip() for row in rows[data:] for field in row
+                          if _is_number(field, decimal) and float(field.replace(decimal, ".")) in NULL_SENTINELS})
+    return AsciiLayout(delimiter, columns, units, data_row, null_values, decimal=decimal)
+
+
+def _sniff_delimiter(lines, header_line=None):
+    """
+    Delimiter that splits the trailing sampled lines into the same number (> 1) of fields.
+    
+    Fields are counted the way the CSV reader splits them, so quoted delimiters
+    ("A, upper") do not count, and ``header_line`` must split into as many fields
+    as the data (so decimal commas in "1000,5;50,1" do not make "," win). Falls back
+    to whitespace, then to fixed-width columns when the data lines share blank gaps
+    but not their field count and contain none of the delimiters, and finally to ",".
+    """
+    for delimiter in [*SNIFF_DELIMITERS, r"\s+"]:
+        split = _field_splitter(delimiter)
+        width = _trailing_count([len(split(line)) for line in lines])
+        if width > 1 and (header_line is None or len(split(header_line)) == width):
+            return delimiter
+    # Aligned columns with blank cells: the field count varies, the blank gaps do not
+    data = [line for line in lines if _DATA_LINE.match(line)]
+    if not any(delimiter in line for line in data for delimiter in SNIFF_DELIMITERS) and len(_column_spans(data)) > 1:
+        return FIXED_WIDTH
+    return ","
+
+
+def _trailing_count(counts):
+    """Count shared by the last lines of the sample (at least half of them, preamble aside), else 0."""
+    last = counts[-1]
+    run = next((i for i, count in enumerate(reversed(counts)) if count != last), len(counts))
+    return last if run == len(counts) or run >= max(2, len(counts) / 2) else 0
+
+
+def _sniff_fixed_width(content, depth_col):
+    """
+    Fixed-width layout from the sampled (line number, line) pairs → AsciiLayout, or None without data.
+    
+    Data lines are the trailing block of lines that start with a number. Column
+    boundaries lie halfway across the gaps that are blank in every sampled data
+    line. The header is the line above the data, or the one above that when it
+    names more known mnemonics, in which case the line in between is the unit row.
+    """
+    first = len(content)
+    while first > 0 and _DATA_LINE.match(content[first - 1][1]):
+        first -= 1
+    if first == len(content):
+        return None
+    data = [line for _, line in content[first:]]
+    spans = _column_spans(data)
+    bounds = [0] + [(stop + start) // 2 for (_, stop), (start, _) in zip(spans, spans[1:])] + [None]
+    colspecs = list(zip(bounds[:-1], bounds[1:]))
+    
+    def labels(line):
+        # Names separated by blanks are taken as they are, otherwise cut at the column boundaries
+        fields = line.split()
+        return fields if len(fields) == len(colspecs) else [line[start:stop].strip() for start, stop in colspecs]
+    
+    def known(fields):
+        return sum(bool(field) and (field.upper() == depth_col.upper() or mnm.match_mnemonic(field) is not None)
+                   for field in fields)
+    
+    above = [labels(line) for _, line in content[max(0, first - 2):first]]
+    unit_row = None
+    if len(above) == 2 and known(above[0]) > known(above[1]):
+        header, unit_row = above
+    else:
+        header = above[-1] if above else [""] * len(colspecs)
+    columns = _header_names(header)
+    units = None if unit_row is None else {col: unit.strip("()[]") for col, unit in zip(columns, unit_row)}
+    
+    null_values = sorted({field for line in data for field in line.split()
+                          if _is_number(field) and float(field) in NULL_SENTINELS})
+    return AsciiLayout(FIXED_WIDTH, columns, units, content[first][0], null_values, colspecs)
+
+
+def _column_spans(lines):
+    """(start, stop) of the character runs that are not blank in every line → list, left to right."""
+    if not lines:
+        return []
+    width = max(len(line) for line in lines)
+    chars = np.full((len(lines), width), ord(" "), dtype=np.uint8)
+    for i, line in enumerate(lines):
+        encoded = line.encode("latin-1", errors="replace")
+        chars[i, :len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+    filled = np.r_[0, (chars != ord(" ")).any(axis=0).astype(np.int8), 0]
+    edges = np.diff(filled)
+    return list(zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()))
+
+
+def _read_fixed_width(ascii_file_path, layout, depth, usecols=None, depth_range=None, dtype=None):
+    """
+    Cut the fixed-width columns of ``layout`` out of the memory-mapped file → DataFrame.
+    
+    Line boundaries come from one vectorized scan for newlines. Each column is then
+    taken from all lines at once as a (lines, width) byte block and parsed by NumPy;
+    when every line has the same length the file is viewed as a 2-D byte array and
+    nothing is gathered. With ``depth_range`` only the rows inside the window are
+    parsed for the curves. Lines without a depth value are skipped.
+    """
+    columns = usecols or layout.columns
+    if not _is_plain_file(ascii_file_path):
+        # Compressed and archived files are decompressed into memory
+        with _open_source(ascii_file_path) as f:
+            buf = np.frombuffer(f.read(), dtype=np.uint8)
+    elif os.path.getsize(ascii_file_path):
+        buf = np.memmap(ascii_file_path, dtype=np.uint8, mode="r")
+    else:
+        buf = np.empty(0, dtype=np.uint8)
+    if not len(buf):
+        return pd.DataFrame(columns=columns)
+    lines = _FixedWidthLines(buf, layout.data_row)
+    specs = dict(zip(layout.columns, layout.colspecs))
+    nulls = np.array([float(value) for value in layout.null_values], dtype=np.float64)
+    
+    # A depth column that is not numeric throughout comes back as text; such lines have no depth
+    depth_values = pd.to_numeric(lines.column(*specs[depth], np.float64, nulls), errors="coerce")
+    depth_values = np.asarray(depth_values, dtype=np.float64)
+    if len(nulls):
+        depth_values[np.isin(depth_values, nulls)] = np.nan
+    rows = np.flatnonzero(~np.isnan(depth_values)) if np.isnan(depth_values).any() else slice(None)
+    if depth_range is not None:
+        window = _depth_rows(depth_values[rows], depth_range)
+        rows = np.arange(len(depth_values))[rows][window]
+    lines = lines.take(rows)
+    data = {col: depth_values[rows] if col == depth else lines.column(*specs[col], dtype or np.float64, nulls)
+            for col in columns}
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+class _FixedWidthLines:
+    """Data lines of a memory-mapped fixed-width file, as (start, end) byte offsets."""
+    
+    def __init__(self, buf, skip_lines=0, starts=None, ends=None):
+        self.buf = buf
+        if starts is None:
+            starts, ends = self._bounds(buf, skip_lines)
+        self.starts, self.ends = starts, ends
+        # Equal-length lines at a constant stride: a strided 2-D view of the whole block
+        self.grid = None
+        n = len(starts)
+        if n and np.all(ends - starts == ends[0] - starts[0]):
+            stride = starts[1] - starts[0] if n > 1 else ends[0] - starts[0] + 1
+            if n == 1 or np.all(np.diff(starts) == stride):
+                self.grid = np.lib.stride_tricks.as_strided(buf[starts[0]:], shape=(n, ends[0] - starts[0]),
+                                                            strides=(stride, 1), writeable=False)
+    
+    @staticmethod
+    def _bounds(buf, skip_lines):
+        block = 1 << 26
+        newlines = np.concatenate([np.flatnonzero(buf[i:i + block] == ord("\n")) + i
+                                   for i in range(0, len(buf), block)] or [np.empty(0, dtype=np.intp)])
+        ends = newlines if buf[-1] == ord("\n") else np.r_[newlines, len(buf)]
+        starts = np.r_[0, newlines + 1][:len(ends)]
+        starts, ends = starts[skip_lines:], ends[skip_lines:]
+        # CRLF line endings, then blank and comment lines
+        ends = ends - ((ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord("\r")))
+        keep = (ends > starts) & (buf[np.minimum(starts, len(buf) - 1)] != ord("#"))
+        return starts[keep], ends[keep]
+    
+    def take(self, rows):
+        """Subset of the lines (slice or positions)."""
+        if isinstance(rows, slice) and rows == slice(None):
+            return self
+        return _FixedWidthLines(self.buf, starts=self.starts[rows], ends=self.ends[rows])
+    
+    def column(self, start, stop, dtype, nulls):
+        """Characters [start, stop) of every line parsed as numbers → array (text columns as str)."""
+        if stop is None:
+            stop = int((self.ends - self.starts).max(initial=start))
+        out = np.full(len(self.starts), np.nan, dtype=dtype)
+        if stop <= start:
+            return out
+        try:
+            for lo, field in self._fields(start, stop):
+                blank = (field == ord(" ")).all(axis=1)
+                values = np.full(len(field), np.nan)
+                values[~blank] = field[~blank].view(f"S{stop - start}").ravel().astype(np.float64)
+                if len(nulls):
+                    values[np.isin(values, nulls)] = np.nan
+                out[lo:lo + len(field)] = values
+        except ValueError:
+            # Not numeric: keep the column as text
+            texts = [field.view(f"S{stop - start}").ravel() for _, field in self._fields(start, stop)]
+            return np.char.strip(np.char.decode(np.concatenate(texts), "latin-1")).astype(object)
+        return out
+    
+    def _fields(self, start, stop):
+        """(first line, (lines, stop - start) uint8 block) for every block of FIXED_WIDTH_BLOCK_LINES lines."""
+        for lo in range(0, len(self.starts), FIXED_WIDTH_BLOCK_LINES):
+            hi = min(lo + FIXED_WIDTH_BLOCK_LINES, len(self.starts))
+            if self.grid is not None:
+                yield lo, np.ascontiguousarray(self.grid[lo:hi, start:stop])
+                continue
+            # Ragged lines: gather the bytes, blank past the end of each line
+            index = self.starts[lo:hi, None] + np.arange(start, stop)
+            inside = index < self.ends[lo:hi, None]
+            yield lo, np.where(inside, self.buf[np.minimum(index, len(self.buf) - 1)], ord(" ")).astype(np.uint8)
+
+
+def _field_splitter(delimiter):
+    """Line → list of fields for a sniffed or given delimiter."""
+    if delimiter == r"\s+":
+        return str.split
+    if len(delimiter) == 1:
+        return lambda line: next(csv.reader([line], delimiter=delimiter))
+    return lambda line: line.split(delimiter)
+
+
+def _header_names(fields):
+    """Header fields → column names the way pandas names them (Unnamed: i, duplicates as NAME.1)."""
+    names, seen = [], {}
+    for i, field in enumerate(fields):
+        name = field.strip() or f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _is_number(field, decimal="."):
+    try:
+        float(field.replace(decimal, ".") if decimal != "." else field)
+        return True
+    except ValueError:
+        return False
 
 
 def _get_well_name(ascii_file_path):
     """Extract well name from ASCII file (use filename)"""
-    return ascii_file_path.stem
+    return _source_stem(ascii_file_path)
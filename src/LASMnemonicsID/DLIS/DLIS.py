@@ -13,100 +13,408 @@ from LASMnemonicsID.utils.mnemonics import (
     dts_names,
     pe_names,
 )
+import asyncio
+import functools
 import os
+from collections import OrderedDict
+from contextlib import ExitStack
+import numpy as np
+import numpy.lib.recfunctions as rfn
 import pandas as pd
 import dlisio
 from pathlib import Path
 
 # Import helper functions from LAS module
-from ..LAS.LAS import create_mnemonic_dict, _standardize_all_curves
+from ..LAS.LAS import (
+    create_mnemonic_dict, _standardize_all_curves, _batch_return, _build_std_names, _resolve_curve_types,
+    _check_depth_range, _depth_rows, _PANDAS_MERGES_BLOCKS, _frame_from_columns
+)
+from ..utils.parallel import prefetch as _prefetch
+from ..utils.cache import _as_cache
+from ..utils.aio import aread_files
+from ..utils.manifest import _as_manifest
+from ..utils.units import resolve_units as _resolve_units
+from ..utils.memory import compact_frame as _compact_frame, resolve_dtype as _resolve_dtype
+from ..utils.batch import read_batch as _read_batch, rerun_with as _rerun_with
+from ..utils.compression import (
+    find_sources as _find_sources,
+    is_single_source as _is_single_source,
+    local_copy as _local_copy,
+    source_stem as _source_stem,
+)
+from ..utils.instrument import (
+    measure as _measure,
+    report as _report,
+    phase as _phase,
+    skip as _skip,
+    _as_instrumentation,
+)
+
 
+# dlisio releases (major.minor) whose internal frame data reader ``_read_fdata`` was written
+# against; with any other release channel-selective reads decode whole frames with ``frame.curves()``
+FDATA_DLISIO_VERSIONS = ("1.0",)
+_FDATA_FAST_PATH = ".".join(getattr(dlisio, "__version__", "").split(".")[:2]) in FDATA_DLISIO_VERSIONS
 
-def parseDLIS(input_path, verbose=True, preferred_names=None):
+
+def parseDLIS(input_path, verbose=True, preferred_names=None, workers=None, executor=None, errors=None,
+              cache=None, zero_copy=False, curve_types=None, depth_range=None, instrument=None,
+              as_result=False, fail_fast=False, manifest=None, units=None,
+              dtype=None, compact=False, fuzzy=False):
     """
     Parse DLIS file or all in directory → DataFrame or {filename: df}.
     
     Args:
-        input_path (str/Path): DLIS file or directory
+        input_path (str/Path or list): DLIS file, directory or list of DLIS files. Compressed files
+            and zip/tar containers are read in place (see ``parseLAS``); dlisio needs a real
+            file, so each archived DLIS is decompressed into memory while it is read.
         verbose (bool): Print info
         preferred_names (dict, optional): Mapping of curve types to preferred column names.
             Example: {"deepres": "RT", "gamma": "GR"}
             If not provided, defaults to standard petrophysical names.
+        workers (int, optional): Directory mode only. Read files in a process pool of this size.
+        executor (concurrent.futures.Executor, optional): Directory mode only. Executor to fan
+            the per-file reads out to (takes precedence over ``workers``).
+        errors (list, optional): Per-file failures are appended here as
+            (path, exception class name, message).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        zero_copy (bool): Build the DataFrame from views of the decoded frame instead of copying
+            every channel. Array channels become 2-D blocks with columns NAME[0], NAME[1], ...
+        curve_types (list, optional): Only decode channels of these curve types ("gamma") or
+            standard names ("GR"), plus the depth index.
+        depth_range (tuple, optional): (top, base) window of the frame index, in the units
+            stored in the file. The index channel is decoded first and only the frame data
+            records inside the window are decoded for the other channels.
+        instrument (Instrumentation or callable, optional): Receives the FileMetrics (phase
+            timings, bytes, shape, error) of every file; see ``utils.instrument``.
+        as_result (bool): Return a ``BatchResult`` with successes, failures and skipped
+            files (see ``parseLAS``).
+        fail_fast (bool): Raise ``BatchReadError`` at the first file that fails.
+        manifest (Manifest or str/Path, optional): Only read files added or changed since the
+            last run (see ``parseLAS``).
+        units (str or dict, optional): Convert to canonical units using the channel units
+            (see ``parseLAS``).
+        dtype (str or numpy dtype, optional): Float dtype of the curves, e.g. "float32" (see
+            ``parseLAS``). Only float channels are converted: integer and flag channels keep
+            their narrow DLIS dtypes and the depth index stays float64.
+        compact (bool): Shorthand for ``dtype="float32"``.
+        fuzzy (bool): Pattern-based mnemonic matching of vendor channel names (see ``parseLAS``).
+        
+    Returns:
+        DataFrame (single) or dict {filename: df} (multiple/dir), or BatchResult
+    """
+    if not isinstance(input_path, list):
+        input_path = Path(input_path)
+    
+    std_names = _build_std_names(preferred_names)
+    
+    read_opts = {
+        "cache": _as_cache(cache),
+        "zero_copy": zero_copy,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    
+    instrument = _as_instrumentation(instrument)
+    manifest = _as_manifest(manifest)
+    
+    # Case 1: Single File (case-insensitive); Case 2: list of files or directory (recursive)
+    single = not isinstance(input_path, list) and _is_single_source(input_path, (".dlis",))
+    dlis_files = [Path(path) for path in input_path] if isinstance(input_path, list) else _find_dlis_files(input_path)
+    if not dlis_files and verbose:
+        print(f"No DLIS files found in {input_path}")
+    # Deletions are only detected for a scanned directory
+    root = None if single or isinstance(input_path, list) else input_path
+    
+    rerun = _rerun_with(parseDLIS, verbose=verbose, preferred_names=preferred_names, workers=workers,
+                       executor=executor, cache=cache, zero_copy=zero_copy, curve_types=curve_types,
+                       depth_range=depth_range, instrument=instrument, fail_fast=fail_fast, manifest=manifest,
+                       units=units, dtype=dtype, compact=compact, fuzzy=fuzzy)
+    result = _read_batch(_load_single_dlis, dlis_files, dict(std_names=std_names, **read_opts), verbose,
+                        None if single else workers, None if single else executor, instrument,
+                        fail_fast, rerun, manifest, "dlis", root)
+    return _batch_return(result, single, errors, as_result)
+
+
+def iter_dlis(input_path, verbose=True, preferred_names=None, prefetch=0, cache=None, zero_copy=False,
+              curve_types=None, depth_range=None, instrument=None, units=None, dtype=None, compact=False,
+              fuzzy=False):
+    """
+    Lazily parse a DLIS file or all in directory → yields (filename, df) one well at a time.
+    
+    Args:
+        input_path (str/Path): DLIS file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        prefetch (int): Number of wells to read ahead on a background thread (0 = no read-ahead).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        zero_copy (bool): Build DataFrames from views of the decoded frame (see ``parseDLIS``).
+        curve_types (list, optional): Only decode channels of these types (see ``parseDLIS``).
+        depth_range (tuple, optional): (top, base) window of the frame index (see ``parseDLIS``).
+        instrument (Instrumentation or callable, optional): Per-file metrics sink (see ``parseDLIS``).
+        units (str or dict, optional): Convert to canonical units (see ``parseLAS``).
+        dtype, compact: Float dtype of the curves (see ``parseLAS``).
+        fuzzy (bool): Pattern-based mnemonic matching (see ``parseLAS``).
+        
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    read_opts = {
+        "cache": _as_cache(cache),
+        "zero_copy": zero_copy,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    dlis_files = _find_dlis_files(Path(input_path))
+    
+    def _wells():
+        for dlis_file in dlis_files:
+            df = _read_single_dlis(dlis_file, verbose, std_names, instrument, **read_opts)
+            if df is not None:
+                yield dlis_file.name, df
+    
+    yield from _prefetch(_wells(), prefetch)
+
+
+async def aparseDLIS(input_path, verbose=True, preferred_names=None, executor=None, max_concurrency=None,
+                     semaphore=None, cache=None, zero_copy=False, curve_types=None, depth_range=None,
+                     instrument=None, units=None, dtype=None, compact=False, fuzzy=False):
+    """
+    Async ``parseDLIS`` for asyncio services → DataFrame or {filename: df}.
+    
+    File discovery and decoding run on ``executor``, so the event loop is never blocked.
+    
+    Args:
+        input_path (str/Path): DLIS file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        executor (concurrent.futures.Executor, optional): Executor for the blocking reads
+            (default: the loop's thread pool).
+        max_concurrency (int, optional): Files decoded at the same time (default: number of CPUs).
+        semaphore (asyncio.Semaphore, optional): Concurrency limit shared with other calls.
+        cache, zero_copy, curve_types, depth_range, instrument, units, dtype, compact, fuzzy: See
+            ``parseDLIS``.
         
     Returns:
         DataFrame (single) or dict {filename: df} (multiple/dir)
     """
     input_path = Path(input_path)
-    
-    # Define default standard names
-    std_names = {
-        "gamma": "GR",
-        "sp": "SP",
-        "caliper": "CALI",
-        "deepres": "RT",
-        "rxo": "RXO",
-        "density": "RHOB",
-        "density_correction": "DRHO",
-        "neutron": "NPHI",
-        "dtc": "DT",
-        "dts": "DTS",
-        "pe": "PEF"
+    dlis_dict = {
+        name: df async for name, df in aiter_dlis(input_path, verbose, preferred_names, executor,
+                                                  max_concurrency, semaphore, cache, zero_copy, curve_types,
+                                                  depth_range, instrument, units, dtype, compact, fuzzy)
     }
+    if len(dlis_dict) == 1 or await asyncio.to_thread(_is_single_source, input_path, (".dlis",)):
+        return next(iter(dlis_dict.values()), None)
+    if not dlis_dict and verbose:
+        print(f"No DLIS files found in {input_path}")
+    return dlis_dict
+
+
+async def aiter_dlis(input_path, verbose=True, preferred_names=None, executor=None, max_concurrency=None,
+                     semaphore=None, cache=None, zero_copy=False, curve_types=None, depth_range=None,
+                     instrument=None, units=None, dtype=None, compact=False, fuzzy=False):
+    """
+    Async iterator over a DLIS file or directory → yields (filename, df) in file order.
     
-    # Update with user preferences if provided
-    if preferred_names:
-        std_names.update(preferred_names)
-    
-    # Case 1: Single File (case-insensitive)
-    if input_path.is_file() and input_path.suffix.lower() == '.dlis':
-        df = _read_single_dlis(input_path, verbose, std_names)
-        return df if df is not None else None
-    
-    # Case 2: Directory (Recursive) - CASE-INSENSITIVE
-    dlis_files = [f for f in input_path.rglob("*") if f.suffix.lower() == '.dlis']
-    if not dlis_files:
-        if verbose:
-            print(f"No DLIS files found in {input_path}")
-        return {}
-    
-    dlis_dict = {}
-    for dlis_file in dlis_files:
-        df = _read_single_dlis(dlis_file, verbose, std_names)
+    See ``aparseDLIS`` for the arguments.
+    
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    read_opts = {
+        "cache": _as_cache(cache),
+        "zero_copy": zero_copy,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    dlis_files = await asyncio.to_thread(_find_dlis_files, Path(input_path))
+    async for dlis_file, (df, metrics) in aread_files(functools.partial(_measure, _load_single_dlis), dlis_files,
+                                                      dict(std_names=std_names, **read_opts),
+                                                      executor, max_concurrency, semaphore):
+        _report(metrics, verbose, instrument)
         if df is not None:
-            filename = dlis_file.name
-            dlis_dict[filename] = df
+            yield dlis_file.name, df
+
+
+def _find_dlis_files(input_path):
+    """DLIS file itself, or all DLIS files under a directory (recursive, case-insensitive), also inside containers."""
+    return _find_sources(input_path, (".dlis",))
+
+
+def openDLIS(dlis_file_path, preferred_names=None, max_cached=4, zero_copy=False):
+    """
+    Open a DLIS file lazily → DLISFrames keyed by (logical file index, frame name).
     
-    # Return single DF if only 1 file found, else dict
-    if len(dlis_dict) == 1:
-        return next(iter(dlis_dict.values()))
+    Unlike ``parseDLIS``, which only reads the first frame of the first logical
+    file, this exposes every frame of every logical file. A frame's curves are
+    only decoded (and standardized) when it is accessed.
     
-    return dlis_dict
+    Args:
+        dlis_file_path (str/Path): DLIS file
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        max_cached (int): Number of decoded frames kept in memory (least recently used are dropped).
+        zero_copy (bool): Build DataFrames from views of the decoded frames (see ``parseDLIS``).
+        
+    Returns:
+        DLISFrames (use as a context manager or call ``close()``)
+    
+    Example:
+        with openDLIS("run.dlis") as frames:
+            for key in frames:
+                print(key, frames[key].shape)
+    """
+    return DLISFrames(dlis_file_path, _build_std_names(preferred_names), max_cached, zero_copy)
 
 
-def _read_single_dlis(dlis_file_path, verbose, std_names):
-    """Read single DLIS file to DataFrame and standardize ALL curves."""
-    try:
-        with dlisio.dlis.load(str(dlis_file_path)) as (f, *rest):
-            if not f.frames:
-                if verbose:
-                    print(f"✗ No frames: {dlis_file_path.name}")
+class DLISFrames:
+    """
+    Lazy, read-only mapping of (logical file index, frame name) → standardized DataFrame.
+    
+    The DLIS file stays open until ``close()``; decoded frames are cached with an LRU limit.
+    """
+    
+    def __init__(self, dlis_file_path, std_names, max_cached=4, zero_copy=False):
+        self.path = Path(dlis_file_path)
+        self.std_names = std_names
+        self.max_cached = max_cached
+        self.zero_copy = zero_copy
+        # Compressed and archived files are decompressed into memory for as long as they are open;
+        # the copy is only kept once the load succeeded
+        with ExitStack() as stack:
+            self._files = dlisio.dlis.load(str(stack.enter_context(_local_copy(self.path))))
+            self._local = stack.pop_all()
+        self._frames = OrderedDict()
+        for lf_index, logical_file in enumerate(self._files):
+            for frame in logical_file.frames:
+                self._frames[(lf_index, frame.name)] = frame
+        self._decoded = OrderedDict()
+    
+    def __getitem__(self, key):
+        if key in self._decoded:
+            self._decoded.move_to_end(key)
+            return self._decoded[key]
+        frame = self._frames[key]
+        df = _frame_to_dataframe(frame, self.std_names, self.zero_copy)
+        self._decoded[key] = df
+        while len(self._decoded) > self.max_cached:
+            self._decoded.popitem(last=False)
+        return df
+    
+    def __iter__(self):
+        return iter(self._frames)
+    
+    def __len__(self):
+        return len(self._frames)
+    
+    def __contains__(self, key):
+        return key in self._frames
+    
+    def keys(self):
+        return self._frames.keys()
+    
+    def items(self):
+        for key in self._frames:
+            yield key, self[key]
+    
+    def channels(self, key):
+        """Channel names of a frame, without decoding its curves."""
+        return [ch.name for ch in self._frames[key].channels]
+    
+    def close(self):
+        self._decoded.clear()
+        self._frames.clear()
+        self._files.close()
+        self._local.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __repr__(self):
+        return f"DLISFrames({self.path.name!r}, frames={list(self._frames)})"
+
+
+def _read_single_dlis(dlis_file_path, verbose, std_names, instrument=None, **read_opts):
+    """Read single DLIS file to DataFrame and standardize ALL curves; failures are reported, not raised."""
+    df, metrics = _measure(_load_single_dlis, dlis_file_path, std_names=std_names, **read_opts)
+    _report(metrics, verbose, instrument)
+    return df
+
+
+def _load_single_dlis(dlis_file_path, std_names, cache=None, zero_copy=False, curve_types=None,
+                      depth_range=None, units=None, dtype=None, fuzzy=False):
+    """Load and standardize a single DLIS file; raises on errors, None if no data."""
+    if cache is not None:
+        params = {"reader": "dlis", "std_names": std_names, "zero_copy": zero_copy, "curve_types": curve_types,
+                  "depth_range": depth_range, "units": units, "dtype": dtype, "fuzzy": fuzzy}
+        return cache.fetch(dlis_file_path, params,
+                           lambda: _load_single_dlis(dlis_file_path, std_names, zero_copy=zero_copy,
+                                                     curve_types=curve_types, depth_range=depth_range,
+                                                     units=units, dtype=dtype, fuzzy=fuzzy))
+    
+    with ExitStack() as stack:
+        with _phase("open"):
+            # dlisio maps a real file; compressed and archived sources are decompressed into memory
+            files = dlisio.dlis.load(str(stack.enter_context(_local_copy(dlis_file_path))))
+        with files as (f, *rest):
+            with _phase("header"):
+                frames = f.frames
+            if not frames:
+                _skip("No frames")
                 return None
             
             # Use first frame (typically contains main log data)
-            frame = f.frames[0]
-            curves_data = frame.curves()
+            df = _frame_to_dataframe(frames[0], std_names, zero_copy, curve_types, depth_range, units,
+                                     dtype, fuzzy)
             
+            if df is None:
+                _skip("Empty DataFrame")
+                return None
+            return df
+
+
+def _frame_to_dataframe(frame, std_names, zero_copy=False, curve_types=None, depth_range=None, units=None,
+                        dtype=None, fuzzy=False):
+    """Decode one DLIS frame to a standardized DataFrame (None if empty)."""
+    if curve_types is not None or depth_range is not None:
+        # Selected channels/rows are decoded into a new compact array, so views cost nothing extra
+        df = _frame_views(frame, curve_types, depth_range, fuzzy)
+    elif zero_copy:
+        df = _frame_views(frame)
+    else:
+        with _phase("data"):
+            curves_data = frame.curves()
+        
+        with _phase("build"):
             # Get channel names
             channels = [ch.name for ch in frame.channels]
             
             # Create DataFrame
             df = pd.DataFrame(curves_data, columns=channels)
-            
-            if df.empty:
-                if verbose:
-                    print(f"✗ Empty DataFrame: {dlis_file_path.name}")
-                return None
-            
+    
+    if df.empty:
+        return None
+    
+    if not zero_copy and curve_types is None and depth_range is None:
+        with _phase("build"):
             # Set depth index (typically first column or frame.index)
             if frame.index:
                 index_name = frame.index
@@ -119,32 +427,169 @@ def _read_single_dlis(dlis_file_path, verbose, std_names):
             # Ensure index is float
             df.index = df.index.astype(float)
             df.index.name = "DEPTH"
-            
-            # Create fake las_data object for standardization
-            class FakeLASData:
-                pass
-            
-            fake_las = FakeLASData()
-            
-            # Standardize ALL curves (GR, RHOB, NPHI, etc.)
-            _standardize_all_curves(fake_las, df, std_names)
-            
-            if verbose:
-                print(f"✓ {dlis_file_path.name}")
-            return df
-            
-    except Exception as e:
-        if verbose:
-            print(f"✗ Error in {dlis_file_path.name}: {type(e).__name__}: {e}")
-    return None
+    
+    with _phase("build"):
+        # Float channels only; integer and flag channels keep their DLIS dtypes
+        df = _compact_frame(df, dtype)
+        df.attrs["units"] = _channel_units(frame, df)
+    
+    # Create fake las_data object for standardization
+    class FakeLASData:
+        pass
+    
+    fake_las = FakeLASData()
+    
+    # Standardize ALL curves (GR, RHOB, NPHI, etc.)
+    with _phase("standardize"):
+        df = _standardize_all_curves(fake_las, df, std_names, units, fuzzy)
+    return df
+
+
+def _channel_units(frame, df):
+    """Units of the frame channels → {column: unit} for the DataFrame columns and its DEPTH index."""
+    channel_units = {ch.name: getattr(ch, "units", None) for ch in frame.channels}
+    index_channel = frame.index or frame.channels[0].name
+    units = {df.index.name: channel_units.get(index_channel)}
+    # Array channels are split into NAME[0], NAME[1], ...
+    units.update((col, channel_units.get(str(col).partition("[")[0])) for col in df.columns)
+    return {col: unit for col, unit in units.items() if unit}
+
+
+def _frame_views(frame, curve_types=None, depth_range=None, fuzzy=False):
+    """
+    Build a frame's DataFrame from views of ``frame.curves()`` without copying channel data.
+    
+    Scalar channels become columns that share memory with the structured array.
+    Array (multi-dimensional) channels become one 2-D block each (one view per
+    column on pandas < 3), with columns NAME[0], NAME[1], ...; only the depth index
+    is converted (to float64).
+    With ``curve_types`` only the depth index and the matching channels are decoded;
+    with ``depth_range`` only the rows whose index lies inside the window.
+    """
+    with _phase("header"):
+        channels = [ch.name for ch in frame.channels]
+        index_name = frame.index if frame.index else channels[0]
+    if curve_types is None and depth_range is None:
+        with _phase("data"):
+            curves_data = frame.curves()
+        # First field is FRAMENO, then one field per channel (accessed by field, not title)
+        fields = curves_data.dtype.names[1:]
+    else:
+        positions = list(range(len(channels)))
+        if curve_types is not None:
+            keep = set(mnm.columns_for_curve_types(channels, curve_types, fuzzy)) | {index_name}
+            positions = [i for i, name in enumerate(channels) if name in keep]
+        with _phase("data"):
+            rows = None
+            if depth_range is not None:
+                index_position = channels.index(index_name) if index_name in channels else 0
+                index_data, (index_field,) = _read_channels(frame, [index_position])
+                rows = _depth_rows(index_data[index_field].astype(np.float64), depth_range)
+            curves_data, fields = _read_channels(frame, positions, rows)
+        channels = [channels[i] for i in positions]
+    
+    with _phase("build"):
+        return _views_to_dataframe(curves_data, channels, fields, index_name)
+
+
+def _views_to_dataframe(curves_data, channels, fields, index_name):
+    """Assemble the DataFrame of ``_frame_views`` from field views of a structured array."""
+    depth = None
+    scalar_names, scalar_views, blocks = [], [], []
+    for name, field in zip(channels, fields):
+        view = curves_data[field]
+        if depth is None and name == index_name and view.ndim == 1:
+            depth = view
+        elif view.ndim == 1:
+            scalar_names.append(name)
+            scalar_views.append(view)
+        else:
+            block = view.reshape(len(view), -1)
+            blocks.append(([f"{name}[{i}]" for i in range(block.shape[1])], block))
+    
+    index = pd.RangeIndex(len(curves_data))
+    if blocks and _PANDAS_MERGES_BLOCKS:
+        # Concatenating would merge (copy) the blocks, so array channels become column views
+        df = _frame_from_columns(scalar_views + [block[:, i] for _, block in blocks for i in range(block.shape[1])],
+                                 index)
+        df.columns = scalar_names + [col for columns, _ in blocks for col in columns]
+    else:
+        df = pd.DataFrame(dict(enumerate(scalar_views)), index=index, copy=False)
+        df.columns = scalar_names
+        if blocks:
+            df = pd.concat([df, *(pd.DataFrame(block, index=index, columns=columns, copy=False)
+                                  for columns, block in blocks)], axis=1)
+    
+    if depth is not None:
+        df.index = pd.Index(depth.astype(np.float64, copy=False), name="DEPTH")
+    else:
+        df.index = df.index.astype(float)
+        df.index.name = "DEPTH"
+    return df
+
+
+def _read_channels(frame, positions, rows=None):
+    """
+    Decode only the channels at ``positions`` of a frame → (structured array, field names).
+    
+    dlisio decodes a contiguous run of channels, skipping those before and after it,
+    so only the span from the first to the last selected channel is decoded; the
+    selected fields are then packed into a compact array. ``rows`` (slice or
+    positions) limits decoding to those frame data records.
+    """
+    channels = frame.channels
+    dtype = frame.dtype()
+    fields = [dtype.names[i + 1] for i in positions]
+    if not positions:
+        return np.empty(0, dtype=[]), []
+    
+    first, last = positions[0], positions[-1]
+    span = None
+    if _FDATA_FAST_PATH:
+        try:
+            pre_fmt = "i" + "".join(ch.fmtstr() for ch in channels[:first])
+            fmt = "".join(ch.fmtstr() for ch in channels[first:last + 1])
+            post_fmt = "".join(ch.fmtstr() for ch in channels[last + 1:])
+            span_dtype = np.dtype([dtype.descr[i + 1] for i in range(first, last + 1)])
+            span = _read_fdata(frame, span_dtype, pre_fmt, fmt, post_fmt, rows)
+        except Exception:
+            # Any failure of the internal reader: decode with the public API instead
+            span = None
+    if span is None:
+        span = frame.curves()
+        if rows is not None:
+            span = span[rows]
+    
+    if len(fields) == len(span.dtype.names):
+        return span, fields
+    return rfn.repack_fields(span[fields]), fields
+
+
+def _read_fdata(frame, dtype, pre_fmt, fmt, post_fmt, rows=None):
+    """
+    dlisio's internal frame data reader, optionally restricted to some records (one record per row).
+    
+    Relies on private dlisio API; only used for ``FDATA_DLISIO_VERSIONS``.
+    """
+    logicalfile = frame.logicalfile
+    if rows is None:
+        return dlisio.dlis.utils.curves(logicalfile, frame, dtype, pre_fmt, fmt, post_fmt)
+    try:
+        indices = logicalfile.fdata_index[frame.fingerprint]
+    except KeyError:
+        indices = []
+    indices = indices[rows] if isinstance(rows, slice) else [indices[i] for i in rows]
+    alloc = lambda size: np.empty(shape=size, dtype=dtype)
+    return dlisio.core.read_fdata(pre_fmt, fmt, post_fmt, logicalfile.file, indices, dtype.itemsize, alloc,
+                                  logicalfile.error_handler)
 
 
 def _get_well_name(dlis_file_path):
     """Extract well name from DLIS file"""
     try:
-        with dlisio.dlis.load(str(dlis_file_path)) as (f, *rest):
+        with _local_copy(dlis_file_path) as local_path, dlisio.dlis.load(str(local_path)) as (f, *rest):
             if f.origins:
                 return str(f.origins[0].well_name).strip()
     except:
         pass
-    return dlis_file_path.stem
+    return _source_stem(dlis_file_path)
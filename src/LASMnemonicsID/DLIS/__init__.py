@@ -1,2 +1,2 @@
 
-from .DLIS import parseDLIS
+from .DLIS import parseDLIS, iter_dlis, aparseDLIS, aiter_dlis, openDLIS, DLISFrames
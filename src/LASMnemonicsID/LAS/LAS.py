@@ -1,19 +1,32 @@
 import LASMnemonicsID.utils.mnemonics as mnm
-from LASMnemonicsID.utils.mnemonics import (
-    gamma_names,
-    sp_names,
-    caliper_names,
-    deepres_names,
-    rxo_names,
-    density_names,
-    density_correction_names,
-    neutron_names,
-    dtc_names,
-    dts_names,
-    pe_names,
+from LASMnemonicsID.utils.parallel import prefetch as _prefetch
+from LASMnemonicsID.utils.cache import _as_cache
+from LASMnemonicsID.utils.aio import aread_files
+from LASMnemonicsID.utils.manifest import _as_manifest
+from LASMnemonicsID.utils.units import convert_units as _convert_units, resolve_units as _resolve_units
+from LASMnemonicsID.utils.memory import compact_frame as _compact_frame, resolve_dtype as _resolve_dtype
+from LASMnemonicsID.utils.batch import read_batch as _read_batch, rerun_with as _rerun_with
+from LASMnemonicsID.utils.compression import (
+    find_sources as _find_sources,
+    is_container as _is_container,
+    is_plain_file as _is_plain_file,
+    is_single_source as _is_single_source,
+    open_source as _open_source,
+    source_stem as _source_stem,
+)
+from LASMnemonicsID.utils.instrument import (
+    measure as _measure,
+    report as _report,
+    phase as _phase,
+    skip as _skip,
+    _as_instrumentation,
 )
+import asyncio
+import functools
+import io
 import os
 import pathlib
+import numpy as np
 import pandas as pd
 import lasio
 from os.path import join
@@ -52,23 +65,309 @@ def create_mnemonic_dict(
     }
     return mnemonic_dict
 
-def parseLAS(input_path, verbose=True, preferred_names=None):
+def parseLAS(input_path, verbose=True, preferred_names=None, workers=None, executor=None, errors=None,
+             cache=None, engine="lasio", curve_types=None, depth_range=None, instrument=None,
+             as_result=False, fail_fast=False, manifest=None, units=None,
+             dtype=None, compact=False, fuzzy=False):
     """
     Parse LAS file or all in directory → DataFrame or {filename: df}.
     
     Args:
-        input_path (str/Path): LAS file or directory
+        input_path (str/Path or list): LAS file, directory or list of LAS files. Compressed files
+            (.gz, .bz2, .xz) and zip/tar containers are read in place: a container, or a
+            directory holding containers, yields its .las members, which are streamed out
+            without extracting them (see ``utils.compression``).
         verbose (bool): Print info
         preferred_names (dict, optional): Mapping of curve types to preferred column names and preferred original columns.
             Example: {"deepres": "RT", "deepres_preferred_original": "AT90", "gamma": "GR"}
             If not provided, defaults to standard petrophysical names.
+        workers (int, optional): Directory mode only. Read files in a process pool of this size.
+        executor (concurrent.futures.Executor, optional): Directory mode only. Executor to fan
+            the per-file reads out to (takes precedence over ``workers``).
+        errors (list, optional): Per-file failures are appended here as
+            (path, exception class name, message).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        engine (str): "lasio" (default) or "fast". The fast engine parses the header with a
+            minimal parser and bulk-loads ~A with a vectorized reader; wrapped, LAS 3.0 or
+            irregular files fall back to lasio. With ``curve_types`` the fast engine skips
+            the other columns while reading.
+        curve_types (list, optional): Only read curves of these types, given as curve types
+            ("gamma", "density") or standard names ("GR", "RHOB"). Source mnemonics are
+            resolved through the mnemonic index before reading.
+        depth_range (tuple, optional): (top, base) depth window, in the units of the depth
+            index. The fast engine stops reading ~A once depth has passed the window; the
+            lasio engine reads the whole file, then slices.
+        instrument (Instrumentation or callable, optional): Receives the FileMetrics (phase
+            timings, bytes, shape, error) of every file; see ``utils.instrument``.
+        as_result (bool): Return a ``BatchResult`` with the successes, the failures (path,
+            exception class, message, phase) and the skipped files, whose ``retry_failed``
+            re-reads the failures with other settings (e.g. ``engine="lasio"``).
+        fail_fast (bool): Raise ``BatchReadError`` at the first file that fails instead of
+            reading the rest.
+        manifest (Manifest or str/Path, optional): Incremental mode. Only files added or changed
+            since the last run with this manifest (``utils.manifest.Manifest``; a path creates
+            an SQLite manifest there) are read; files gone from the directory are reported
+            in ``BatchResult.deleted``.
+        units (str or dict, optional): "canonical" converts the standardized curves and the
+            depth index to ``utils.units.CANONICAL_UNITS`` (m, us/ft, g/cm3, v/v, ...) using the
+            ~C units; a dict {curve_type: unit} overrides single targets. Source units are
+            always kept in ``df.attrs["units"]``; applied factors go to
+            ``df.attrs["unit_conversions"]``.
+        dtype (str or numpy dtype, optional): Float dtype of the curves, e.g. "float32". Curves
+            are converted while the frame is built (the fast engine parses straight into
+            it); the depth index stays float64. See ``utils.memory.memory_report``.
+        compact (bool): Shorthand for ``dtype="float32"``.
+        fuzzy (bool): Also recognize vendor variants of the mnemonics by pattern (``GR_EDTC_1``,
+            ``DT_2``, array induction ``AHT90``; see ``utils.mnemonics.match_mnemonic``). A
+            variant stands in for a curve type only when no exact alias is present, and is
+            never dropped.
+        
+    Returns:
+        DataFrame (single) or dict {filename: df} (multiple/dir), or BatchResult
+    """
+    if not isinstance(input_path, list):
+        input_path = Path(input_path)
+    _check_engine(engine)
+    
+    std_names = _build_std_names(preferred_names)
+    
+    read_opts = {
+        "cache": _as_cache(cache),
+        "engine": engine,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    
+    instrument = _as_instrumentation(instrument)
+    manifest = _as_manifest(manifest)
+    
+    # Case 1: Single File; Case 2: list of files or directory (recursive)
+    single = not isinstance(input_path, list) and _is_single_source(input_path, (".las",))
+    las_files = [Path(path) for path in input_path] if isinstance(input_path, list) else _find_las_files(input_path)
+    if not las_files and verbose:
+        print(f"No LAS files found in {input_path}")
+    # Deletions are only detected for a scanned directory
+    root = None if single or isinstance(input_path, list) else input_path
+    
+    rerun = _rerun_with(parseLAS, verbose=verbose, preferred_names=preferred_names, workers=workers,
+                       executor=executor, cache=cache, engine=engine, curve_types=curve_types,
+                       depth_range=depth_range, instrument=instrument, fail_fast=fail_fast, manifest=manifest,
+                       units=units, dtype=dtype, compact=compact, fuzzy=fuzzy)
+    result = _read_batch(_load_single_las, las_files, dict(std_names=std_names, **read_opts), verbose,
+                        None if single else workers, None if single else executor, instrument,
+                        fail_fast, rerun, manifest, "las", root)
+    return _batch_return(result, single, errors, as_result)
+
+def iter_las(input_path, verbose=True, preferred_names=None, prefetch=0, cache=None, engine="lasio",
+             curve_types=None, depth_range=None, instrument=None, units=None, dtype=None, compact=False,
+             fuzzy=False):
+    """
+    Lazily parse a LAS file or all in directory → yields (filename, df) one well at a time.
+    
+    Args:
+        input_path (str/Path): LAS file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names
+            (see ``parseLAS``).
+        prefetch (int): Number of wells to read ahead on a background thread (0 = no read-ahead).
+        cache (FrameCache or str/Path, optional): On-disk cache of standardized frames
+            (see ``utils.cache.FrameCache``); a path creates a cache in that directory.
+        engine (str): "lasio" (default) or "fast" (see ``parseLAS``).
+        curve_types (list, optional): Only read curves of these types (see ``parseLAS``).
+        depth_range (tuple, optional): (top, base) depth window (see ``parseLAS``).
+        instrument (Instrumentation or callable, optional): Per-file metrics sink (see ``parseLAS``).
+        units (str or dict, optional): Convert to canonical units (see ``parseLAS``).
+        dtype, compact: Float dtype of the curves (see ``parseLAS``).
+        fuzzy (bool): Pattern-based mnemonic matching (see ``parseLAS``).
+        
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    _check_engine(engine)
+    read_opts = {
+        "cache": _as_cache(cache),
+        "engine": engine,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    las_files = _find_las_files(Path(input_path))
+    
+    def _wells():
+        for las_file in las_files:
+            df = _read_single_las(las_file, verbose, std_names, instrument, **read_opts)
+            if df is not None:
+                yield las_file.name, df
+    
+    yield from _prefetch(_wells(), prefetch)
+
+async def aparseLAS(input_path, verbose=True, preferred_names=None, executor=None, max_concurrency=None,
+                    semaphore=None, cache=None, engine="lasio", curve_types=None, depth_range=None,
+                    instrument=None, units=None, dtype=None, compact=False, fuzzy=False):
+    """
+    Async ``parseLAS`` for asyncio services → DataFrame or {filename: df}.
+    
+    File discovery and parsing run on ``executor``, so the event loop is never blocked.
+    
+    Args:
+        input_path (str/Path): LAS file or directory
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names
+            (see ``parseLAS``).
+        executor (concurrent.futures.Executor, optional): Executor for the blocking reads
+            (default: the loop's thread pool; a ProcessPoolExecutor avoids GIL contention).
+        max_concurrency (int, optional): Files parsed at the same time (default: number of CPUs).
+        semaphore (asyncio.Semaphore, optional): Concurrency limit shared with other calls.
+        cache, engine, curve_types, depth_range, instrument, units, dtype, compact, fuzzy: See
+            ``parseLAS``.
         
     Returns:
         DataFrame (single) or dict {filename: df} (multiple/dir)
     """
     input_path = Path(input_path)
+    las_dict = {
+        name: df async for name, df in aiter_las(input_path, verbose, preferred_names, executor,
+                                                 max_concurrency, semaphore, cache, engine, curve_types,
+                                                 depth_range, instrument, units, dtype, compact, fuzzy)
+    }
+    if len(las_dict) == 1 or await asyncio.to_thread(_is_single_source, input_path, (".las",)):
+        return next(iter(las_dict.values()), None)
+    if not las_dict and verbose:
+        print(f"No LAS files found in {input_path}")
+    return las_dict
+
+async def aiter_las(input_path, verbose=True, preferred_names=None, executor=None, max_concurrency=None,
+                    semaphore=None, cache=None, engine="lasio", curve_types=None, depth_range=None,
+                    instrument=None, units=None, dtype=None, compact=False, fuzzy=False):
+    """
+    Async iterator over a LAS file or directory → yields (filename, df) in file order.
     
-    # Define default standard names
+    Up to ``max_concurrency`` files are parsed ahead of the consumer on ``executor``
+    (see ``aparseLAS`` for the arguments). Cancelling the consumer cancels the
+    reads that have not started.
+    
+    Yields:
+        tuple: (filename, DataFrame) for every file that was read successfully
+    """
+    std_names = _build_std_names(preferred_names)
+    _check_engine(engine)
+    read_opts = {
+        "cache": _as_cache(cache),
+        "engine": engine,
+        "curve_types": _resolve_curve_types(curve_types, std_names),
+        "depth_range": _check_depth_range(depth_range),
+        "units": _resolve_units(units),
+        "dtype": _resolve_dtype(dtype, compact),
+        "fuzzy": bool(fuzzy),
+    }
+    instrument = _as_instrumentation(instrument)
+    las_files = await asyncio.to_thread(_find_las_files, Path(input_path))
+    # Reads run on the executor; their metrics are reported back on the loop
+    async for las_file, (df, metrics) in aread_files(functools.partial(_measure, _load_single_las), las_files,
+                                                     dict(std_names=std_names, **read_opts),
+                                                     executor, max_concurrency, semaphore):
+        _report(metrics, verbose, instrument)
+        if df is not None:
+            yield las_file.name, df
+
+def _find_las_files(input_path):
+    """LAS file itself, or all LAS files under a directory (recursive), also inside compressed files and containers."""
+    return _find_sources(input_path, (".las",))
+
+def _check_engine(engine):
+    """Validate the LAS reader engine name."""
+    if engine not in ("lasio", "fast"):
+        raise ValueError(f"engine must be 'lasio' or 'fast', got {engine!r}")
+
+def _resolve_curve_types(curve_types, std_names):
+    """Curve types or standard names (e.g. "GR") → sorted list of curve types, or None for all."""
+    if curve_types is None:
+        return None
+    if isinstance(curve_types, str):
+        curve_types = [curve_types]
+    by_std_name = {str(name).upper(): curve_type for curve_type, name in std_names.items()
+                   if curve_type in mnm.mnemonic_dict}
+    resolved = set()
+    for item in curve_types:
+        if item in mnm.mnemonic_dict:
+            resolved.add(item)
+        elif str(item).upper() in by_std_name:
+            resolved.add(by_std_name[str(item).upper()])
+        else:
+            raise ValueError(f"Unknown curve type {item!r}; expected one of {list(mnm.mnemonic_dict)} "
+                             f"or a standard name such as {list(by_std_name)}")
+    return sorted(resolved)
+
+def _check_depth_range(depth_range):
+    """Validate a (top, base) depth window → tuple of floats, or None for the whole log."""
+    if depth_range is None:
+        return None
+    top, base = (float(value) for value in depth_range)
+    if top > base:
+        raise ValueError(f"depth_range top must not be below base, got {depth_range!r}")
+    return top, base
+
+def _depth_rows(depth, depth_range):
+    """
+    Rows of ``depth`` inside ``depth_range`` → slice, or an array of positions.
+    
+    Monotonic (increasing or decreasing) depths are sliced by binary search;
+    anything else falls back to a mask.
+    """
+    top, base = depth_range
+    steps = np.diff(depth)
+    if np.all(steps >= 0):
+        return slice(np.searchsorted(depth, top, "left"), np.searchsorted(depth, base, "right"))
+    if np.all(steps <= 0):
+        reverse = depth[::-1]
+        n = len(depth)
+        return slice(n - np.searchsorted(reverse, base, "right"), n - np.searchsorted(reverse, top, "left"))
+    return np.flatnonzero((depth >= top) & (depth <= base))
+
+def _slice_depth(df, depth_range):
+    """Rows of ``df`` whose depth index lies inside ``depth_range`` (all rows if None)."""
+    if depth_range is None:
+        return df
+    return df.iloc[_depth_rows(df.index.to_numpy(dtype=np.float64), depth_range)]
+
+# Rows per chunk when reading a depth window with early termination
+DEPTH_CHUNK_ROWS = 50_000
+
+def _read_depth_window(chunks, depth_col, depth_range):
+    """
+    Concatenate the chunks of a depth-ordered table that overlap ``depth_range``.
+    
+    Reading stops at the first chunk whose depth has moved past the window, so the
+    rest of the file is never parsed. Rows are not trimmed to the window here.
+    """
+    top, base = depth_range
+    kept, empty, start = [], None, None
+    for chunk in chunks:
+        depth = chunk[depth_col].to_numpy(dtype=np.float64)
+        if empty is None:
+            empty = chunk.iloc[:0]
+        if not len(depth):
+            continue
+        if start is None:
+            start = depth[0]
+        if np.nanmax(depth) >= top and np.nanmin(depth) <= base:
+            kept.append(chunk)
+        if (depth[-1] > base and depth[-1] >= start) or (depth[-1] < top and depth[-1] <= start):
+            break
+    if not kept:
+        return empty
+    return pd.concat(kept) if len(kept) > 1 else kept[0]
+
+def _build_std_names(preferred_names=None):
+    """Default standard curve names updated with user preferences."""
     std_names = {
         "gamma": "GR",
         "sp": "SP",
@@ -82,93 +381,353 @@ def parseLAS(input_path, verbose=True, preferred_names=None):
         "dts": "DTS",
         "pe": "PEF"
     }
-    
-    # Update with user preferences if provided
     if preferred_names:
         std_names.update(preferred_names)
+    return std_names
+
+def _read_single_las(las_file_path, verbose, std_names, instrument=None, **read_opts):
+    """Read single LAS file to DataFrame and standardize ALL curves; failures are reported, not raised."""
+    df, metrics = _measure(_load_single_las, las_file_path, std_names=std_names, **read_opts)
+    _report(metrics, verbose, instrument)
+    return df
+
+def _load_single_las(las_file_path, std_names, cache=None, engine="lasio", curve_types=None, depth_range=None,
+                     units=None, dtype=None, fuzzy=False):
+    """Load and standardize a single LAS file; raises on errors, None if empty."""
+    if cache is not None:
+        params = {"reader": "las", "std_names": std_names, "engine": engine, "curve_types": curve_types,
+                  "depth_range": depth_range, "units": units, "dtype": dtype, "fuzzy": fuzzy}
+        return cache.fetch(las_file_path, params,
+                           lambda: _load_single_las(las_file_path, std_names, engine=engine,
+                                                    curve_types=curve_types, depth_range=depth_range,
+                                                    units=units, dtype=dtype, fuzzy=fuzzy))
     
-    # Case 1: Single File
-    if input_path.is_file() and input_path.suffix.lower() == '.las':
-        df = _read_single_las(input_path, verbose, std_names)
-        return df if df is not None else None
+    df = None
+    if engine == "fast":
+        try:
+            las_data, df = _read_las_fast(las_file_path, curve_types, depth_range, dtype, fuzzy)
+        except _FastPathUnsupported:
+            df = None
+    if df is None:
+        # lasio parses the header and ~A in one call
+        with _phase("data"):
+            las_data = _lasio_read(las_file_path)
+        with _phase("build"):
+            df = las_data.df()
+            if curve_types is not None and df is not None:
+                df = df[mnm.columns_for_curve_types(df.columns, curve_types, fuzzy)]
+            if df is not None:
+                df = _compact_frame(df, dtype)
+                df.attrs["units"] = {curve.mnemonic: curve.unit for curve in las_data.curves}
     
-    # Case 2: Directory (Recursive)
-    las_files = list(input_path.rglob("*.las"))
-    if not las_files:
-        if verbose:
-            print(f"No LAS files found in {input_path}")
-        return {}
+    if df is not None:
+        with _phase("build"):
+            # Ensure index is depth (float)
+            df.index = df.index.astype(float)
+            df = _slice_depth(df, depth_range)
     
-    las_dict = {}
-    for las_file in las_files:
-        df = _read_single_las(las_file, verbose, std_names)
-        if df is not None:
-            filename = las_file.name
-            las_dict[filename] = df
+    if df is None or df.empty:
+        _skip("Empty DataFrame")
+        return None
     
-    # Return single DF if only 1 file found, else dict
-    if len(las_dict) == 1:
-        return next(iter(las_dict.values()))
+    # Standardize ALL curves (GR, RHOB, NPHI, etc.)
+    with _phase("standardize"):
+        df = _standardize_all_curves(las_data, df, std_names, units, fuzzy)
+    return df
+
+def _lasio_read(las_file_path):
+    """``lasio.read`` of a plain, compressed or archived LAS file."""
+    if _is_plain_file(las_file_path):
+        return lasio.read(las_file_path)
+    # lasio only detects the encoding of files it opens itself
+    with _open_source(las_file_path) as f:
+        raw = f.read()
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = raw.decode("latin-1")
+    return lasio.read(io.StringIO(text))
+
+# pandas < 3 merges blocks of the same dtype when frames are concatenated side by
+# side, which copies them even with copy=False; pandas 3 (copy-on-write) keeps them
+_PANDAS_MERGES_BLOCKS = int(pd.__version__.split(".")[0]) < 3
+
+
+def _frame_from_columns(columns, index):
+    """
+    1-D column arrays or Series → DataFrame with one block per column, sharing their data.
     
-    return las_dict
+    pandas < 3 builds a dict of columns into separate blocks without copying them, so
+    this is how views are joined there; the column labels are 0, 1, ...
+    """
+    df = pd.DataFrame(dict(enumerate(columns)), copy=False)
+    df.index = index
+    return df
+
+# Slicing out one run of columns costs about as much as copying this many bytes
+_PROJECTION_RUN_BYTES = 1 << 18
 
-def _read_single_las(las_file_path, verbose, std_names):
-    """Read single LAS file to DataFrame and standardize ALL curves."""
+class _FastPathUnsupported(Exception):
+    """The LAS file needs the full lasio reader (wrapped, LAS 3.0 or irregular data)."""
+
+def _read_las_fast(las_file_path, curve_types=None, depth_range=None, dtype=None, fuzzy=False):
+    """
+    Vectorized LAS reader for unwrapped, whitespace-delimited files → (header, df).
+    
+    The header is parsed with the minimal header parser and the ~A section is
+    bulk-loaded with pandas' C parser; NULL values are replaced with NaN.
+    With ``curve_types`` only the depth column and the matching curves are parsed;
+    with ``depth_range`` ~A is read in chunks and reading stops past the window;
+    with ``dtype`` the curves are parsed straight into it (depth stays float64).
+    Raises _FastPathUnsupported when the file has to go through lasio.
+    """
+    with _phase("header"):
+        header, data_offset = _parse_las_header(las_file_path)
+    version = header["version"]
+    if data_offset is None or not header["curves"]:
+        raise _FastPathUnsupported("no ~A section or no curves")
+    if version.get("WRAP", "NO").upper().startswith("Y"):
+        raise _FastPathUnsupported("wrapped file")
+    if version.get("VERS", "2.0").startswith("3"):
+        raise _FastPathUnsupported("LAS 3.0 file")
+    
+    names = _unique_mnemonics([curve["mnemonic"] for curve in header["curves"]])
+    usecols = list(range(len(names)))
+    if curve_types is not None:
+        keep = set(mnm.columns_for_curve_types(names[1:], curve_types, fuzzy))
+        usecols = [0] + [i for i, name in enumerate(names) if i > 0 and name in keep]
+    
+    with _phase("open"):
+        f = _open_source(las_file_path)
+    with f, _phase("data"):
+        f.seek(data_offset)
+        # The first data row must have one value per ~C curve
+        first = f.readline()
+        while first and (not first.strip() or first.lstrip().startswith(b"#")):
+            first = f.readline()
+        if len(first.split()) != len(names):
+            raise _FastPathUnsupported("column count does not match the ~C section")
+        f.seek(data_offset)
+        column_dtypes = np.float64 if dtype is None else {i: np.float64 if i == 0 else dtype for i in usecols}
+        try:
+            if depth_range is None:
+                data = pd.read_csv(f, sep=r"\s+", header=None, comment="#", dtype=column_dtypes,
+                                   usecols=usecols, engine="c")
+            else:
+                with pd.read_csv(f, sep=r"\s+", header=None, comment="#", dtype=column_dtypes,
+                                 usecols=usecols, engine="c", chunksize=DEPTH_CHUNK_ROWS) as chunks:
+                    data = _read_depth_window(chunks, 0, depth_range)
+        except (ValueError, pd.errors.ParserError) as e:
+            # Non-numeric values, ragged rows or an empty section
+            raise _FastPathUnsupported(str(e))
+    if data.shape[1] != len(usecols):
+        raise _FastPathUnsupported("column count does not match the ~C section")
+    
+    with _phase("build"):
+        if dtype is None:
+            values = data.to_numpy()
+            depth, values = values[:, 0], values[:, 1:]
+        else:
+            # Depth and the curve block have different dtypes
+            depth = data.iloc[:, 0].to_numpy(dtype=np.float64, copy=True)
+            values = data.iloc[:, 1:].to_numpy(dtype=dtype, copy=True)
+            del data
+        if header["null"] is not None:
+            depth[depth == header["null"]] = np.nan
+            values[values == header["null"]] = np.nan
+        columns = [names[i] for i in usecols[1:]]
+        df = pd.DataFrame(values, index=pd.Index(depth, name=names[0]), columns=columns)
+        df.attrs["units"] = {name: curve["unit"] for name, curve in zip(names, header["curves"])}
+    return header, df
+
+def _unique_mnemonics(mnemonics):
+    """Suffix duplicated mnemonics with :1, :2, ... the way lasio does."""
+    counts = {}
+    for mnemonic in mnemonics:
+        counts[mnemonic] = counts.get(mnemonic, 0) + 1
+    seen = {}
+    unique = []
+    for mnemonic in mnemonics:
+        if counts[mnemonic] > 1:
+            seen[mnemonic] = seen.get(mnemonic, 0) + 1
+            mnemonic = f"{mnemonic}:{seen[mnemonic]}"
+        unique.append(mnemonic)
+    return unique
+
+def _batch_return(result, single, errors, as_result):
+    """BatchResult → what the parse functions return: the result, a DataFrame or {filename: df}."""
+    if errors is not None:
+        errors.extend((failure.path, failure.error, failure.message) for failure in result.failures)
+    if as_result:
+        return result
+    if single or len(result.successes) == 1:
+        return next(iter(result.successes.values()), None)
+    return dict(result.successes)
+
+def _get_well_name(las_file_path):
+    """Extract well name from LAS file"""
     try:
-        las_data = lasio.read(las_file_path)
-        df = las_data.df()
-        
-        if df is None or df.empty:
-            if verbose:
-                print(f"✗ Empty DataFrame: {las_file_path.name}")
-            return None
-            
-        # Ensure index is depth (float)
-        df.index = df.index.astype(float)
-        
-        # Standardize ALL curves (GR, RHOB, NPHI, etc.)
-        _standardize_all_curves(las_data, df, std_names)
+        well_name = _read_las_header(Path(las_file_path))["well"].get("WELL", "").strip()
+        return well_name or _source_stem(las_file_path)
+    except:
+        return _source_stem(las_file_path)
+
+def scanLAS(input_path, verbose=True):
+    """
+    Scan LAS headers only (no ~A data section) → header dict or {filename: header}.
+    
+    Args:
+        input_path (str/Path): LAS file or directory
+        verbose (bool): Print info
         
+    Returns:
+        dict (single file) or dict {filename: header} (directory). Each header has:
+            "version": ~V items {mnemonic: value}
+            "well": ~W items {mnemonic: value}
+            "well_name", "strt", "stop", "step", "null", "depth_unit"
+            "curves": list of {"mnemonic", "unit", "description", "curve_type"},
+                where curve_type comes from the mnemonic dictionary (None if unknown)
+    """
+    input_path = Path(input_path)
+    
+    # Case 1: Single File
+    if input_path.is_file() and not _is_container(input_path):
+        return _scan_single_las(input_path, verbose)
+    
+    # Case 2: Directory (Recursive)
+    header_dict = {}
+    for las_file in _find_las_files(input_path):
+        header = _scan_single_las(las_file, verbose)
+        if header is not None:
+            header_dict[las_file.name] = header
+    
+    if not header_dict and verbose:
+        print(f"No LAS files found in {input_path}")
+    return header_dict
+
+def _scan_single_las(las_file_path, verbose):
+    """Read single LAS header, printing errors instead of raising."""
+    try:
+        header = _read_las_header(las_file_path)
         if verbose:
             print(f"✓ {las_file_path.name}")
-        return df
-        
-    except lasio.exceptions.LASHeaderError as e:
-        if verbose:
-            print(f"✗ LASHeaderError in {las_file_path.name}: {e}")
+        return header
     except Exception as e:
         if verbose:
             print(f"✗ Error in {las_file_path.name}: {type(e).__name__}: {e}")
     return None
 
-def _get_well_name(las_file_path):
-    """Extract well name from LAS file"""
+def _read_las_header(las_file_path):
+    """Minimal LAS header parser that stops at the ~A marker."""
+    header, _ = _parse_las_header(las_file_path)
+    return header
+
+def _parse_las_header(las_file_path):
+    """Parse the LAS header → (header dict, byte offset of the first ~A data line or None)."""
+    sections = {"V": {}, "W": {}, "C": []}
+    units = {}
+    section = None
+    data_offset = None
+    offset = 0
+    
+    with _open_source(las_file_path) as f:
+        for raw in f:
+            offset += len(raw)
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("~"):
+                section = line[1:2].upper()
+                if section == "A":
+                    data_offset = offset
+                    break
+                continue
+            if section not in sections or "." not in line:
+                continue
+            
+            # MNEM.UNIT  VALUE : DESCRIPTION
+            mnemonic, _, rest = line.partition(".")
+            mnemonic = mnemonic.strip()
+            if rest[:1].isspace():
+                unit, value = "", rest
+            else:
+                unit, _, value = rest.replace("\t", " ").partition(" ")
+            value, _, description = value.rpartition(":") if ":" in value else (value, "", "")
+            
+            if section == "C":
+                hit = mnm.match_mnemonic(mnemonic)
+                sections["C"].append({
+                    "mnemonic": mnemonic,
+                    "unit": unit,
+                    "description": description.strip(),
+                    "curve_type": hit[0] if hit else None,
+                })
+            else:
+                sections[section][mnemonic.upper()] = value.strip()
+                units[mnemonic.upper()] = unit
+    
+    if not sections["C"] and not sections["W"]:
+        raise ValueError("No ~W or ~C section found")
+    
+    well = sections["W"]
+    header = {
+        "version": sections["V"],
+        "well": well,
+        "well_name": well.get("WELL", ""),
+        "strt": _to_float(well.get("STRT")),
+        "stop": _to_float(well.get("STOP")),
+        "step": _to_float(well.get("STEP")),
+        "null": _to_float(well.get("NULL")),
+        "depth_unit": units.get("STRT", ""),
+        "curves": sections["C"],
+    }
+    return header, data_offset
+
+def _to_float(value):
+    """Header value → float, or None when missing or not numeric."""
     try:
-        las_data = lasio.read(las_file_path)
-        return str(las_data.well.WELL.value).strip()
-    except:
-        return las_file_path.stem
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-def _standardize_all_curves(las_data, df, std_names):
+def _standardize_all_curves(las_data, df, std_names, units=None, fuzzy=False):
     """
     Rename ALL curves in the DataFrame to standard abbreviations 
-    based on the mnemonic dictionary.
-    """
-    # 1. Get the dictionary of aliases
-    mnem_dict = create_mnemonic_dict(
-        gamma_names, sp_names, caliper_names, deepres_names, rxo_names,
-        density_names, density_correction_names, neutron_names, 
-        dtc_names, dts_names, pe_names
-    )
-    
-    # 2. Track which columns we've already renamed to avoid duplicates
-    renamed = set()
-
-    # 3. For each curve type, find all aliases in the file
-    for curve_type, aliases in mnem_dict.items():
-        # Find all matching columns in df
-        matching = [col for col in df.columns if col.lower() in [a.lower() for a in aliases]]
-        
+    based on the mnemonic dictionary → standardized DataFrame.
+    
+    The rename map and the aliases to drop are computed first and applied in one
+    projection, which shares the column data of large frames with ``df`` (``df``
+    itself is only modified when nothing is dropped). The outcome is recorded in
+    ``df.attrs["standardization"]``: {"renamed": {name: source}, "dropped":
+    {name: [aliases]}, "curve_types": {name: curve type}}, and the source
+    mnemonic of every column in ``df.attrs["mnemonics"]``.
+    With ``fuzzy`` a curve type that has no exact alias in ``df`` is taken from a
+    pattern match (``GR_EDTC_1``, see ``utils.mnemonics.match_mnemonic``); pattern
+    matches are never dropped and never renamed onto a name ``df`` already has.
+    Source units in ``df.attrs["units"]`` follow the renamed columns; with ``units``
+    ({curve_type: unit}, see ``utils.units.resolve_units``) the standardized curves
+    and the depth index are converted to those units.
+    """
+    # 1. Single pass over the columns: group matches by curve type using
+    #    the cached mnemonic matcher (first curve type in the dict wins);
+    #    pattern matches such as "GR_EDTC_1" are only collected with fuzzy
+    matches = {}
+    patterned = {}
+    for col in df.columns:
+        hit = mnm.match_mnemonic(col, fuzzy)
+        if hit is not None:
+            group = matches if mnm.mnemonic_matcher.is_exact(col) else patterned
+            group.setdefault(hit[0], []).append(col)
+
+    # 2. Rename map and dropped aliases, in mnemonic dictionary order
+    rename, drop = {}, set()
+    renamed, dropped, curve_types = {}, {}, {}
+    existing = set(df.columns)
+    for curve_type in mnm.mnemonic_dict:
+        matching = matches.get(curve_type)
+        exact = bool(matching)
+        if not exact:
+            matching = patterned.get(curve_type)
         if not matching:
             continue
         
@@ -179,16 +738,75 @@ def _standardize_all_curves(las_data, df, std_names):
         preferred_original = std_names.get(f"{curve_type}_preferred_original")
         
         if preferred_original and preferred_original in matching:
-            # Rename preferred original to target_name
-            df.rename(columns={preferred_original: target_name}, inplace=True)
-            renamed.add(target_name)
+            keep = preferred_original
         else:
             # Otherwise, pick the first matching alias
-            df.rename(columns={matching[0]: target_name}, inplace=True)
-            renamed.add(target_name)
+            keep = matching[0]
+        
+        if not exact:
+            # A pattern match alone never replaces a column or drops the other variants
+            if keep != target_name and target_name in existing:
+                continue
+            curve_types[target_name] = curve_type
+            if keep != target_name:
+                rename[keep] = target_name
+                renamed[target_name] = keep
+                existing.add(target_name)
+            continue
         
-        # Remove all other matching columns
-        for col in matching:
-            if col != target_name and col in df.columns:
-                df.drop(columns=[col], inplace=True)
+        curve_types[target_name] = curve_type
+        if keep != target_name:
+            rename[keep] = target_name
+            renamed[target_name] = keep
+        others = [col for col in matching if col != keep]
+        if others:
+            dropped[target_name] = others
+            drop.update(others)
+    
+    # 3. One projection: kept columns in their order, then the new names
+    names = [rename.get(col, col) for col in df.columns if col not in drop]
+    if drop:
+        df = _project_columns(df, [i for i, col in enumerate(df.columns) if col not in drop])
+    df.columns = names
+    
+    # 4. Metadata; units follow the renamed columns, then optional conversion
+    df.attrs["standardization"] = {"renamed": renamed, "dropped": dropped, "curve_types": curve_types}
+    df.attrs["mnemonics"] = {name: renamed.get(name, name) for name in df.columns}
+    source_units = df.attrs.get("units")
+    if source_units:
+        df.attrs["units"] = {name: source_units[renamed.get(name, name)]
+                             for name in [df.index.name, *df.columns]
+                             if renamed.get(name, name) in source_units}
+    if units is not None:
+        _convert_units(df, std_names, units)
+    return df
 
+def _project_columns(df, positions):
+    """
+    Columns of ``df`` at ``positions`` (ascending) → DataFrame.
+    
+    Contiguous runs of positions are sliced, which never copies, and joined side
+    by side without consolidating blocks (on pandas < 3, where concatenating
+    merges blocks, the columns are joined one by one instead). Each run has a
+    fixed cost, so frames whose data is smaller than that are taken (copied) in
+    one step instead.
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    if not len(positions):
+        return df.iloc[:, 0:0]
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = positions[np.r_[0, breaks]]
+    stops = positions[np.r_[breaks - 1, len(positions) - 1]] + 1
+    pieces = len(positions) if _PANDAS_MERGES_BLOCKS else len(starts)
+    if len(starts) == 1:
+        projected = df.iloc[:, starts[0]:stops[0]]
+    elif pieces * _PROJECTION_RUN_BYTES > len(df) * len(positions) * 8:
+        projected = df.iloc[:, positions]
+    elif _PANDAS_MERGES_BLOCKS:
+        projected = _frame_from_columns([df.iloc[:, position] for position in positions], df.index)
+        projected.columns = df.columns[positions]
+    else:
+        runs = [df.iloc[:, start:stop] for start, stop in zip(starts, stops)]
+        projected = pd.concat(runs, axis=1)
+    projected.attrs = dict(df.attrs)
+    return projected
@@ -1,5 +1,9 @@
 from .LAS import (
     parseLAS,
+    iter_las,
+    aparseLAS,
+    aiter_las,
+    scanLAS,
     create_mnemonic_dict,
     _get_well_name,
     _read_single_las  # Keep helpers if needed
@@ -7,6 +11,10 @@ from .LAS import (
 
 __all__ = [
     "parseLAS",
+    "iter_las",
+    "aparseLAS",
+    "aiter_las",
+    "scanLAS",
     "create_mnemonic_dict",
     "_get_well_name",
     "_read_single_las"
@@ -11,5 +11,11 @@ from .LAS.LAS import *
 from .DLIS.DLIS import *
 from .ASCII.ASCII import *
 from .utils.mnemonics import *
+from .utils.export import export_archive
+from .utils.batch import BatchResult, BatchReadError
+from .utils.manifest import Manifest
+from .utils.resample import stack_wells, open_stack
+from .utils.inventory import CurveInventory
+from .utils.memory import memory_report
 
 __version__ = "0.0.1"
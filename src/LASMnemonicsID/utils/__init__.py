@@ -20,12 +20,31 @@ from .mnemonics import (
     
     # The module-level mnemonic_dict - THIS WAS MISSING!
     mnemonic_dict,
+    alias_index,
     
     # Functions
     find_column,
-    create_mnemonic_dict
+    create_mnemonic_dict,
+    build_alias_index,
+    columns_for_curve_types,
+    
+    # Pattern matching
+    mnemonic_families,
+    mnemonic_tool_codes,
+    mnemonic_qc_tokens,
+    MnemonicMatcher,
+    match_mnemonic
 )
 
+from .cache import FrameCache
+from .instrument import Instrumentation, ReadStats, FileMetrics
+from .batch import BatchResult, BatchReadError, FileFailure, SkippedFile
+from .manifest import Manifest, ManifestDiff
+from .units import CANONICAL_UNITS, normalize_unit, unit_factor, convert_units
+from .resample import WellStack, stack_wells, open_stack
+from .memory import memory_report
+from .compression import COMPRESSION_SUFFIXES, CONTAINER_SUFFIXES, find_sources, open_source
+
 # Define what gets exported when using "from utils import *"
 __all__ = [
     # Mnemonic lists
@@ -43,10 +62,58 @@ __all__ = [
     
     # The module-level mnemonic_dict
     'mnemonic_dict',
+    'alias_index',
     
     # Functions
     'find_column',
-    'create_mnemonic_dict'
+    'create_mnemonic_dict',
+    'build_alias_index',
+    'columns_for_curve_types',
+    
+    # Pattern matching
+    'mnemonic_families',
+    'mnemonic_tool_codes',
+    'mnemonic_qc_tokens',
+    'MnemonicMatcher',
+    'match_mnemonic',
+    
+    # Caching
+    'FrameCache',
+    
+    # Instrumentation
+    'Instrumentation',
+    'ReadStats',
+    'FileMetrics',
+    
+    # Batch results
+    'BatchResult',
+    'BatchReadError',
+    'FileFailure',
+    'SkippedFile',
+    
+    # Incremental ingestion
+    'Manifest',
+    'ManifestDiff',
+    
+    # Units
+    'CANONICAL_UNITS',
+    'normalize_unit',
+    'unit_factor',
+    'convert_units',
+    
+    # Multi-well arrays
+    'WellStack',
+    'stack_wells',
+    'open_stack',
+    
+    # Memory
+    'memory_report',
+    
+    # Compressed and archived sources
+    'COMPRESSION_SUFFIXES',
+    'CONTAINER_SUFFIXES',
+    'find_sources',
+    'open_source'
 ]
 
 # Optional: Create a convenience dictionary for easy access
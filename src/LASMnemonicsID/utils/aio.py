@@ -0,0 +1,61 @@
+"""asyncio helpers to read well log files without blocking the event loop."""
+
+import asyncio
+import functools
+import os
+from collections import deque
+
+
+async def aread_files(read_func, paths, kwargs=None, executor=None, max_concurrency=None, semaphore=None):
+    """
+    Run ``read_func(path, **kwargs)`` on an executor for many files → async iterator of (path, result).
+
+    Args:
+        read_func (callable): Blocking single-file reader, e.g. ``LAS._read_single_las``.
+            Must be picklable when ``executor`` is a process pool.
+        paths (list): Files to read.
+        kwargs (dict, optional): Keyword arguments passed after the path.
+        executor (concurrent.futures.Executor, optional): Executor the reads run on.
+            Defaults to the event loop's default thread pool; a ``ProcessPoolExecutor``
+            keeps CPU-bound parsing off the interpreter running the loop.
+        max_concurrency (int, optional): Files read at the same time. Defaults to the
+            number of CPUs.
+        semaphore (asyncio.Semaphore, optional): Shared limit, e.g. one semaphore for all
+            requests of a service. Created from ``max_concurrency`` when not given.
+
+    Yields:
+        tuple: (path, result) in input order. At most ``max_concurrency`` results are
+        held ahead of the consumer. Cancelling the consumer (or closing the iterator)
+        cancels the reads that have not started yet; reads already running on the
+        executor finish in the background and their results are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    window = max_concurrency or os.cpu_count() or 1
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(window)
+    read = functools.partial(read_func, **(kwargs or {}))
+
+    async def _read(path):
+        async with semaphore:
+            return await loop.run_in_executor(executor, read, path)
+
+    pending = deque()
+    path_iter = iter(paths)
+    try:
+        for path in path_iter:
+            pending.append((path, asyncio.ensure_future(_read(path))))
+            if len(pending) >= window:
+                break
+        while pending:
+            path, task = pending[0]
+            result = await task
+            pending.popleft()
+            next_path = next(path_iter, None)
+            if next_path is not None:
+                pending.append((next_path, asyncio.ensure_future(_read(next_path))))
+            yield path, result
+    finally:
+        for _, task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
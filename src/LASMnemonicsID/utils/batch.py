@@ -0,0 +1,151 @@
+"""Batch read results: successes, failures and skipped files of a directory run."""
+
+from collections import namedtuple
+from collections.abc import Mapping
+
+from .instrument import measure, report
+from .parallel import read_files
+
+FileFailure = namedtuple("FileFailure", ["path", "error", "message", "phase"])
+FileFailure.__doc__ = "A file that raised: exception class name, message and the phase it failed in."
+
+SkippedFile = namedtuple("SkippedFile", ["path", "reason"])
+SkippedFile.__doc__ = "A file that was read but produced no DataFrame (e.g. no frames, empty data)."
+
+
+class BatchReadError(RuntimeError):
+    """
+    Raised by ``fail_fast=True`` runs at the first failing file.
+
+    Attributes:
+        failure (FileFailure): The failing file.
+        result (BatchResult): What was read before the failure.
+    """
+
+    def __init__(self, failure, result):
+        phase = f" during {failure.phase}" if failure.phase else ""
+        super().__init__(f"{failure.path}: {failure.error}{phase}: {failure.message}")
+        self.failure = failure
+        self.result = result
+
+
+class BatchResult(Mapping):
+    """
+    Outcome of reading many files; behaves like the {filename: df} dict of the successes.
+
+    Attributes:
+        successes (dict): {filename: DataFrame} of the files read.
+        failures (list): FileFailure(path, error, message, phase) per file that raised.
+        skipped (list): SkippedFile(path, reason) per file without data.
+        unchanged (list): Files not read because the manifest has them unchanged.
+        deleted (list): Files in the manifest that are gone from the directory.
+    """
+
+    def __init__(self, rerun=None):
+        self.successes = {}
+        self.failures = []
+        self.skipped = []
+        self.unchanged = []
+        self.deleted = []
+        self._rerun = rerun
+
+    def __getitem__(self, filename):
+        return self.successes[filename]
+
+    def __iter__(self):
+        return iter(self.successes)
+
+    def __len__(self):
+        return len(self.successes)
+
+    def add(self, path, df, metrics):
+        """Record one file from its DataFrame and FileMetrics."""
+        if metrics.status == "error":
+            self.failures.append(FileFailure(path, metrics.error, metrics.message, metrics.phase))
+        elif df is None:
+            self.skipped.append(SkippedFile(path, metrics.message))
+        else:
+            self.successes[path.name] = df
+
+    def retry_failed(self, **overrides):
+        """
+        Re-read only the failed files with alternate settings and merge the outcome → self.
+
+        Args:
+            **overrides: Arguments of the original parse call to change, e.g.
+                ``engine="lasio"``, ``delimiter=";"`` or ``workers=None``.
+        """
+        if self._rerun is None:
+            raise RuntimeError("this result does not know how its files were read")
+        if not self.failures:
+            return self
+        retry = self._rerun([failure.path for failure in self.failures], **overrides)
+        self.successes.update(retry.successes)
+        self.failures = retry.failures
+        self.skipped.extend(retry.skipped)
+        return self
+
+    def __repr__(self):
+        incremental = (f", unchanged={len(self.unchanged)}, deleted={len(self.deleted)}"
+                       if self.unchanged or self.deleted else "")
+        return (f"BatchResult(successes={len(self.successes)}, failures={len(self.failures)}, "
+                f"skipped={len(self.skipped)}{incremental})")
+
+
+def read_batch(load_func, files, load_kwargs, verbose=False, workers=None, executor=None, instrument=None,
+               fail_fast=False, rerun=None, manifest=None, kind=None, root=None):
+    """
+    Read files serially, or on a process pool with ``workers``/``executor`` → BatchResult.
+
+    Serial runs print one line per file when verbose; parallel runs print a summary.
+    With ``fail_fast`` the first failure raises BatchReadError (pending reads are cancelled).
+    With a ``manifest`` only files of ``kind`` that were added or changed since the last run
+    are read; files gone from ``root`` are reported in ``deleted`` and dropped from it.
+    """
+    result = BatchResult(rerun)
+    if manifest is not None:
+        # The cache does not change the frames
+        params = {name: value for name, value in load_kwargs.items() if name != "cache"}
+        diff = manifest.changes(files, kind, params, root)
+        files = diff.added + diff.changed
+        result.unchanged = diff.unchanged
+        result.deleted = diff.deleted
+        manifest.forget(diff.deleted)
+        if verbose:
+            for path in diff.deleted:
+                print(f"✗ Deleted since last run: {path.name}")
+            if diff.unchanged:
+                print(f"✓ {len(diff.unchanged)} unchanged files skipped")
+
+    parallel = bool(workers) or executor is not None
+    if parallel:
+        reads = ((path, df, metrics) for path, df, _, metrics
+                 in read_files(load_func, files, load_kwargs, workers, executor, metrics=True))
+    else:
+        reads = ((path, *measure(load_func, path, **load_kwargs)) for path in files)
+
+    try:
+        for path, df, metrics in reads:
+            report(metrics, verbose and not parallel, instrument)
+            result.add(path, df, metrics)
+            if manifest is not None:
+                if metrics.status == "error":
+                    manifest.forget([path])
+                else:
+                    manifest.record(path, kind, params, metrics.status, df)
+            if fail_fast and metrics.status == "error":
+                raise BatchReadError(result.failures[-1], result)
+    finally:
+        # Shuts down an owned process pool right away on fail-fast
+        reads.close()
+
+    if parallel and verbose:
+        print(f"✓ {len(result.successes)} of {len(files)} files read, {len(result.failures)} failed")
+    return result
+
+
+def rerun_with(parse_func, **call_opts):
+    """Retry hook for BatchResult: re-run ``parse_func`` on a list of files with changed options."""
+    def rerun(paths, **overrides):
+        return parse_func(list(paths), as_result=True, **{**call_opts, **overrides})
+    return rerun
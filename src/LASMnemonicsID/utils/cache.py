@@ -0,0 +1,197 @@
+"""Persistent on-disk cache of parsed and standardized well log DataFrames."""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import mnemonics as mnm
+from .compression import open_source, source_stat
+
+
+class FrameCache:
+    """
+    On-disk cache of standardized DataFrames, stored as uncompressed NumPy ``.npz`` columns.
+
+    Entries are keyed by the file identity (path + size + mtime, or a content hash),
+    the mnemonic table version and the reader parameters (e.g. ``std_names`` from
+    ``preferred_names``), so changing any of them never returns a stale frame.
+    The least recently used entries are evicted once the cache exceeds ``max_bytes``.
+
+    Args:
+        cache_dir (str/Path): Directory holding the cache entries.
+        max_bytes (int): Size bound of the cache on disk (default: 2 GiB).
+        key (str): "stat" (path, size, mtime) or "content" (SHA-256 of the file bytes).
+    """
+
+    def __init__(self, cache_dir, max_bytes=2 * 1024 ** 3, key="stat"):
+        if key not in ("stat", "content"):
+            raise ValueError(f"key must be 'stat' or 'content', got {key!r}")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.key = key
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size = None
+
+    def __getstate__(self):
+        # The running size estimate is per process
+        state = self.__dict__.copy()
+        state["_size"] = None
+        return state
+
+    def fetch(self, file_path, params, load):
+        """
+        Return the cached frame for ``file_path`` or compute it with ``load()`` and store it.
+
+        Args:
+            file_path (Path): Source file.
+            params: JSON-serializable reader parameters that affect the result.
+            load (callable): Zero-argument function returning a DataFrame or None.
+        """
+        entry = self._entry_path(file_path, params)
+        df = self._read(entry)
+        if df is not None:
+            return df
+        df = load()
+        if df is not None:
+            self._write(entry, df)
+        return df
+
+    def invalidate(self, file_path):
+        """Drop every cached entry of ``file_path``."""
+        shutil.rmtree(self._file_dir(file_path), ignore_errors=True)
+        self._size = None
+
+    def clear(self):
+        """Drop all cached entries."""
+        for child in self.cache_dir.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child, ignore_errors=True)
+        self._size = None
+
+    def size(self):
+        """Total size of the cached entries in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def _file_dir(self, file_path):
+        resolved = str(Path(file_path).resolve())
+        return self.cache_dir / hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+
+    def _entry_path(self, file_path, params):
+        file_path = Path(file_path)
+        if self.key == "content":
+            digest = hashlib.sha256()
+            with open_source(file_path) as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            identity = digest.hexdigest()
+        else:
+            stat = source_stat(file_path)
+            identity = f"{stat.st_size}:{stat.st_mtime_ns}"
+        key = json.dumps(
+            [identity, mnm.mnemonic_table_version, params], sort_keys=True, default=str
+        )
+        # Entry names start with the file identity, so entries of an older version of the file can be told apart
+        return self._file_dir(file_path) / (f"{self._identity_prefix(identity)}-"
+                                            f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.npz")
+
+    @staticmethod
+    def _identity_prefix(identity):
+        return hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+
+    def _read(self, entry):
+        try:
+            with np.load(entry, allow_pickle=True) as data:
+                meta = json.loads(str(data["__meta__"]))
+                arrays = [data[f"c{i}"] for i in range(len(meta["columns"]))]
+                index = data["__index__"]
+        except (OSError, KeyError, ValueError, EOFError, pickle.UnpicklingError, zipfile.BadZipFile):
+            # Missing or corrupt entry: a cache miss
+            return None
+        # Touch the entry so eviction is least-recently-used
+        self._touch(entry)
+        df = pd.DataFrame(dict(enumerate(arrays)), index=index)
+        df.columns = meta["columns"]
+        df.index.name = meta["index_name"]
+        df.attrs.update(meta["attrs"])
+        return df
+
+    def _write(self, entry, df):
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # A changed file gets a new identity; drop the entries of its older versions (any parameters)
+        current = entry.name.split("-", 1)[0] + "-"
+        for stale in entry.parent.glob("*.npz"):
+            if stale.name.startswith(current):
+                continue
+            try:
+                stale_size = stale.stat().st_size
+                stale.unlink()
+            except FileNotFoundError:
+                continue
+            if self._size is not None:
+                self._size -= stale_size
+
+        meta = {"columns": list(df.columns), "index_name": df.index.name, "attrs": dict(df.attrs)}
+        arrays = {f"c{i}": df.iloc[:, i].to_numpy() for i in range(df.shape[1])}
+        # Write to a temporary file first so concurrent readers never see partial entries
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, __meta__=np.array(json.dumps(meta, default=str)),
+                         __index__=df.index.to_numpy(), **arrays)
+            os.replace(tmp, entry)
+            self._touch(entry)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += entry.stat().st_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    @staticmethod
+    def _touch(entry):
+        # Explicit fine-grained stamp; kernel file times can be too coarse to order entries
+        now = time.time_ns()
+        try:
+            os.utime(entry, ns=(now, now))
+        except OSError:
+            pass
+
+    def _entries(self):
+        for path in self.cache_dir.glob("*/*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            yield path, stat.st_mtime_ns, stat.st_size
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is under 90% of max_bytes."""
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for path, _, size in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+
+def _as_cache(cache):
+    """Accept a FrameCache, a cache directory or None."""
+    if cache is None or isinstance(cache, FrameCache):
+        return cache
+    return FrameCache(cache)
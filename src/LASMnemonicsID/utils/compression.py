@@ -0,0 +1,414 @@
+"""Compressed files (.gz, .bz2, .xz) and zip/tar containers as read sources, streamed without extraction."""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+
+# Single compressed files → opener of the decompressed stream
+COMPRESSION_SUFFIXES = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+# Containers whose members are read as files of their own
+CONTAINER_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+# Open containers (zip directories, tar member indexes) kept per process
+MAX_OPEN_CONTAINERS = 8
+
+
+def find_sources(input_path, suffixes):
+    """
+    Files with one of ``suffixes`` at ``input_path`` → list of Paths.
+
+    A file matches on its own suffix, or on the one under a compression suffix
+    (``well.las.gz``). A zip or tar container contributes its matching members as
+    virtual paths ``<container>/<member>``, which ``open_source`` streams out of the
+    container. A directory is searched recursively, including the containers in it.
+
+    Args:
+        input_path (Path): File, container, directory or virtual member path.
+        suffixes (tuple): Lowercase suffixes, e.g. (".las",).
+    """
+    input_path = Path(input_path)
+    if input_path.is_dir():
+        candidates = input_path.rglob("*")
+    elif input_path.is_file():
+        candidates = [input_path]
+    else:
+        return [input_path] if split_member(input_path) and source_suffix(input_path) in suffixes else []
+
+    files = []
+    for path in candidates:
+        if is_container(path):
+            if path.is_file():
+                files.extend(path / name for name in _container(path).names() if source_suffix(name) in suffixes)
+        elif source_suffix(path) in suffixes:
+            files.append(path)
+    return files
+
+
+def is_single_source(path, suffixes):
+    """True when ``path`` is one (possibly compressed or archived) file with one of ``suffixes``."""
+    path = Path(path)
+    if path.is_file():
+        return not is_container(path) and source_suffix(path) in suffixes
+    return split_member(path) is not None and source_suffix(path) in suffixes
+
+
+def is_container(path):
+    """True for zip and tar files, including compressed tars such as .tar.gz and .tgz."""
+    return Path(path).name.lower().endswith(CONTAINER_SUFFIXES)
+
+
+def is_plain_file(path):
+    """True for a file on disk that is neither compressed nor a container member."""
+    path = Path(path)
+    return path.suffix.lower() not in COMPRESSION_SUFFIXES and path.is_file()
+
+
+def source_suffix(path):
+    """Lowercase suffix under any compression suffix: "well.LAS.gz" → ".las"."""
+    path = Path(path)
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        path = path.with_suffix("")
+    return path.suffix.lower()
+
+
+def source_stem(path):
+    """File name without its compression and format suffixes: "well.las.gz" → "well"."""
+    path = Path(path)
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        path = path.with_suffix("")
+    return path.stem
+
+
+def split_member(path):
+    """Virtual path ``<container>/<member>`` → (container Path, member name), or None for other paths."""
+    path = Path(path)
+    for parent in path.parents:
+        if parent.is_file():
+            return (parent, path.relative_to(parent).as_posix()) if is_container(parent) else None
+        if parent.is_dir():
+            return None
+    return None
+
+
+def source_stat(path):
+    """``os.stat`` of a source; a container member reports its container (which changes with any member)."""
+    path = Path(path)
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        member = split_member(path)
+        if member is None:
+            raise
+        return member[0].stat()
+
+
+def open_source(path):
+    """
+    Binary stream of a source (plain, compressed or container member) → file object.
+
+    .gz/.bz2/.xz files are decompressed on the fly, and members of zip and plain tar
+    containers are streamed straight out of the container. Members of compressed tars
+    are decompressed sequentially (tar has no index), so each is read into memory
+    once and reading them in archive order decompresses the container only once.
+    Members that are compressed themselves are decompressed too.
+    """
+    path = Path(path)
+    member = None if path.is_file() else split_member(path)
+    if member is None:
+        opener = COMPRESSION_SUFFIXES.get(path.suffix.lower(), open)
+        return opener(path, "rb")
+    stream = _container(member[0]).open(member[1])
+    opener = COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    return stream if opener is None else _ClosingStream(opener(stream, "rb"), stream.close)
+
+
+@contextmanager
+def source_handle(path):
+    """Path itself for a plain file (readers open it with their own buffering), else an ``open_source`` stream."""
+    if is_plain_file(path):
+        yield path
+        return
+    with open_source(path) as f:
+        yield f
+
+
+@contextmanager
+def local_copy(path):
+    """
+    Path of a real file with the source's bytes, for readers that need one (dlisio maps its input).
+
+    Plain files are yielded as they are. Compressed files and container members
+    are decompressed into an anonymous in-memory file (Linux memfd) or, where that
+    is not available, a temporary file; either is removed on exit.
+    """
+    path = Path(path)
+    if path.suffix.lower() not in COMPRESSION_SUFFIXES and (path.is_file() or split_member(path) is None):
+        # Plain files, and missing ones for the reader to report
+        yield path
+        return
+    if hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+        fd = os.memfd_create(path.name)
+        try:
+            with open(fd, "wb", closefd=False) as out, open_source(path) as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+            yield Path(f"/proc/self/fd/{fd}")
+        finally:
+            os.close(fd)
+        return
+    fd, tmp = tempfile.mkstemp(suffix=source_suffix(path))
+    try:
+        with os.fdopen(fd, "wb") as out, open_source(path) as f:
+            shutil.copyfileobj(f, out, 1 << 20)
+        yield Path(tmp)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+
+_containers = OrderedDict()
+_containers_lock = threading.Lock()
+
+
+def _container(path):
+    """Open container for ``path``, cached per process and keyed by size and mtime."""
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns, os.getpid())
+    with _containers_lock:
+        container = _containers.get(key)
+        if container is not None:
+            _containers.move_to_end(key)
+            return container
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        container = _ZipContainer(path)
+    elif name.endswith(".tar"):
+        container = _TarContainer(path)
+    else:
+        container = _TarStreamContainer(path)
+    with _containers_lock:
+        _containers[key] = container
+        # Containers inherited from a parent process share its file offsets; drop them unclosed
+        for stale in [k for k in _containers if k[3] != key[3]]:
+            del _containers[stale]
+        # Evicted containers close once their open member streams are closed
+        while len(_containers) > MAX_OPEN_CONTAINERS:
+            _containers.popitem(last=False)[1].close()
+    return container
+
+
+def _member_name(name):
+    """Normalized member name ("./a//b.las" → "a/b.las"), or None if it cannot be a virtual path."""
+    member = PurePosixPath(name)
+    if member.is_absolute() or ".." in member.parts or not member.parts:
+        return None
+    return member.as_posix()
+
+
+class _ZipContainer:
+    """
+    Zip file whose central directory is read once; members are streamed by ``zipfile``.
+
+    Open member streams are counted: ``close`` (LRU eviction) only closes the zip
+    file once the last of them is closed, and a member opened after that reopens it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.readers = 0
+        self.closing = False
+        self.zip = zipfile.ZipFile(path)
+        self.members = {}
+        for info in self.zip.infolist():
+            name = _member_name(info.filename)
+            if name is not None and not info.is_dir():
+                self.members[name] = info
+
+    def names(self):
+        return list(self.members)
+
+    def open(self, name):
+        if name not in self.members:
+            raise FileNotFoundError(f"No member {name!r} in {self.path}")
+        with self.lock:
+            if self.zip is None:
+                self.zip = zipfile.ZipFile(self.path)
+            stream = self.zip.open(self.members[name])
+            self.readers += 1
+        return _ClosingStream(stream, self._release)
+
+    def _release(self):
+        with self.lock:
+            self.readers -= 1
+            if self.closing and not self.readers:
+                self._close_zip()
+
+    def close(self):
+        with self.lock:
+            self.closing = True
+            if not self.readers:
+                self._close_zip()
+
+    def _close_zip(self):
+        if self.zip is not None:
+            self.zip.close()
+            self.zip = None
+
+
+class _TarContainer:
+    """Uncompressed tar: members are byte ranges of the file, read through their own file handle."""
+
+    def __init__(self, path):
+        self.path = path
+        self.members = {}
+        with tarfile.open(path, "r:") as tar:
+            for info in tar:
+                name = _member_name(info.name)
+                if name is not None and info.isreg() and not info.issparse():
+                    self.members[name] = (info.offset_data, info.size)
+
+    def names(self):
+        return list(self.members)
+
+    def open(self, name):
+        if name not in self.members:
+            raise FileNotFoundError(f"No member {name!r} in {self.path}")
+        return io.BufferedReader(_ByteRange(self.path, *self.members[name]))
+
+    def close(self):
+        pass
+
+
+class _TarStreamContainer:
+    """
+    Compressed tar, read as one forward stream.
+
+    Opening a member advances the stream to it and reads it into memory; the last
+    member is kept so a reader may open it again. Asking for a member the stream
+    has already passed restarts it from the beginning.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.tar = None
+        self.passed = set()
+        self.last = (None, b"")
+        self.members = None
+
+    def names(self):
+        if self.members is None:
+            with tarfile.open(self.path, "r:*") as tar:
+                self.members = [name for name in (_member_name(info.name) for info in tar if info.isreg())
+                                if name is not None]
+        return list(self.members)
+
+    def open(self, name):
+        with self.lock:
+            if self.last[0] != name:
+                self.last = (name, self._read(name))
+            return io.BytesIO(self.last[1])
+
+    def _read(self, name):
+        if self.tar is None or name in self.passed:
+            self.close()
+            self.tar = tarfile.open(self.path, "r|*")
+            self.passed = set()
+        # next() skips the data of the members in between without reading it out
+        for info in iter(self.tar.next, None):
+            member = _member_name(info.name)
+            self.passed.add(member)
+            if member == name and info.isreg():
+                return self.tar.extractfile(info).read()
+        raise FileNotFoundError(f"No member {name!r} in {self.path}")
+
+    def close(self):
+        if self.tar is not None:
+            self.tar.close()
+            self.tar = None
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only, seekable window [offset, offset + size) of a file."""
+
+    def __init__(self, path, offset, size):
+        self._f = open(path, "rb", buffering=0)
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), self._size - self._pos)
+        if n <= 0:
+            return 0
+        self._f.seek(self._offset + self._pos)
+        n = self._f.readinto(memoryview(b)[:n])
+        self._pos += n
+        return n
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + pos)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._f.close()
+        super().close()
+
+
+class _ClosingStream(io.BufferedIOBase):
+    """Stream that calls ``on_close`` after closing it (the member under a decompressor, a reader count)."""
+
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._stream.seekable()
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def read1(self, size=-1):
+        return self._stream.read1(size)
+
+    def readline(self, size=-1):
+        return self._stream.readline(size)
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        return self._stream.seek(pos, whence)
+
+    def tell(self):
+        return self._stream.tell()
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                self._on_close()
+        super().close()
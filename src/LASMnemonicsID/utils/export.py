@@ -0,0 +1,140 @@
+"""Streaming export of a well log archive to a partitioned columnar dataset."""
+
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from . import mnemonics as mnm
+from .compression import source_stem
+from ..LAS.LAS import _build_std_names, _find_las_files, _read_single_las, _resolve_curve_types
+from ..DLIS.DLIS import _find_dlis_files, _read_single_dlis
+from ..ASCII.ASCII import _find_ascii_files, _read_single_ascii
+from .instrument import _as_instrumentation
+
+EXPORT_FORMATS = {"parquet": ".parquet", "npz": ".npz", "csv": ".csv"}
+OTHER_CURVES = "other"
+
+
+def export_archive(input_dir, out_dir, format="parquet", verbose=True, preferred_names=None,
+                   curve_types=None, include_other=True, instrument=None):
+    """
+    Stream every LAS/DLIS/ASCII file under ``input_dir`` into a dataset partitioned by well and curve type.
+
+    Each well is read and standardized with the regular single-file readers, split by
+    curve type and written before the next well is read, so memory stays bounded by
+    one well. Output layout (hive-style, readable with ``pyarrow.dataset``)::
+
+        out_dir/well=<file stem>/curve_type=<type>/part-0.parquet
+
+    Every curve type partition has the fixed schema ``DEPTH`` + the standardized
+    column name (e.g. ``DEPTH, GR`` for ``curve_type=gamma``) and holds one row
+    group per well. Curves that are not recognized go to ``curve_type=other``.
+
+    Args:
+        input_dir (str/Path): File or directory to export (recursive).
+        out_dir (str/Path): Root directory of the dataset.
+        format (str): "parquet" (requires pyarrow), "npz" or "csv".
+        verbose (bool): Print info
+        preferred_names (dict, optional): Mapping of curve types to preferred column names.
+        curve_types (list, optional): Only export curves of these types (see ``parseLAS``).
+        include_other (bool): Also write unrecognized curves to ``curve_type=other``.
+        instrument (Instrumentation or callable, optional): Per-file metrics sink (see ``parseLAS``).
+
+    Returns:
+        dict {well: [written file paths]}
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {sorted(EXPORT_FORMATS)}, got {format!r}")
+    writer = _writer(format)
+
+    input_dir = Path(input_dir)
+    out_dir = Path(out_dir)
+    std_names = _build_std_names(preferred_names)
+    curve_types = _resolve_curve_types(curve_types, std_names)
+    instrument = _as_instrumentation(instrument)
+    # Standardized column name → curve type (skips the *_preferred_original entries)
+    type_of = {name: curve_type for curve_type, name in std_names.items() if curve_type in mnm.mnemonic_dict}
+
+    sources = [(path, _read_single_las) for path in _find_las_files(input_dir)]
+    sources += [(path, _read_single_dlis) for path in _find_dlis_files(input_dir)]
+    sources += [(path, _read_single_ascii) for path in _find_ascii_files(input_dir)]
+
+    written = {}
+    for path, read_single in sources:
+        df = read_single(path, verbose, std_names, instrument, curve_types=curve_types)
+        if df is None:
+            continue
+        well = _unique_well(_partition_value(source_stem(path)), written)
+        written[well] = []
+        # Re-exporting a well replaces all of its previous partitions
+        shutil.rmtree(out_dir / f"well={well}", ignore_errors=True)
+        for curve_type, columns in _split_by_curve_type(df.columns, type_of, include_other).items():
+            part = df[columns].rename_axis("DEPTH").reset_index()
+            part_dir = out_dir / f"well={well}" / f"curve_type={curve_type}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+            target = part_dir / f"part-0{EXPORT_FORMATS[format]}"
+            writer(part, target)
+            written[well].append(target)
+        # Release the well before reading the next one
+        del df
+
+    if verbose:
+        n_files = sum(len(paths) for paths in written.values())
+        print(f"Exported {len(written)} wells ({n_files} files) to {out_dir}")
+    return written
+
+
+def _split_by_curve_type(columns, type_of, include_other):
+    """Standardized columns → {curve_type: [column]}; unrecognized columns under "other"."""
+    parts = {}
+    for col in columns:
+        curve_type = type_of.get(col)
+        if curve_type is None:
+            if not include_other:
+                continue
+            curve_type = OTHER_CURVES
+        parts.setdefault(curve_type, []).append(col)
+    return parts
+
+
+def _partition_value(name):
+    """Make a file stem safe as a hive partition value."""
+    return re.sub(r"[\\/=:*?\"<>|#%\s]+", "_", name).strip("_") or "well"
+
+
+def _unique_well(well, seen):
+    if well not in seen:
+        return well
+    n = 2
+    while f"{well}_{n}" in seen:
+        n += 1
+    return f"{well}_{n}"
+
+
+def _writer(format):
+    if format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "format='parquet' requires pyarrow (pip install lasmnemonicsid[parquet]); "
+                "use format='npz' or format='csv' without it"
+            ) from e
+
+        def write_parquet(part, target):
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            # One row group per well
+            pq.write_table(table, target, row_group_size=max(table.num_rows, 1))
+        return write_parquet
+
+    if format == "npz":
+        def write_npz(part, target):
+            np.savez(target, **{str(col): part[col].to_numpy() for col in part.columns})
+        return write_npz
+
+    def write_csv(part, target):
+        part.to_csv(target, index=False)
+    return write_csv
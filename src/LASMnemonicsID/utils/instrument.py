@@ -0,0 +1,232 @@
+"""Per-file read metrics, phase timers and pluggable instrumentation sinks."""
+
+import contextlib
+import contextvars
+import heapq
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger("LASMnemonicsID")
+logger.addHandler(logging.NullHandler())
+
+# Phases a reader can report; not every reader has all of them (lasio parses header and data together)
+PHASES = ("open", "header", "data", "build", "standardize")
+
+_current = contextvars.ContextVar("lasmnemonicsid_file_metrics", default=None)
+
+
+class FileMetrics:
+    """
+    Timings and sizes of one file read.
+
+    Attributes:
+        path (Path): File that was read.
+        status (str): "ok", "empty" (no data) or "error".
+        seconds (float): Wall time of the whole read.
+        phases (dict): Seconds spent per phase ("open", "header", "data", "build", "standardize").
+        bytes_read (int): Size of the input file.
+        rows, columns (int): Shape of the returned DataFrame.
+        error (str): Exception class name on failure.
+        message (str): Exception message on failure, or why the file was empty.
+        phase (str): Phase that was running when the read failed.
+    """
+
+    __slots__ = ("path", "status", "seconds", "phases", "bytes_read", "rows", "columns",
+                 "error", "message", "phase")
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.status = "ok"
+        self.seconds = 0.0
+        self.phases = {}
+        self.bytes_read = 0
+        self.rows = 0
+        self.columns = 0
+        self.error = None
+        self.message = None
+        self.phase = None
+
+    def as_dict(self):
+        """Plain dict of the metrics, e.g. for JSON logs."""
+        return {name: str(self.path) if name == "path" else getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"FileMetrics({self.path.name!r}, status={self.status!r}, seconds={self.seconds:.4f})"
+
+
+class ReadStats:
+    """
+    Aggregate counters over many file reads; keeps the slowest files.
+
+    Args:
+        keep_slowest (int): Number of slowest files to remember.
+    """
+
+    def __init__(self, keep_slowest=20):
+        self.keep_slowest = keep_slowest
+        self.files = 0
+        self.status = Counter()
+        self.errors = Counter()
+        self.bytes_read = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.phases = Counter()
+        self._slowest = []
+        self._lock = threading.Lock()
+
+    def add(self, metrics):
+        """Count one FileMetrics."""
+        with self._lock:
+            self.files += 1
+            self.status[metrics.status] += 1
+            if metrics.error:
+                self.errors[metrics.error] += 1
+            self.bytes_read += metrics.bytes_read
+            self.rows += metrics.rows
+            self.seconds += metrics.seconds
+            self.phases.update(metrics.phases)
+            item = (metrics.seconds, self.files, metrics)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, item)
+            elif self.keep_slowest:
+                heapq.heappushpop(self._slowest, item)
+
+    def slowest(self, n=None):
+        """The slowest files read so far → list of FileMetrics, slowest first."""
+        with self._lock:
+            items = sorted(self._slowest, key=lambda item: item[0], reverse=True)
+        return [metrics for _, _, metrics in items[:n]]
+
+    def as_dict(self):
+        return {
+            "files": self.files,
+            "status": dict(self.status),
+            "errors": dict(self.errors),
+            "bytes_read": self.bytes_read,
+            "rows": self.rows,
+            "seconds": self.seconds,
+            "phases": dict(self.phases),
+            "mb_per_s": self.bytes_read / 1e6 / self.seconds if self.seconds else 0.0,
+        }
+
+    def __repr__(self):
+        return (f"ReadStats(files={self.files}, ok={self.status['ok']}, empty={self.status['empty']}, "
+                f"error={self.status['error']}, seconds={self.seconds:.2f})")
+
+
+class Instrumentation:
+    """
+    Sink for per-file metrics: aggregate counters, an optional callback and logging.
+
+    Pass it as ``instrument=`` to the parse functions; with ``verbose=False`` this
+    replaces the printed lines. A plain callable is accepted too and is wrapped.
+
+    Args:
+        on_file (callable, optional): Called with the FileMetrics of every file.
+        stats (ReadStats, optional): Aggregate counters (a new one by default).
+        log (bool): Also emit one record per file on the "LASMnemonicsID" logger
+            (DEBUG for reads, WARNING for failures).
+    """
+
+    def __init__(self, on_file=None, stats=None, log=False):
+        self.on_file = on_file
+        self.stats = stats if stats is not None else ReadStats()
+        self.log = log
+
+    def record(self, metrics):
+        self.stats.add(metrics)
+        if self.log:
+            level = logging.WARNING if metrics.status == "error" else logging.DEBUG
+            if logger.isEnabledFor(level):
+                logger.log(level, "%s %s in %.3fs", metrics.status, metrics.path.name, metrics.seconds,
+                           extra={"metrics": metrics.as_dict()})
+        if self.on_file is not None:
+            self.on_file(metrics)
+
+
+def _as_instrumentation(instrument):
+    """Accept an Instrumentation, a callable or None."""
+    if instrument is None or isinstance(instrument, Instrumentation):
+        return instrument
+    return Instrumentation(on_file=instrument)
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Time a phase of the file being read in this context (no-op outside ``measure``)."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        # Tag the exception, not the metrics: readers may catch it and fall back
+        if getattr(e, "_lasmnemonicsid_phase", None) is None:
+            try:
+                e._lasmnemonicsid_phase = name
+            except AttributeError:
+                pass
+        raise
+    finally:
+        metrics.phases[name] = metrics.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def skip(reason):
+    """Record why the file being read produced no DataFrame."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.message = reason
+
+
+def measure(load_func, path, **kwargs):
+    """
+    Run ``load_func(path, **kwargs)`` recording its metrics → (df or None, FileMetrics).
+
+    Exceptions are captured in the metrics instead of raised. Picklable when
+    ``load_func`` is, so it can run on a process pool.
+    """
+    metrics = FileMetrics(path)
+    try:
+        metrics.bytes_read = os.stat(path).st_size
+    except OSError:
+        pass
+    token = _current.set(metrics)
+    start = time.perf_counter()
+    df = None
+    try:
+        df = load_func(path, **kwargs)
+    except Exception as e:
+        metrics.status = "error"
+        metrics.error = type(e).__name__
+        metrics.message = str(e)
+        metrics.phase = getattr(e, "_lasmnemonicsid_phase", None)
+    finally:
+        metrics.seconds = time.perf_counter() - start
+        _current.reset(token)
+    if df is None:
+        if metrics.status == "ok":
+            metrics.status = "empty"
+            metrics.message = metrics.message or "Empty DataFrame"
+    else:
+        metrics.rows, metrics.columns = df.shape
+    return df, metrics
+
+
+def report(metrics, verbose=False, instrument=None):
+    """Print the ✓/✗ line of a file read (verbose) and hand its metrics to ``instrument``."""
+    if verbose:
+        name = metrics.path.name
+        if metrics.status == "ok":
+            print(f"✓ {name}")
+        elif metrics.status == "empty":
+            print(f"✗ {metrics.message}: {name}")
+        else:
+            print(f"✗ Error in {name}: {metrics.error}: {metrics.message}")
+    if instrument is not None:
+        instrument.record(metrics)
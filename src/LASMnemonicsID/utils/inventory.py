@@ -0,0 +1,306 @@
+"""Curve-inventory index of a well log archive for fast "which wells have X" queries."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import mnemonics as mnm
+from .compression import source_stat, source_stem
+from .instrument import measure, report, _as_instrumentation
+from .parallel import read_files
+from .units import resolve_units
+from ..LAS.LAS import (
+    _build_std_names, _find_las_files, _load_single_las, _resolve_curve_types, _get_well_name as _las_well_name
+)
+from ..DLIS.DLIS import _find_dlis_files, _load_single_dlis, _get_well_name as _dlis_well_name
+from ..ASCII.ASCII import _find_ascii_files, _load_single_ascii, _get_well_name as _ascii_well_name
+
+# kind → (file finder, loader, well name reader)
+_SOURCES = {
+    "las": (_find_las_files, _load_single_las, _las_well_name),
+    "dlis": (_find_dlis_files, _load_single_dlis, _dlis_well_name),
+    "ascii": (_find_ascii_files, _load_single_ascii, _ascii_well_name),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    well TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    depth_min REAL,
+    depth_max REAL,
+    depth_unit TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS curves (
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    mnemonic TEXT,
+    curve_type TEXT,
+    unit TEXT,
+    depth_min REAL,
+    depth_max REAL,
+    null_fraction REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS curves_by_type ON curves (curve_type, path);
+CREATE INDEX IF NOT EXISTS curves_by_name ON curves (name COLLATE NOCASE, path);
+CREATE INDEX IF NOT EXISTS curves_by_path ON curves (path);
+"""
+
+
+class CurveInventory:
+    """
+    SQLite index of the curves in an archive: curve types, source mnemonics, depth ranges,
+    null fractions and well names per file.
+
+    ``build`` reads every LAS/DLIS/ASCII file once with the regular loaders (in a process
+    pool with ``workers``) and stores only the per-curve summary; later builds skip
+    unchanged files. ``query`` answers "which files have X" from the index alone, and
+    its result can be passed straight to ``parseLAS``/``parseDLIS``/``parseASCII``.
+
+    Args:
+        db_path (str/Path): SQLite database file (created if missing).
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = None
+
+    def __getstate__(self):
+        # Connections are per process
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._db().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def build(self, input_path, verbose=True, preferred_names=None, units="canonical", workers=None,
+              executor=None, instrument=None):
+        """
+        Index every LAS/DLIS/ASCII file under ``input_path`` (recursive).
+
+        Args:
+            input_path (str/Path): File or directory.
+            verbose (bool): Print info
+            preferred_names (dict, optional): Mapping of curve types to preferred column names.
+            units (str or dict, optional): Unit conversion applied before summarizing (see
+                ``parseLAS``); canonical by default so depths compare across the archive.
+                None keeps the depth units of each file.
+            workers (int, optional): Read files in a process pool of this size.
+            executor (concurrent.futures.Executor, optional): Executor to fan the reads out to.
+            instrument (Instrumentation or callable, optional): Per-file metrics sink.
+
+        Returns:
+            dict with the number of "indexed", "unchanged", "removed" and "failed" files
+        """
+        input_path = Path(input_path)
+        std_names = _build_std_names(preferred_names)
+        instrument = _as_instrumentation(instrument)
+        params = json.dumps({"std_names": std_names, "units": units}, sort_keys=True, default=str)
+        read_kwargs = {"std_names": std_names, "units": resolve_units(units)}
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        db = self._db()
+
+        known = {row[0]: row[1:] for row in db.execute("SELECT path, size, mtime_ns, params FROM files")}
+        seen = set()
+        for kind, (find_files, _, _) in _SOURCES.items():
+            todo = []
+            for path in find_files(input_path):
+                key = str(path.resolve())
+                seen.add(key)
+                stat = source_stat(path)
+                if known.get(key) == (stat.st_size, stat.st_mtime_ns, params):
+                    counts["unchanged"] += 1
+                else:
+                    todo.append(path)
+            if not todo:
+                continue
+
+            kwargs = dict(kind=kind, **read_kwargs)
+            if workers or executor is not None:
+                reads = ((path, df, metrics) for path, df, _, metrics
+                         in read_files(_summarize_file, todo, kwargs, workers, executor, metrics=True))
+            else:
+                reads = ((path, *measure(_summarize_file, path, **kwargs)) for path in todo)
+            for path, summary, metrics in reads:
+                report(metrics, verbose and not (workers or executor is not None), instrument)
+                if metrics.status == "error":
+                    counts["failed"] += 1
+                    self._remove([str(path.resolve())])
+                    continue
+                self._store(path, kind, params, summary)
+                counts["indexed"] += 1
+            db.commit()
+
+        # Files that disappeared from the indexed directory
+        root = input_path.resolve()
+        gone = [key for key in known if key not in seen and (Path(key) == root or Path(key).is_relative_to(root))]
+        self._remove(gone)
+        db.commit()
+        counts["removed"] = len(gone)
+        if verbose:
+            print(f"Indexed {counts['indexed']} files ({counts['unchanged']} unchanged, "
+                  f"{counts['removed']} removed, {counts['failed']} failed)")
+        return counts
+
+    def query(self, curve_types=None, mnemonics=None, depth_range=None, max_null_fraction=None, well=None,
+              kind=None):
+        """
+        Files that have every requested curve → list of Path, sorted.
+
+        Args:
+            curve_types (list, optional): Curve types ("dts", "pe") or standard names
+                ("DTS", "PEF") that must all be present.
+            mnemonics (list, optional): Source mnemonics or column names (case-insensitive)
+                that must all be present, e.g. curves without a curve type.
+            depth_range (tuple, optional): (top, base); each requested curve must have data
+                inside the window. Either end may be None, e.g. (3000, None) for "below 3000".
+            max_null_fraction (float, optional): Upper bound of the NaN fraction of each
+                requested curve.
+            well (str, optional): Well name pattern (SQL LIKE, case-insensitive, e.g. "15/9-F%").
+            kind (str, optional): Only "las", "dlis" or "ascii" files.
+        """
+        where, args = [], []
+        if kind is not None:
+            where.append("f.kind = ?")
+            args.append(kind)
+        if well is not None:
+            where.append("f.well LIKE ?")
+            args.append(well)
+
+        curve_filters = [("c.curve_type = ?", curve_type)
+                         for curve_type in _resolve_curve_types(curve_types, _build_std_names(None)) or []]
+        curve_filters += [("(c.mnemonic = ? COLLATE NOCASE OR c.name = ? COLLATE NOCASE)", name)
+                          for name in (mnemonics or [])]
+        top, base = depth_range if depth_range is not None else (None, None)
+        for condition, value in curve_filters:
+            clauses = [condition]
+            values = [value] * condition.count("?")
+            if top is not None:
+                clauses.append("c.depth_max >= ?")
+                values.append(float(top))
+            if base is not None:
+                clauses.append("c.depth_min <= ?")
+                values.append(float(base))
+            if max_null_fraction is not None:
+                clauses.append("c.null_fraction <= ?")
+                values.append(float(max_null_fraction))
+            where.append(f"EXISTS (SELECT 1 FROM curves c WHERE c.path = f.path AND {' AND '.join(clauses)})")
+            args.extend(values)
+
+        sql = "SELECT f.path FROM files f" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY f.path"
+        return [Path(row[0]) for row in self._db().execute(sql, args)]
+
+    def curves(self, path):
+        """Indexed curves of one file → list of dicts (name, mnemonic, curve_type, unit, depth_min, ...)."""
+        cursor = self._db().execute(
+            "SELECT name, mnemonic, curve_type, unit, depth_min, depth_max, null_fraction FROM curves "
+            "WHERE path = ? ORDER BY rowid", (str(Path(path).resolve()),))
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def files(self, kind=None):
+        """Indexed files → list of dicts (path, kind, well, rows, depth_min, depth_max, depth_unit)."""
+        cursor = self._db().execute(
+            "SELECT path, kind, well, rows, depth_min, depth_max, depth_unit FROM files"
+            + (" WHERE kind = ?" if kind else "") + " ORDER BY path", (kind,) if kind else ())
+        names = [column[0] for column in cursor.description]
+        entries = [dict(zip(names, row)) for row in cursor]
+        for entry in entries:
+            entry["path"] = Path(entry["path"])
+        return entries
+
+    def _store(self, path, kind, params, summary):
+        key = str(path.resolve())
+        stat = source_stat(path)
+        self._remove([key])
+        info = summary.attrs if summary is not None else {}
+        self._db().execute(
+            "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, kind, info.get("well", source_stem(path)), stat.st_size, stat.st_mtime_ns, params,
+             info.get("rows", 0), info.get("depth_min"), info.get("depth_max"), info.get("depth_unit"),
+             time.time()),
+        )
+        if summary is not None and len(summary):
+            rows = summary[["name", "mnemonic", "curve_type", "unit", "depth_min", "depth_max", "null_fraction"]]
+            self._db().executemany(
+                "INSERT INTO curves VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(key, *(None if isinstance(value, float) and np.isnan(value) else value for value in row))
+                 for row in rows.itertuples(index=False)],
+            )
+
+    def _remove(self, keys):
+        db = self._db()
+        db.executemany("DELETE FROM curves WHERE path = ?", [(key,) for key in keys])
+        db.executemany("DELETE FROM files WHERE path = ?", [(key,) for key in keys])
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+
+def _summarize_file(path, kind, std_names, units=None):
+    """Worker task: load one file and reduce it to one summary row per curve (None if empty)."""
+    _, load, well_name = _SOURCES[kind]
+    df = load(path, std_names, units=units)
+    if df is None:
+        return None
+    return _summarize_frame(df, std_names, well_name(path))
+
+
+def _summarize_frame(df, std_names, well):
+    """Standardized DataFrame → per-curve summary: depth range of the valid samples and NaN fraction."""
+    # Standardized column name → curve type, as recorded by the standardization
+    type_of = df.attrs.get("standardization", {}).get("curve_types")
+    if type_of is None:
+        type_of = {std_names.get(curve_type, curve_type.upper()): curve_type for curve_type in mnm.mnemonic_dict}
+    depth = pd.to_numeric(pd.Series(df.index), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    # notna() per column, so text columns (lithology codes, comments) count their filled cells
+    valid = df.notna().to_numpy(dtype=bool) & ~np.isnan(depth)[:, None]
+    # One pass over the whole block: depth where a curve has a sample, ±inf elsewhere
+    has_data = valid.any(axis=0)
+    depth_min = np.where(has_data, np.where(valid, depth[:, None], np.inf).min(axis=0, initial=np.inf), np.nan)
+    depth_max = np.where(has_data, np.where(valid, depth[:, None], -np.inf).max(axis=0, initial=-np.inf), np.nan)
+    units = df.attrs.get("units", {})
+    mnemonics = df.attrs.get("mnemonics", {})
+    names = [str(col) for col in df.columns]
+    summary = pd.DataFrame({
+        "name": names,
+        "mnemonic": [str(mnemonics.get(col, col)) for col in df.columns],
+        "curve_type": [type_of.get(name) for name in names],
+        "unit": [units.get(col) for col in df.columns],
+        "depth_min": depth_min,
+        "depth_max": depth_max,
+        "null_fraction": 1.0 - valid.mean(axis=0) if len(df) else np.ones(len(names)),
+    })
+    summary.attrs.update(
+        well=str(well),
+        rows=len(df),
+        depth_min=float(np.nanmin(depth)) if len(depth) else None,
+        depth_max=float(np.nanmax(depth)) if len(depth) else None,
+        depth_unit=units.get(df.index.name),
+    )
+    return summary
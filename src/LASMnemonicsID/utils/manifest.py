@@ -0,0 +1,188 @@
+"""Persistent manifest of processed well log files for incremental directory re-ingestion."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from .compression import open_source, source_stat
+
+ManifestDiff = namedtuple("ManifestDiff", ["added", "changed", "unchanged", "deleted"])
+ManifestDiff.__doc__ = "Files of a directory run compared with the manifest (lists of Path)."
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    curves TEXT NOT NULL,
+    depth_min REAL,
+    depth_max REAL,
+    processed_at REAL NOT NULL
+)
+"""
+
+
+class Manifest:
+    """
+    SQLite manifest of the files a directory parse has processed.
+
+    Records path, size, mtime, SHA-256, the reader parameters and the standardized
+    curve inventory of every file read. Passed as ``manifest=`` to the parse functions,
+    only added or changed files are read again; files that disappeared are reported
+    and dropped. A file whose mtime changed but whose content hash did not is treated
+    as unchanged. Failed files are not recorded, so they are retried on the next run.
+
+    Args:
+        db_path (str/Path): SQLite database file (created if missing).
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = None
+
+    def __getstate__(self):
+        # Connections are per process
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._db().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def changes(self, files, kind, params, root=None):
+        """
+        Compare ``files`` with the manifest → ManifestDiff(added, changed, unchanged, deleted).
+
+        Args:
+            files (list): Files found by this run.
+            kind (str): Reader the files belong to ("las", "dlis", "ascii").
+            params: JSON-serializable reader parameters; files recorded with other
+                parameters count as changed.
+            root (Path, optional): Directory that was scanned; recorded files of ``kind``
+                under it that are not in ``files`` are reported as deleted.
+        """
+        params = _params_key(params)
+        known = {row[0]: row[1:] for row in self._db().execute(
+            "SELECT path, size, mtime_ns, sha256, params FROM files WHERE kind = ?", (kind,))}
+        diff = ManifestDiff([], [], [], [])
+        seen = set()
+        for path in files:
+            key = _path_key(path)
+            seen.add(key)
+            row = known.get(key)
+            if row is None:
+                diff.added.append(path)
+                continue
+            size, mtime_ns, sha256, old_params = row
+            try:
+                stat = source_stat(path)
+            except OSError:
+                diff.changed.append(path)
+                continue
+            if old_params != params:
+                diff.changed.append(path)
+            elif (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+                diff.unchanged.append(path)
+            elif stat.st_size == size and _file_sha256(path) == sha256:
+                # Touched, not modified
+                self._db().execute("UPDATE files SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, key))
+                diff.unchanged.append(path)
+            else:
+                diff.changed.append(path)
+        self._db().commit()
+
+        if root is not None:
+            root = Path(_path_key(root))
+            diff.deleted.extend(Path(key) for key in known
+                                if key not in seen and Path(key).is_relative_to(root))
+        return diff
+
+    def record(self, path, kind, params, status, df=None):
+        """Store a processed file with its curve inventory (``df`` is None for files without data)."""
+        path = Path(path)
+        stat = source_stat(path)
+        curves, rows, depth_min, depth_max = [], 0, None, None
+        if df is not None:
+            curves = [str(col) for col in df.columns]
+            rows = len(df)
+            if rows:
+                try:
+                    depth_min, depth_max = float(df.index.min()), float(df.index.max())
+                except (TypeError, ValueError):
+                    pass
+        db = self._db()
+        db.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (_path_key(path), kind, stat.st_size, stat.st_mtime_ns, _file_sha256(path), _params_key(params),
+             status, rows, json.dumps(curves), depth_min, depth_max, time.time()),
+        )
+        db.commit()
+
+    def forget(self, paths):
+        """Drop files from the manifest."""
+        db = self._db()
+        db.executemany("DELETE FROM files WHERE path = ?", [(_path_key(path),) for path in paths])
+        db.commit()
+
+    def entries(self, kind=None):
+        """Recorded files → list of dicts (path, kind, size, mtime_ns, sha256, status, rows, curves, ...)."""
+        query = "SELECT * FROM files" + (" WHERE kind = ?" if kind else "") + " ORDER BY path"
+        cursor = self._db().execute(query, (kind,) if kind else ())
+        names = [column[0] for column in cursor.description]
+        entries = []
+        for row in cursor:
+            entry = dict(zip(names, row))
+            entry["path"] = Path(entry["path"])
+            entry["curves"] = json.loads(entry["curves"])
+            del entry["params"]
+            entries.append(entry)
+        return entries
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute(_SCHEMA)
+        return self._conn
+
+
+def _as_manifest(manifest):
+    """Accept a Manifest, a database path or None."""
+    if manifest is None or isinstance(manifest, Manifest):
+        return manifest
+    return Manifest(manifest)
+
+
+def _path_key(path):
+    return str(Path(path).resolve())
+
+
+def _params_key(params):
+    return params if isinstance(params, str) else json.dumps(params, sort_keys=True, default=str)
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open_source(path) as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
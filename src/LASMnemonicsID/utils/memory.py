@@ -0,0 +1,66 @@
+"""Compact dtypes for standardized curves and per-well memory reports."""
+
+import numpy as np
+import pandas as pd
+
+
+def resolve_dtype(dtype=None, compact=False):
+    """``dtype=``/``compact=`` arguments → name of the curve float dtype (e.g. "float32"), or None."""
+    if dtype is None:
+        return "float32" if compact else None
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError(f"dtype must be a floating point type, got {dtype!r}") from None
+    if dtype.kind != "f":
+        raise ValueError(f"dtype must be a floating point type, got {dtype!r}")
+    return dtype.name
+
+
+def compact_array(values, dtype):
+    """Float array → ``dtype``; integer, flag and text channels are returned unchanged."""
+    if dtype is None or values.dtype.kind != "f" or values.dtype == dtype:
+        return values
+    return values.astype(dtype)
+
+
+def compact_frame(df, dtype):
+    """
+    DataFrame with its float curves in ``dtype`` (the depth index stays float64).
+
+    Columns are converted one at a time into a new frame, so at most one converted
+    copy of the data exists next to the source; other columns are shared, not copied.
+    """
+    if dtype is None or not any(t.kind == "f" and t != dtype for t in df.dtypes):
+        return df
+    compact = pd.DataFrame({i: compact_array(df.iloc[:, i].to_numpy(), dtype) for i in range(df.shape[1])},
+                           index=df.index, copy=False)
+    compact.columns = df.columns
+    compact.attrs.update(df.attrs)
+    return compact
+
+
+def memory_report(wells):
+    """
+    Memory held by each well → DataFrame indexed by well name.
+
+    Columns: rows, curves, bytes (deep memory of the frame and its index),
+    float64_bytes (the same frame with every float curve in float64), saved_bytes
+    and saved_pct. With ``compact=True`` frames, saved_bytes is what the compact
+    dtypes save compared with the default float64 readers.
+
+    Args:
+        wells (dict or DataFrame): {name: df} as returned by the parse functions, or one frame.
+    """
+    if isinstance(wells, pd.DataFrame):
+        wells = {wells.attrs.get("well", "well"): wells}
+    rows = []
+    for name, df in wells.items():
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        floats = [dtype for dtype in df.dtypes if dtype.kind == "f"]
+        float64_bytes = nbytes + sum((8 - dtype.itemsize) * len(df) for dtype in floats)
+        rows.append((name, len(df), df.shape[1], nbytes, float64_bytes, float64_bytes - nbytes,
+                     100.0 * (float64_bytes - nbytes) / float64_bytes if float64_bytes else 0.0))
+    report = pd.DataFrame(rows, columns=["well", "rows", "curves", "bytes", "float64_bytes", "saved_bytes",
+                                         "saved_pct"])
+    return report.set_index("well")
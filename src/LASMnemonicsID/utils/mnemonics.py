@@ -1,4 +1,11 @@
 
+import functools
+import hashlib
+import json
+import re
+from types import MappingProxyType
+
+
 # Function to find the column name in the Well Logs Dataframe
 def find_column(df, curve_type):
     """
@@ -544,3 +551,165 @@ mnemonic_dict = create_mnemonic_dict(
     pe_names,
 )
 
+
+# Function that builds the alias lookup index
+def build_alias_index(mnemonic_dict):
+    """
+    Function that builds a lowercased alias -> (curve_type, priority) lookup index
+    args:
+        mnemonic_dict: mnemonic dictionary with the mnemonics per log type
+    returns:
+        read-only mapping of lowercased alias to (curve_type, priority)
+
+    When an alias is listed under several curve types the first curve type
+    in the dictionary wins, and within a curve type the priority is the
+    position of the alias in its list (lower is preferred).
+    """
+    index = {}
+    for curve_type, aliases in mnemonic_dict.items():
+        for priority, alias in enumerate(aliases):
+            index.setdefault(str(alias).lower(), (curve_type, priority))
+    return MappingProxyType(index)
+
+
+# Module-level index, built once on import
+alias_index = build_alias_index(mnemonic_dict)
+
+
+# Tool or service codes vendors append to a mnemonic (GR_EDTC, RHOB_TLD)
+mnemonic_tool_codes = (
+    "edtc", "stgc", "hngs", "hgns", "sgt", "ecs", "ait", "hrla", "hrlt", "hdil", "mcfl", "tld",
+    "ldt", "ldl", "cnl", "cnt", "aps", "apx", "dsi", "dsst", "bhc", "sls", "mpr", "rtex",
+)
+
+# Separator-delimited suffixes allowed after any alias: run numbers (DT_2),
+# tool codes (GR_EDTC) or both (GR_EDTC_1)
+mnemonic_suffix = rf"(?:[_.:\-](?:\d{{1,2}}|{'|'.join(mnemonic_tool_codes)}))*"
+
+# Name tokens of quality-control channels (RHOB_FLAG, DT_ERR, TNPH_QUAL); a name
+# with one of them is never a pattern match of the curve it describes
+mnemonic_qc_tokens = ("flag", "err", "qc", "qual", "mask", "norm")
+
+# Pattern families for variants that are not "alias + suffix"; "prefix" entries
+# match any name starting with them, "regex" entries must match the whole name
+mnemonic_families = {
+    "deepres": {"regex": [r"a[a-z]{1,3}90[a-z]?"]},  # array induction 90 in curves (AHT90, ASF90)
+    "rxo": {"regex": [r"a[a-z]{1,3}10[a-z]?"]},  # array induction 10 in curves (AHT10)
+    "neutron": {"prefix": ["tnph", "npor"]},
+    "dtc": {"prefix": ["dtco"]},
+}
+
+
+# Function that compiles the pattern families
+def build_family_patterns(mnemonic_dict, families=None, suffix=mnemonic_suffix):
+    """
+    Function that compiles one case-insensitive regex per curve type
+    args:
+        mnemonic_dict: mnemonic dictionary with the mnemonics per log type
+        families: {curve_type: {"prefix": [...], "regex": [...]}} extra pattern families
+        suffix: regex of the vendor suffixes allowed after any alias
+    returns:
+        list of (curve_type, compiled regex) in mnemonic dictionary order
+
+    """
+    families = families or {}
+    patterns = []
+    for curve_type, aliases in mnemonic_dict.items():
+        # Longest alias first so the alternation never stops at a shorter prefix
+        names = sorted({str(alias).lower() for alias in aliases}, key=len, reverse=True)
+        branches = [f"(?:{'|'.join(map(re.escape, names))}){suffix}"] if names else []
+        family = families.get(curve_type, {})
+        branches += [f"{re.escape(prefix.lower())}.*" for prefix in family.get("prefix", [])]
+        branches += [f"(?:{regex})" for regex in family.get("regex", [])]
+        if branches:
+            patterns.append((curve_type, re.compile("|".join(branches), re.IGNORECASE | re.DOTALL)))
+    return patterns
+
+
+class MnemonicMatcher:
+    """
+    Column name → (curve_type, priority) lookup: exact aliases, and pattern families on request.
+
+    Exact aliases keep their list position as priority; pattern matches (``fuzzy=True``)
+    rank after every alias of their curve type and skip names carrying a quality-control
+    token (see ``mnemonic_qc_tokens``). Decisions are memoized in an LRU cache, so names
+    repeated across thousands of files cost one dictionary lookup.
+
+    Args:
+        mnemonic_dict (dict): Mnemonics per curve type.
+        families (dict, optional): Extra pattern families (see ``mnemonic_families``).
+        suffix (str): Regex of the vendor suffixes allowed after any alias.
+        qc_tokens (tuple): Name tokens that rule out a pattern match.
+        cache_size (int): Number of decisions kept in the LRU cache.
+    """
+
+    def __init__(self, mnemonic_dict, families=None, suffix=mnemonic_suffix, qc_tokens=mnemonic_qc_tokens,
+                 cache_size=65536):
+        self.index = build_alias_index(mnemonic_dict)
+        self.patterns = build_family_patterns(mnemonic_dict, families, suffix)
+        self._qc = re.compile(rf"(?:^|[_.:\-])(?:{'|'.join(map(re.escape, qc_tokens))})", re.IGNORECASE) \
+            if qc_tokens else None
+        self._fuzzy_priority = {curve_type: len(aliases) for curve_type, aliases in mnemonic_dict.items()}
+        self.match = functools.lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, name, fuzzy=False):
+        name = str(name).lower()
+        hit = self.index.get(name)
+        if hit is not None or not fuzzy:
+            return hit
+        if self._qc is not None and self._qc.search(name):
+            return None
+        for curve_type, pattern in self.patterns:
+            if pattern.fullmatch(name):
+                return curve_type, self._fuzzy_priority[curve_type]
+        return None
+
+    def is_exact(self, name):
+        """True when ``name`` is a listed alias (not a pattern match)."""
+        return str(name).lower() in self.index
+
+
+# Module-level matcher, built once on import
+mnemonic_matcher = MnemonicMatcher(mnemonic_dict, mnemonic_families)
+
+
+# Function that finds the curve type of a column name
+def match_mnemonic(name, fuzzy=False):
+    """
+    Function that finds the curve type of a column name or mnemonic
+    args:
+        name: column name (e.g. "GR", "GR_EDTC_1", "DT_2")
+        fuzzy: also match vendor variants through the pattern families (off by default)
+    returns:
+        (curve_type, priority) or None when the name is not recognized
+
+    """
+    return mnemonic_matcher.match(name, fuzzy)
+
+
+# Function that selects the columns of the requested curve types
+def columns_for_curve_types(columns, curve_types, fuzzy=False):
+    """
+    Function that selects the source columns whose mnemonic belongs to one of the curve types
+    args:
+        columns: original column names / mnemonics (e.g. a file header)
+        curve_types: iterable of curve types (keys of mnemonic_dict)
+        fuzzy: also select vendor variants matched by the pattern families
+    returns:
+        list of matching columns, in their original order
+
+    """
+    curve_types = set(curve_types)
+    selected = []
+    for col in columns:
+        hit = match_mnemonic(col, fuzzy)
+        if hit is not None and hit[0] in curve_types:
+            selected.append(col)
+    return selected
+
+
+# Version of the mnemonic table (changes whenever any alias list or pattern family changes)
+mnemonic_table_version = hashlib.sha1(
+    json.dumps([mnemonic_dict, mnemonic_families, mnemonic_suffix, mnemonic_qc_tokens],
+               sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
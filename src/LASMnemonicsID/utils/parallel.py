@@ -0,0 +1,159 @@
+"""Process-pool and read-ahead helpers for reading many well log files."""
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .instrument import measure
+
+
+def read_files(load_func, paths, kwargs=None, workers=None, executor=None, chunksize=None, metrics=False):
+    """
+    Run ``load_func(path, **kwargs)`` over many files and yield the results in input order.
+
+    Args:
+        load_func (callable): Module-level reader returning a DataFrame (or None to skip)
+            and raising on failure, e.g. ``LAS._load_single_las``.
+        paths (list): Files to read.
+        kwargs (dict, optional): Keyword arguments passed after the path.
+        workers (int, optional): Size of the process pool created when no executor
+            is given, or the worker count of the given one (for chunk sizing).
+            Defaults to ``os.cpu_count()``.
+        executor (concurrent.futures.Executor, optional): Executor to submit to.
+            It is not shut down here.
+        chunksize (int, optional): Files per submitted task. Defaults to a value that
+            gives every worker several tasks.
+        metrics (bool): Also yield the ``FileMetrics`` of every read.
+
+    Yields:
+        tuple: ``(path, df, error)`` where ``error`` is None or
+        ``(exception_class_name, message)``; ``(path, df, error, metrics)`` with ``metrics=True``.
+    """
+    paths = list(paths)
+    if not paths:
+        return
+
+    n_workers = workers or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+
+    if chunksize is None:
+        chunksize = max(1, min(64, len(paths) // (n_workers * 4)))
+    chunks = [paths[i:i + chunksize] for i in range(0, len(paths), chunksize)]
+
+    # DataFrames only need to be packed when they cross a process boundary
+    pack = isinstance(executor, ProcessPoolExecutor)
+
+    try:
+        # Bounded window of in-flight chunks; results are drained in submission order
+        pending = deque()
+        chunk_iter = iter(chunks)
+        for chunk in chunk_iter:
+            pending.append(executor.submit(_run_chunk, load_func, chunk, kwargs or {}, pack))
+            if len(pending) >= n_workers * 2:
+                break
+        while pending:
+            results = pending.popleft().result()
+            next_chunk = next(chunk_iter, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(_run_chunk, load_func, next_chunk, kwargs or {}, pack))
+            for path, payload, file_metrics in results:
+                df = _unpack_frame(payload) if pack else payload
+                error = (file_metrics.error, file_metrics.message) if file_metrics.status == "error" else None
+                yield (path, df, error, file_metrics) if metrics else (path, df, error)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def prefetch(iterable, size=1):
+    """
+    Consume ``iterable`` on a background thread, keeping at most ``size`` items ready.
+
+    Args:
+        iterable: Any iterable, e.g. a generator reading one file per item.
+        size (int): Maximum number of read-ahead items held in memory.
+
+    Yields:
+        The items of ``iterable`` in order. Exceptions raised by the producer are
+        re-raised in the consumer. Closing the generator stops the producer.
+    """
+    if size < 1:
+        yield from iterable
+        return
+
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        # Poll so the producer can notice an early close by the consumer
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:
+            _put((done, e))
+            return
+        _put((done, None))
+
+    thread = threading.Thread(target=_produce, name="lasmnemonicsid-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _run_chunk(load_func, paths, kwargs, pack):
+    """Worker task: read a chunk of files, capturing per-file errors and metrics."""
+    results = []
+    for path in paths:
+        df, file_metrics = measure(load_func, path, **kwargs)
+        results.append((path, _pack_frame(df) if pack else df, file_metrics))
+    return results
+
+
+def _pack_frame(df):
+    """Split a DataFrame into plain NumPy buffers, which pickle without per-object overhead."""
+    if df is None:
+        return None
+    return {
+        "index": df.index.to_numpy(),
+        "index_name": df.index.name,
+        "columns": list(df.columns),
+        "arrays": [df.iloc[:, i].to_numpy() for i in range(df.shape[1])],
+        "attrs": dict(df.attrs),
+    }
+
+
+def _unpack_frame(payload):
+    """Rebuild a DataFrame from the buffers produced by ``_pack_frame``."""
+    if payload is None:
+        return None
+    df = pd.DataFrame(dict(enumerate(payload["arrays"])), index=payload["index"])
+    df.columns = payload["columns"]
+    df.index.name = payload["index_name"]
+    df.attrs.update(payload["attrs"])
+    return df
@@ -0,0 +1,211 @@
+"""Depth-aligned resampling of many standardized wells into one dense wells × depth × curves array."""
+
+import json
+from collections import namedtuple
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+WellStack = namedtuple("WellStack", ["data", "depth", "wells", "curves"])
+WellStack.__doc__ = """
+Wells resampled onto a common depth grid.
+
+Attributes:
+    data (ndarray or memmap): (wells, depth, curves) array; NaN where a well has no data.
+    depth (ndarray): The depth grid (float64).
+    wells (list): Well names, in the order of the first axis.
+    curves (list): Curve names, in the order of the last axis.
+"""
+
+RESAMPLE_METHODS = ("linear", "nearest")
+
+
+def stack_wells(wells, step, curves=None, top=None, base=None, method="linear", dtype=np.float32,
+                out=None):
+    """
+    Resample standardized wells onto one depth grid → WellStack(data, depth, wells, curves).
+
+    Every well is interpolated at once for all of its curves with a vectorized
+    neighbour gather (no per-sample Python work) and written straight into a
+    preallocated array. Grid points outside a well's depth range, or next to a
+    missing sample, are NaN. All wells must use the same depth unit; parse with
+    ``units="canonical"`` when sources mix feet and metres.
+
+    Args:
+        wells (dict or iterable): {name: df} as returned by ``parseLAS``/``parseDLIS``/
+            ``parseASCII``, or an iterable of (name, df) such as ``iter_las``. An
+            iterable is consumed one well at a time and needs ``curves``, ``top``
+            and ``base``.
+        step (float): Depth step of the grid.
+        curves (list, optional): Curves (columns) to stack. Defaults to every column,
+            in order of first appearance.
+        top, base (float, optional): Grid limits. Default to the shallowest top and
+            deepest base of the wells.
+        method (str): "linear" or "nearest".
+        dtype: Data type of the array (default: float32).
+        out (str/Path, optional): Write the array to this ``.npy`` file as a memory map
+            (for archives larger than RAM), with the well and curve index in a ``.json``
+            file next to it; reopen both with ``open_stack``.
+
+    Returns:
+        WellStack
+    """
+    if method not in RESAMPLE_METHODS:
+        raise ValueError(f"method must be one of {RESAMPLE_METHODS}, got {method!r}")
+    if not step > 0:
+        raise ValueError(f"step must be positive, got {step!r}")
+
+    if isinstance(wells, Mapping):
+        names = list(wells)
+        frames = list(wells.values())
+        if curves is None:
+            curves = list(dict.fromkeys(col for df in frames for col in df.columns))
+        if top is None:
+            top = min((float(np.nanmin(df.index)) for df in frames if len(df)), default=None)
+        if base is None:
+            base = max((float(np.nanmax(df.index)) for df in frames if len(df)), default=None)
+        source = zip(names, frames)
+        n_wells = len(names)
+    else:
+        if curves is None or top is None or base is None:
+            raise ValueError("curves, top and base are required when wells is an iterable")
+        names = []
+        source = iter(wells)
+        n_wells = None
+    if top is None or base is None:
+        raise ValueError("no depth samples to build the grid from")
+    if top > base:
+        raise ValueError(f"top must not be below base, got top={top} base={base}")
+
+    curves = list(curves)
+    depth = top + step * np.arange(int(np.floor((base - top) / step + 1e-9)) + 1)
+
+    if n_wells is None:
+        # Streaming: grow the well axis one well at a time
+        data = _StackWriter(out, dtype, len(depth), len(curves))
+        for name, df in source:
+            names.append(name)
+            data.append(_resample(df, depth, curves, method))
+        data = data.finish()
+    else:
+        data = _allocate(out, dtype, (n_wells, len(depth), len(curves)))
+        for i, (_, df) in enumerate(source):
+            data[i] = _resample(df, depth, curves, method)
+
+    stack = WellStack(data, depth, names, curves)
+    if out is not None:
+        if isinstance(data, np.memmap):
+            data.flush()
+        _write_index(out, stack, step)
+    return stack
+
+
+def open_stack(path, mode="r"):
+    """Reopen a WellStack written with ``stack_wells(..., out=path)`` as a memory map."""
+    path = Path(path)
+    index = json.loads(path.with_suffix(".json").read_text())
+    depth = index["top"] + index["step"] * np.arange(index["n_depth"])
+    return WellStack(np.load(path, mmap_mode=mode), depth, index["wells"], index["curves"])
+
+
+def _resample(df, depth, curves, method):
+    """One well → (depth, curves) float64 block on the grid."""
+    block = np.full((len(depth), len(curves)), np.nan)
+    columns = [j for j, curve in enumerate(curves) if curve in df.columns]
+    if not columns or not len(df):
+        return block
+
+    z = df.index.to_numpy(dtype=np.float64)
+    values = df[[curves[j] for j in columns]].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(z)
+    if not valid.all():
+        z, values = z[valid], values[valid]
+    if len(z) > 1 and np.any(np.diff(z) < 0):
+        order = np.argsort(z, kind="stable")
+        z, values = z[order], values[order]
+
+    inside = np.flatnonzero((depth >= z[0]) & (depth <= z[-1]))
+    if not len(inside):
+        return block
+    grid = depth[inside]
+    if len(z) == 1:
+        block[inside[:, None], columns] = values[0]
+        return block
+
+    # Left neighbour of every grid point and its weight towards the right one
+    left = np.clip(np.searchsorted(z, grid, side="right") - 1, 0, len(z) - 2)
+    span = z[left + 1] - z[left]
+    weight = np.divide(grid - z[left], span, out=np.zeros_like(grid), where=span > 0)
+    if method == "nearest":
+        block[inside[:, None], columns] = values[left + (weight >= 0.5)]
+    else:
+        # NaN neighbours propagate, so gaps are never bridged; grid points on a sample take it as is
+        weight = weight[:, None]
+        lower, upper = values[left], values[left + 1]
+        blended = lower * (1.0 - weight) + upper * weight
+        block[inside[:, None], columns] = np.where(weight == 0.0, lower, np.where(weight == 1.0, upper, blended))
+    return block
+
+
+def _allocate(out, dtype, shape):
+    if out is None:
+        return np.full(shape, np.nan, dtype=dtype)
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    data = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=shape)
+    data[:] = np.nan
+    return data
+
+
+class _StackWriter:
+    """Append well blocks of unknown count to memory, or to an .npy file without holding them."""
+
+    def __init__(self, out, dtype, n_depth, n_curves):
+        self.out = None if out is None else Path(out)
+        self.dtype = np.dtype(dtype)
+        self.shape = (n_depth, n_curves)
+        self.blocks = []
+        self.count = 0
+        if self.out is not None:
+            self.out.parent.mkdir(parents=True, exist_ok=True)
+            self.raw = open(self.out.with_suffix(".part"), "wb")
+
+    def append(self, block):
+        block = block.astype(self.dtype)
+        if self.out is None:
+            self.blocks.append(block)
+        else:
+            self.raw.write(block.tobytes())
+        self.count += 1
+
+    def finish(self):
+        shape = (self.count, *self.shape)
+        if self.out is None:
+            return np.stack(self.blocks) if self.blocks else np.empty(shape, dtype=self.dtype)
+        self.raw.close()
+        if not self.count:
+            self.out.with_suffix(".part").unlink()
+            np.save(self.out, np.empty(shape, dtype=self.dtype))
+            return np.empty(shape, dtype=self.dtype)
+        # Prepend the .npy header to the raw blocks, copying in bounded chunks
+        data = np.lib.format.open_memmap(self.out, mode="w+", dtype=self.dtype, shape=shape)
+        flat = data.reshape(-1)
+        chunk = 1 << 22
+        with open(self.out.with_suffix(".part"), "rb") as raw:
+            start = 0
+            while True:
+                buffer = raw.read(chunk * self.dtype.itemsize)
+                if not buffer:
+                    break
+                values = np.frombuffer(buffer, dtype=self.dtype)
+                flat[start:start + len(values)] = values
+                start += len(values)
+        self.out.with_suffix(".part").unlink()
+        return data
+
+
+def _write_index(out, stack, step):
+    index = {"wells": [str(well) for well in stack.wells], "curves": [str(curve) for curve in stack.curves],
+             "top": float(stack.depth[0]), "step": float(step), "n_depth": len(stack.depth)}
+    Path(out).with_suffix(".json").write_text(json.dumps(index, indent=2))
@@ -0,0 +1,134 @@
+"""Unit normalization and vectorized conversion of standardized curves to canonical units."""
+
+import re
+
+import numpy as np
+
+# Canonical unit per curve type ("depth" is the index)
+CANONICAL_UNITS = {
+    "depth": "m",
+    "gamma": "gAPI",
+    "sp": "mV",
+    "caliper": "in",
+    "deepres": "ohm.m",
+    "rxo": "ohm.m",
+    "density": "g/cm3",
+    "density_correction": "g/cm3",
+    "neutron": "v/v",
+    "dtc": "us/ft",
+    "dts": "us/ft",
+    "pe": "b/e",
+}
+
+# Spellings found in LAS/DLIS/CSV headers → unit symbol
+UNIT_ALIASES = {
+    "m": "m", "meter": "m", "meters": "m", "metre": "m", "metres": "m",
+    "ft": "ft", "f": "ft", "feet": "ft", "foot": "ft",
+    "in": "in", "inch": "in", "inches": "in",
+    "cm": "cm", "mm": "mm",
+    "us/ft": "us/ft", "usec/ft": "us/ft", "us/f": "us/ft", "uspf": "us/ft", "µs/ft": "us/ft",
+    "us/m": "us/m", "usec/m": "us/m", "uspm": "us/m", "µs/m": "us/m",
+    "g/cm3": "g/cm3", "g/cc": "g/cm3", "gm/cc": "g/cm3", "g/c3": "g/cm3", "gr/cc": "g/cm3",
+    "kg/m3": "kg/m3",
+    "v/v": "v/v", "frac": "v/v", "fraction": "v/v", "dec": "v/v", "m3/m3": "v/v", "cfcf": "v/v",
+    "%": "%", "pu": "%", "p.u.": "%", "percent": "%",
+    "ohm.m": "ohm.m", "ohmm": "ohm.m", "ohm-m": "ohm.m", "ohm m": "ohm.m", "ohm": "ohm.m",
+    "gapi": "gAPI", "api": "gAPI",
+    "mv": "mV",
+    "b/e": "b/e", "barns/e": "b/e", "b/elec": "b/e",
+}
+
+# Units of the same quantity, as multiples of the first one
+_UNIT_SCALES = [
+    {"m": 1.0, "ft": 0.3048, "in": 0.0254, "cm": 0.01, "mm": 0.001},
+    {"us/ft": 1.0, "us/m": 0.3048},
+    {"g/cm3": 1.0, "kg/m3": 0.001},
+    {"v/v": 1.0, "%": 0.01},
+]
+
+# Scaled units such as the DLIS index unit "0.1 in"
+_SCALED_UNIT = re.compile(r"^(\d*\.?\d+(?:e-?\d+)?)\s*(\S.*)$")
+
+
+def normalize_unit(unit):
+    """Header unit string → (unit symbol, scale), e.g. "0.1 in" → ("in", 0.1); ("", 1.0) when blank."""
+    text = str(unit or "").strip().lower()
+    scale = 1.0
+    scaled = _SCALED_UNIT.match(text)
+    if scaled and scaled.group(2).strip() in UNIT_ALIASES:
+        scale, text = float(scaled.group(1)), scaled.group(2).strip()
+    return UNIT_ALIASES.get(text, text), scale
+
+
+def unit_factor(from_unit, to_unit):
+    """Multiplier converting values in ``from_unit`` to ``to_unit`` → float, or None if not convertible."""
+    (source, scale), (target, target_scale) = normalize_unit(from_unit), normalize_unit(to_unit)
+    if not source or not target:
+        return None
+    if source == target:
+        return scale / target_scale
+    for scales in _UNIT_SCALES:
+        if source in scales and target in scales:
+            return scale * scales[source] / (target_scale * scales[target])
+    return None
+
+
+def resolve_units(units):
+    """``units=`` argument → {curve_type: target unit} or None (keep source units)."""
+    if units is None:
+        return None
+    if units == "canonical":
+        return dict(CANONICAL_UNITS)
+    if isinstance(units, dict):
+        unknown = set(units) - set(CANONICAL_UNITS)
+        if unknown:
+            raise ValueError(f"Unknown curve types in units: {sorted(unknown)}")
+        return {**CANONICAL_UNITS, **units}
+    raise ValueError(f"units must be None, 'canonical' or a dict, got {units!r}")
+
+
+def convert_units(df, std_names, targets):
+    """
+    Convert the standardized curves and the depth index of ``df`` to ``targets`` in place.
+
+    Source units are read from ``df.attrs["units"]``; every column is scaled with one
+    vectorized multiply. Converted units replace the source units in ``attrs["units"]``
+    and each conversion is recorded in ``attrs["unit_conversions"]`` as
+    {column: {"from", "to", "factor"}}. Curves with unknown or incompatible units are
+    left as they are.
+    """
+    units = dict(df.attrs.get("units", {}))
+    conversions = {}
+    # Standardized column name → curve type, as recorded by the standardization when available
+    type_of = df.attrs.get("standardization", {}).get("curve_types")
+    if type_of is None:
+        type_of = {std_names.get(curve_type, curve_type.upper()): curve_type
+                   for curve_type in CANONICAL_UNITS if curve_type != "depth"}
+
+    index_name = df.index.name
+    if "depth" in targets and index_name in units:
+        factor = unit_factor(units[index_name], targets["depth"])
+        if factor is not None and factor != 1.0:
+            df.index = df.index.to_numpy(dtype=np.float64) * factor
+            df.index.name = index_name
+            conversions[index_name] = {"from": units[index_name], "to": targets["depth"], "factor": factor}
+        if factor is not None:
+            units[index_name] = targets["depth"]
+
+    for col in df.columns:
+        curve_type = type_of.get(col)
+        if curve_type not in targets or col not in units:
+            continue
+        factor = unit_factor(units[col], targets[curve_type])
+        if factor is None:
+            continue
+        if factor != 1.0:
+            # Float curves keep their dtype (e.g. float32 frames)
+            values = df[col].to_numpy()
+            df[col] = (values if values.dtype.kind == "f" else values.astype(np.float64)) * factor
+            conversions[col] = {"from": units[col], "to": targets[curve_type], "factor": factor}
+        units[col] = targets[curve_type]
+
+    df.attrs["units"] = units
+    df.attrs["unit_conversions"] = conversions
+    return df
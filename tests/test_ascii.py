@@ -1,6 +1,7 @@
 
 import pytest
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
 from LASMnemonicsID.ASCII import parseASCII
@@ -219,3 +220,190 @@ def test_parseASCII_preferred_names():
     print_output(df.head().to_string())
     
     assert isinstance(df, pd.DataFrame)
+
+
+def test_parseASCII_parallel_matches_serial():
+    """Process-pool directory mode returns the same frames as the serial loop."""
+    data_dir = Path(__file__).parent / 'data'
+    serial = parseASCII(data_dir, verbose=False)
+    if not serial:
+        pytest.skip("No ASCII/CSV test files found")
+    
+    parallel = parseASCII(data_dir, verbose=False, workers=2)
+    assert list(parallel) == list(serial)
+    for name in serial:
+        pd.testing.assert_frame_equal(parallel[name], serial[name])
+
+
+def test_parseASCII_curve_types_subset():
+    """curve_types keeps the depth index and only the selected columns."""
+    data_dir = Path(__file__).parent / 'data'
+    sample_csv_paths = [f for f in data_dir.glob('*') if f.suffix.lower() == '.csv']
+    if not sample_csv_paths:
+        pytest.skip("No ASCII/CSV test files found")
+    
+    full = parseASCII(sample_csv_paths[0], verbose=False)
+    df = parseASCII(sample_csv_paths[0], verbose=False, curve_types=["GR", "neutron"])
+    assert set(df.columns) <= {"GR", "NPHI"}
+    pd.testing.assert_frame_equal(df, full[list(df.columns)])
+
+
+def test_parseASCII_depth_range(monkeypatch):
+    """Chunked depth_range reads match slicing the full file."""
+    import LASMnemonicsID.ASCII.ASCII as ascii_module
+    monkeypatch.setattr(ascii_module, "DEPTH_CHUNK_ROWS", 50)
+    data_dir = Path(__file__).parent / 'data'
+    sample_csv_paths = [f for f in data_dir.glob('*') if f.suffix.lower() == '.csv']
+    if not sample_csv_paths:
+        pytest.skip("No ASCII/CSV test files found")
+    
+    src = max(sample_csv_paths, key=lambda f: f.stat().st_size)
+    full = parseASCII(src, verbose=False)
+    top, base = full.index[len(full) // 4], full.index[len(full) // 2]
+    df = parseASCII(src, verbose=False, depth_range=(top, base))
+    pd.testing.assert_frame_equal(df, full.loc[top:base])
+
+
+def test_aparseASCII_matches_parseASCII():
+    import asyncio
+    from LASMnemonicsID.ASCII import aparseASCII
+    data_dir = Path(__file__).parent / 'data'
+    serial = parseASCII(data_dir, verbose=False)
+    if not serial:
+        pytest.skip("No ASCII/CSV test files found")
+    
+    result = asyncio.run(aparseASCII(data_dir, verbose=False, max_concurrency=2))
+    assert list(result) == list(serial)
+    for name in serial:
+        pd.testing.assert_frame_equal(result[name], serial[name])
+
+
+def test_parseASCII_retry_failed(tmp_path):
+    """retry_failed re-reads only the failed files with other settings and merges them in."""
+    (tmp_path / "comma.csv").write_text("DEPTH,GR\n100.0,50.0\n100.5,55.0\n")
+    (tmp_path / "semicolon.csv").write_text("DEPTH;GR\n200.0;60.0\n200.5;65.0\n")
+    
+    result = parseASCII(tmp_path, verbose=False, delimiter=",", as_result=True)
+    assert list(result) == ["comma.csv"]
+    assert [failure.path.name for failure in result.failures] == ["semicolon.csv"]
+    
+    assert result.retry_failed(delimiter=";") is result
+    assert sorted(result) == ["comma.csv", "semicolon.csv"] and not result.failures
+    assert list(result["semicolon.csv"]["GR"]) == [60.0, 65.0]
+
+
+def test_parseASCII_unit_row(tmp_path):
+    """A unit row under the header is detected, recorded and used for the unit conversion."""
+    path = tmp_path / "units.csv"
+    path.write_text("DEPTH,DT,NPHI\nft,us/m,%\n1000,300,25\n1001,330,30\n")
+    
+    df = parseASCII(path, verbose=False)
+    assert list(df["DT"]) == [300.0, 330.0]
+    assert df.attrs["units"] == {"DEPTH": "ft", "DT": "us/m", "NPHI": "%"}
+    
+    df = parseASCII(path, verbose=False, units={"depth": "ft"})
+    assert list(df.index) == [1000.0, 1001.0]
+    assert list(df["DT"]) == pytest.approx([91.44, 100.584])
+    assert list(df["NPHI"]) == pytest.approx([0.25, 0.30])
+    assert set(df.attrs["unit_conversions"]) == {"DT", "NPHI"}
+
+
+def test_parseASCII_sniffs_layout(tmp_path):
+    """Delimiter, preamble, unit row and null sentinel are sniffed per file."""
+    from LASMnemonicsID.ASCII.ASCII import _sniff_ascii
+    (tmp_path / "tabs.txt").write_text("DEPTH\tGR\tRHOB\n1000.0\t50.0\t2.3\n1000.5\t-999.25\t2.4\n")
+    (tmp_path / "vendor.dat").write_text(
+        "WELL: 15/9-F-11\nCOMPANY: ACME\n\n"
+        "  DEPT      GR    NPHI\n"
+        "    FT    GAPI     V/V\n"
+        "1000.0    50.0  -999.0\n"
+        "1000.5    55.0    0.25\n")
+    
+    layout = _sniff_ascii(tmp_path / "vendor.dat")
+    assert layout.delimiter == r"\s+" and layout.columns == ["DEPT", "GR", "NPHI"]
+    assert layout.units == {"DEPT": "FT", "GR": "GAPI", "NPHI": "V/V"}
+    assert layout.data_row == 5 and layout.null_values == ["-999.0"]
+    
+    wells = parseASCII(tmp_path, verbose=False)
+    assert sorted(wells) == ["tabs.txt", "vendor.dat"]
+    assert list(wells["tabs.txt"].columns) == ["GR", "RHOB"]
+    assert wells["tabs.txt"]["GR"].isna().tolist() == [False, True]
+    vendor = wells["vendor.dat"]
+    assert list(vendor.index) == [1000.0, 1000.5] and vendor["NPHI"].isna().tolist() == [True, False]
+    assert vendor.attrs["units"]["DEPTH"] == "FT"
+    
+    # "#" comment lines between the data rows are skipped
+    noted = tmp_path / "noted.csv"
+    noted.write_text("DEPTH,GR\n1000.0,50.0\n# tool change\n1000.5,55.0\n")
+    df = parseASCII(noted, verbose=False)
+    assert list(df.index) == [1000.0, 1000.5] and list(df["GR"]) == [50.0, 55.0]
+    
+    with pytest.raises(ValueError):
+        parseASCII(tmp_path, verbose=False, engine="arrow")
+
+
+def test_parseASCII_bom_and_decimal_comma(tmp_path):
+    """BOM-prefixed exports and ";"-delimited files with decimal commas are read, not misparsed."""
+    from LASMnemonicsID.ASCII.ASCII import _sniff_ascii
+    bom = tmp_path / "bom.csv"
+    bom.write_bytes(b"\xef\xbb\xbfGR,DEPTH,RHOB\n50.0,1000.0,2.3\n55.0,1000.5,2.4\n")
+    assert _sniff_ascii(bom).columns == ["GR", "DEPTH", "RHOB"]
+    df = parseASCII(bom, verbose=False)
+    assert list(df.columns) == ["GR", "RHOB"] and df["GR"].tolist() == [50.0, 55.0]
+    
+    comma = tmp_path / "comma.csv"
+    comma.write_text("DEPTH;GR\n1000,5;50,1\n1001,0;51,2\n1001,5;-999,25\n")
+    layout = _sniff_ascii(comma)
+    assert layout.delimiter == ";" and layout.decimal == "," and layout.columns == ["DEPTH", "GR"]
+    assert layout.data_row == 1 and layout.null_values == ["-999,25"]
+    df = parseASCII(comma, verbose=False)
+    assert list(df.index) == [1000.5, 1001.0, 1001.5]
+    assert df["GR"].tolist()[:2] == [50.1, 51.2] and np.isnan(df["GR"].iloc[2])
+    
+    # No line splits like the data rows: an error instead of a data row taken as the header
+    ragged = tmp_path / "ragged.csv"
+    ragged.write_text("DEPTH,GR\n1,2,3\n4,5\n6,7,8,9\n")
+    with pytest.raises(ValueError):
+        _sniff_ascii(ragged, delimiter=",")
+
+
+def test_parseASCII_fixed_width(tmp_path):
+    """Aligned columns with blank cells are sniffed as fixed-width and sliced by position."""
+    from LASMnemonicsID.ASCII.ASCII import FIXED_WIDTH, _sniff_ascii
+    path = tmp_path / "fixed.txt"
+    path.write_bytes(
+        b"WELL: 15/9-F-11\r\n"
+        b"  DEPTH       GR    RHOB    NPHI  ZONE\r\n"
+        b"      M     GAPI    G/CC     V/V\r\n"
+        b" 1000.0    45.20   2.310   0.250  A\r\n"
+        b" 1000.5            2.320 -999.25  A\r\n"
+        b" 1001.0    47.10           0.240  B\r\n"
+        b" 1001.5  123.456   2.400   0.230  B\r\n")
+    
+    layout = _sniff_ascii(path)
+    assert layout.delimiter == FIXED_WIDTH and layout.columns == ["DEPTH", "GR", "RHOB", "NPHI", "ZONE"]
+    assert layout.units["GR"] == "GAPI" and layout.data_row == 3 and layout.null_values == ["-999.25"]
+    
+    df = parseASCII(path, verbose=False)
+    assert list(df.index) == [1000.0, 1000.5, 1001.0, 1001.5]
+    assert df["GR"].tolist()[2:] == [47.1, 123.456] and np.isnan(df["GR"].iloc[1])
+    assert df["RHOB"].isna().tolist() == [False, False, True, False]
+    assert df["NPHI"].isna().tolist() == [False, True, False, False]
+    assert df["ZONE"].tolist() == ["A", "A", "B", "B"]
+    assert df.attrs["units"]["DEPTH"] == "M"
+    
+    window = parseASCII(path, verbose=False, delimiter="fixed", depth_range=(1000.5, 1001.0), compact=True)
+    assert list(window.index) == [1000.5, 1001.0] and window["RHOB"].dtype == np.float32
+    
+    # Quoted delimiters do not count, so a CSV with a quoted comma stays a CSV
+    quoted = tmp_path / "quoted.csv"
+    quoted.write_text('DEPTH,GR,ZONE\n1000.0,45.2,"A, upper"\n1000.5,46.0,B\n1001.0,47.1,"C, lower"\n')
+    assert _sniff_ascii(quoted).delimiter == ","
+    df = parseASCII(quoted, verbose=False)
+    assert df["ZONE"].tolist() == ["A, upper", "B", "C, lower"] and df["GR"].tolist() == [45.2, 46.0, 47.1]
+    
+    # Lines whose depth is not a number are skipped, not a TypeError
+    text_depth = tmp_path / "text_depth.txt"
+    text_depth.write_text("  DEPTH    GR\n 1000.0  45.2\n 1000.5* 46.0\n 1001.0      \n")
+    df = parseASCII(text_depth, verbose=False, delimiter=FIXED_WIDTH)
+    assert list(df.index) == [1000.0, 1001.0] and df["GR"].tolist()[0] == 45.2
@@ -159,3 +159,216 @@ def test_parseDLIS_multiple_frames():
     
     assert isinstance(df, pd.DataFrame)
     assert len(df) > 0
+
+
+def test_parseDLIS_parallel_matches_serial():
+    """Thread or process executors return the same frames as the serial loop."""
+    from concurrent.futures import ThreadPoolExecutor
+    data_dir = Path(__file__).parent / 'data'
+    serial = parseDLIS(data_dir, verbose=False)
+    if not serial:
+        pytest.skip("No DLIS test files found")
+    
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        threaded = parseDLIS(data_dir, verbose=False, executor=ex)
+    pooled = parseDLIS(data_dir, verbose=False, workers=2)
+    for result in (threaded, pooled):
+        assert list(result) == list(serial)
+        for name in serial:
+            pd.testing.assert_frame_equal(result[name], serial[name])
+
+
+def test_parseDLIS_zero_copy_matches_default():
+    """zero_copy mode returns the same frame as the copying path."""
+    data_dir = Path(__file__).parent / 'data'
+    sample_dlis_paths = [f for f in data_dir.glob('*') if f.suffix.lower() == '.dlis']
+    if not sample_dlis_paths:
+        pytest.skip("No DLIS test files found")
+    
+    for path in sample_dlis_paths:
+        pd.testing.assert_frame_equal(parseDLIS(path, verbose=False, zero_copy=True),
+                                      parseDLIS(path, verbose=False))
+
+
+def test_frame_views_share_memory():
+    """Scalar and array channels are views of the structured array; arrays are 2-D blocks."""
+    import numpy as np
+    from types import SimpleNamespace
+    from LASMnemonicsID.DLIS.DLIS import _frame_views
+    
+    curves = np.zeros(4, dtype=[("FRAMENO", "<i4"), ("f_dept", "<i4"), ("f_gr", "<f4"), ("f_img", "<f4", (2, 3))])
+    curves["f_dept"] = np.arange(4) * 5
+    curves["f_gr"] = np.arange(4) + 50
+    curves["f_img"] = np.arange(24).reshape(4, 2, 3)
+    frame = SimpleNamespace(
+        curves=lambda: curves,
+        index="DEPT",
+        channels=[SimpleNamespace(name=n) for n in ("DEPT", "GR", "IMG")],
+    )
+    
+    df = _frame_views(frame)
+    assert df.index.name == "DEPTH"
+    assert df.index.dtype == np.float64
+    assert list(df.index) == [0.0, 5.0, 10.0, 15.0]
+    assert list(df.columns) == ["GR"] + [f"IMG[{i}]" for i in range(6)]
+    assert np.shares_memory(df["GR"].to_numpy(), curves)
+    assert all(np.shares_memory(df[f"IMG[{i}]"].to_numpy(), curves) for i in range(6))
+    img = df[[f"IMG[{i}]" for i in range(6)]].to_numpy()
+    assert img.shape == (4, 6)
+    if int(pd.__version__.split(".")[0]) >= 3:
+        # One 2-D block per array channel (pandas < 3 keeps one view per column)
+        assert np.shares_memory(img, curves)
+    np.testing.assert_array_equal(img, np.arange(24).reshape(4, 6))
+
+
+def test_frame_to_dataframe_compact_keeps_integer_channels():
+    """compact float32 frames downcast float64 channels only; flags and depth keep their dtypes."""
+    import numpy as np
+    from types import SimpleNamespace
+    from LASMnemonicsID.DLIS.DLIS import _frame_to_dataframe
+    from LASMnemonicsID.LAS.LAS import _build_std_names
+    
+    curves = np.zeros(3, dtype=[("FRAMENO", "<i4"), ("DEPT", "<f8"), ("GR", "<f8"), ("FLAG", "<i2")])
+    curves["DEPT"] = [1000.0, 1000.5, 1001.0]
+    curves["GR"] = [45.5, 50.25, 60.0]
+    frame = SimpleNamespace(curves=lambda: curves, index="DEPT",
+                            channels=[SimpleNamespace(name=n) for n in ("DEPT", "GR", "FLAG")])
+    
+    df = _frame_to_dataframe(frame, _build_std_names(), dtype="float32")
+    assert df.index.dtype == np.float64
+    assert df["GR"].dtype == np.float32 and df["FLAG"].dtype == np.int16
+    np.testing.assert_array_equal(df["GR"].to_numpy(), np.float32([45.5, 50.25, 60.0]))
+
+def test_openDLIS_lazy_frames_lru(monkeypatch):
+    """All logical files and frames are exposed; curves are decoded on access with an LRU limit."""
+    import numpy as np
+    from types import SimpleNamespace
+    from LASMnemonicsID.DLIS import DLIS as dlis_module
+    
+    decoded = []
+    
+    def make_frame(name):
+        curves = np.zeros(3, dtype=[("FRAMENO", "<i4"), ("DEPT", "<f8"), ("GR", "<f4")])
+        curves["DEPT"] = [1.0, 2.0, 3.0]
+        
+        def _curves():
+            decoded.append(name)
+            return curves
+        return SimpleNamespace(name=name, index="DEPT", curves=_curves,
+                               channels=[SimpleNamespace(name="DEPT"), SimpleNamespace(name="GR")])
+    
+    class FakeFiles(list):
+        closed = False
+        
+        def close(self):
+            self.closed = True
+    
+    files = FakeFiles([SimpleNamespace(frames=[make_frame("MAIN"), make_frame("REPEAT")]),
+                       SimpleNamespace(frames=[make_frame("MAIN")])])
+    monkeypatch.setattr(dlis_module.dlisio.dlis, "load", lambda path: files)
+    
+    with dlis_module.openDLIS("run.dlis", max_cached=1) as frames:
+        assert list(frames) == [(0, "MAIN"), (0, "REPEAT"), (1, "MAIN")]
+        assert frames.channels((1, "MAIN")) == ["DEPT", "GR"]
+        assert decoded == []
+        
+        df = frames[(1, "MAIN")]
+        assert list(df.columns) == ["GR"] and df.index.name == "DEPTH"
+        frames[(1, "MAIN")]
+        assert decoded == ["MAIN"]
+        frames[(0, "REPEAT")]
+        frames[(1, "MAIN")]  # evicted by the LRU limit, decoded again
+        assert decoded == ["MAIN", "REPEAT", "MAIN"]
+    assert files.closed
+
+
+def test_parseDLIS_curve_types_subset():
+    """curve_types decodes only the selected channels and matches the full frame."""
+    data_dir = Path(__file__).parent / 'data'
+    sample_dlis_paths = list(data_dir.glob('*.dlis')) + list(data_dir.glob('*.DLIS'))
+    if not sample_dlis_paths:
+        pytest.skip("No DLIS test files found")
+    
+    full = parseDLIS(sample_dlis_paths[0], verbose=False)
+    df = parseDLIS(sample_dlis_paths[0], verbose=False, curve_types=["GR"])
+    assert list(df.columns) == [c for c in full.columns if c == "GR"]
+    pd.testing.assert_frame_equal(df, full[list(df.columns)])
+
+
+def test_parseDLIS_depth_range():
+    """depth_range decodes only the records inside the window."""
+    data_dir = Path(__file__).parent / 'data'
+    sample_dlis_paths = list(data_dir.glob('*.dlis')) + list(data_dir.glob('*.DLIS'))
+    if not sample_dlis_paths:
+        pytest.skip("No DLIS test files found")
+    
+    full = parseDLIS(sample_dlis_paths[0], verbose=False)
+    top, base = full.index[len(full) // 3], full.index[len(full) // 2]
+    df = parseDLIS(sample_dlis_paths[0], verbose=False, depth_range=(top, base))
+    pd.testing.assert_frame_equal(df, full.loc[top:base])
+
+
+def test_aparseDLIS_process_pool_matches_parseDLIS():
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    from LASMnemonicsID.DLIS import aparseDLIS
+    data_dir = Path(__file__).parent / 'data'
+    serial = parseDLIS(data_dir, verbose=False)
+    if not serial:
+        pytest.skip("No DLIS test files found")
+    
+    async def run():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await aparseDLIS(data_dir, verbose=False, executor=executor)
+    
+    result = asyncio.run(run())
+    assert list(result) == list(serial)
+    for name in serial:
+        pd.testing.assert_frame_equal(result[name], serial[name])
+
+
+def test_openDLIS_releases_local_copy_when_load_fails(monkeypatch):
+    """A failing load does not leak the decompressed copy of an archived file."""
+    from contextlib import contextmanager
+    from LASMnemonicsID.DLIS import DLIS as dlis_module
+    
+    released = []
+    
+    @contextmanager
+    def local_copy(path):
+        try:
+            yield path
+        finally:
+            released.append(path)
+    
+    def load(path):
+        raise OSError("not a DLIS file")
+    
+    monkeypatch.setattr(dlis_module, "_local_copy", local_copy)
+    monkeypatch.setattr(dlis_module.dlisio.dlis, "load", load)
+    with pytest.raises(OSError):
+        dlis_module.openDLIS("run.dlis.gz")
+    assert len(released) == 1
+
+
+def test_parseDLIS_selective_read_falls_back_to_public_api(monkeypatch):
+    """Without the internal reader (other dlisio release, or any failure) frame.curves() gives the same frame."""
+    from LASMnemonicsID.DLIS import DLIS as dlis_module
+    data_dir = Path(__file__).parent / 'data'
+    sample_dlis_paths = list(data_dir.glob('*.dlis')) + list(data_dir.glob('*.DLIS'))
+    if not sample_dlis_paths:
+        pytest.skip("No DLIS test files found")
+    
+    full = parseDLIS(sample_dlis_paths[0], verbose=False)
+    window = (full.index[len(full) // 3], full.index[len(full) // 2])
+    expected = parseDLIS(sample_dlis_paths[0], verbose=False, curve_types=["GR"], depth_range=window)
+    
+    def broken(*args, **kwargs):
+        raise RuntimeError("internal reader changed")
+    monkeypatch.setattr(dlis_module, "_read_fdata", broken)
+    pd.testing.assert_frame_equal(
+        parseDLIS(sample_dlis_paths[0], verbose=False, curve_types=["GR"], depth_range=window), expected)
+    
+    monkeypatch.setattr(dlis_module, "_FDATA_FAST_PATH", False)
+    pd.testing.assert_frame_equal(
+        parseDLIS(sample_dlis_paths[0], verbose=False, curve_types=["GR"], depth_range=window), expected)
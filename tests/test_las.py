@@ -1,5 +1,6 @@
 
 import lasio
+import numpy as np
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -40,3 +41,286 @@ def test_parseLAS_single_file():
     assert isinstance(df, pd.DataFrame)
     assert len(df) > 0
     assert 'GR' in df.columns  # Standardization ✓
+
+
+def test_parseLAS_parallel_matches_serial(tmp_path):
+    """Process-pool directory mode gives the same frames in the same order; errors are collected."""
+    import shutil
+    data_dir = Path(__file__).parent / 'data'
+    src = next(data_dir.glob('*.las'))
+    for i in range(3):
+        shutil.copy(src, tmp_path / f"well_{i}.las")
+    (tmp_path / "broken.las").write_text("not a las file\n")
+    
+    serial = parseLAS(tmp_path, verbose=False)
+    errors = []
+    parallel = parseLAS(tmp_path, verbose=False, workers=2, errors=errors)
+    assert list(parallel) == list(serial)
+    for name in serial:
+        pd.testing.assert_frame_equal(parallel[name], serial[name])
+    assert len(errors) == 1
+    path, exc_name, message = errors[0]
+    assert path.name == "broken.las"
+    assert isinstance(exc_name, str)
+
+
+def test_iter_las_streams_wells(tmp_path):
+    """iter_las yields (filename, df) lazily, with and without read-ahead."""
+    import shutil
+    from LASMnemonicsID.LAS import iter_las
+    data_dir = Path(__file__).parent / 'data'
+    src = next(data_dir.glob('*.las'))
+    for i in range(3):
+        shutil.copy(src, tmp_path / f"well_{i}.las")
+    
+    expected = parseLAS(tmp_path, verbose=False)
+    for prefetch in (0, 2):
+        wells = iter_las(tmp_path, verbose=False, prefetch=prefetch)
+        assert not isinstance(wells, dict)
+        names = []
+        for name, df in wells:
+            pd.testing.assert_frame_equal(df, expected[name])
+            names.append(name)
+        assert names == list(expected)
+    
+    # Stopping early closes the background reader cleanly
+    wells = iter_las(tmp_path, verbose=False, prefetch=1)
+    name, df = next(wells)
+    wells.close()
+    assert name in expected
+
+
+def test_scanLAS_header_only(tmp_path):
+    """Header scan matches lasio and never touches the ~A section."""
+    from LASMnemonicsID.LAS import scanLAS
+    data_dir = Path(__file__).parent / 'data'
+    src = next(data_dir.glob('*.las'))
+    las = lasio.read(src)
+    
+    header = scanLAS(src, verbose=False)
+    assert header["well_name"] == str(las.well.WELL.value).strip()
+    assert header["strt"] == las.well.STRT.value
+    assert header["stop"] == las.well.STOP.value
+    assert header["step"] == las.well.STEP.value
+    assert [c["mnemonic"] for c in header["curves"]] == [c.mnemonic for c in las.curves]
+    assert {"mnemonic": "GR", "unit": "GAPI", "description": "Gamma Ray", "curve_type": "gamma"} in header["curves"]
+    
+    # Corrupt data section: header scan still works, full parse does not
+    text = src.read_text(encoding="utf-8", errors="replace")
+    head = text[:text.index("~A")]
+    (tmp_path / "corrupt.las").write_text(head + "~A\n1 2 3 garbage\x00\n")
+    result = scanLAS(tmp_path, verbose=False)
+    assert list(result) == ["corrupt.las"]
+    assert result["corrupt.las"]["well_name"] == header["well_name"]
+
+
+def test_parseLAS_cache(tmp_path, monkeypatch):
+    """Second parse is served from the cache; preferred_names is part of the key."""
+    from LASMnemonicsID.utils.cache import FrameCache
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    cache = FrameCache(tmp_path / "cache")
+    
+    first = parseLAS(src, verbose=False, cache=cache)
+    assert cache.size() > 0
+    
+    def _fail(*args, **kwargs):
+        raise AssertionError("lasio.read called on a cache hit")
+    monkeypatch.setattr(lasio, "read", _fail)
+    cached = parseLAS(src, verbose=False, cache=cache)
+    pd.testing.assert_frame_equal(cached, first)
+    
+    # Different preferred names must miss the cache (and fail here)
+    assert parseLAS(src, verbose=False, cache=cache, preferred_names={"gamma": "GAMMA"}) is None
+    
+    # A second parameter set is stored next to the first instead of replacing it
+    monkeypatch.undo()
+    parseLAS(src, verbose=False, cache=cache, units="canonical")
+    monkeypatch.setattr(lasio, "read", _fail)
+    pd.testing.assert_frame_equal(parseLAS(src, verbose=False, cache=cache), first)
+    assert parseLAS(src, verbose=False, cache=cache, units="canonical") is not None
+    
+    # A corrupt entry is a miss
+    for entry in (tmp_path / "cache").glob("*/*.npz"):
+        entry.write_bytes(b"not a zip")
+    assert parseLAS(src, verbose=False, cache=cache) is None
+    
+    cache.invalidate(src)
+    assert cache.size() == 0
+
+
+def test_parseLAS_fast_engine_matches_lasio(tmp_path):
+    """engine="fast" gives the lasio result, and falls back to lasio for wrapped files."""
+    from LASMnemonicsID.LAS.LAS import _read_las_fast, _FastPathUnsupported
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    pd.testing.assert_frame_equal(parseLAS(src, verbose=False, engine="fast"),
+                                  parseLAS(src, verbose=False))
+    
+    wrapped = tmp_path / "wrapped.las"
+    wrapped.write_text(
+        "~V\nVERS. 2.0 :\nWRAP. YES :\n"
+        "~W\nSTRT.M 1 :\nSTOP.M 2 :\nSTEP.M 1 :\nNULL. -999.25 :\n"
+        "~C\nDEPT.M :\nGR.GAPI :\nRHOB.G/C3 :\n"
+        "~A\n1\n10 2.3\n2\n-999.25 2.4\n"
+    )
+    with pytest.raises(_FastPathUnsupported):
+        _read_las_fast(wrapped)
+    df = parseLAS(wrapped, verbose=False, engine="fast")
+    pd.testing.assert_frame_equal(df, parseLAS(wrapped, verbose=False))
+    assert list(df.columns) == ["GR", "RHOB"]
+    assert np.isnan(df["GR"].iloc[1])
+    
+    with pytest.raises(ValueError):
+        parseLAS(src, engine="bogus")
+
+
+def test_parseLAS_curve_types_subset():
+    """curve_types reads only the selected curves, on both engines."""
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    full = parseLAS(src, verbose=False)
+    for engine in ("lasio", "fast"):
+        df = parseLAS(src, verbose=False, engine=engine, curve_types=["GR", "density"])
+        assert set(df.columns) <= {"GR", "RHOB"}
+        pd.testing.assert_frame_equal(df, full[list(df.columns)])
+    
+    with pytest.raises(ValueError):
+        parseLAS(src, curve_types=["bogus"])
+
+
+def test_parseLAS_fuzzy_mnemonics(tmp_path):
+    """Vendor variants are only matched with fuzzy=True, and QC channels are always kept."""
+    las = tmp_path / "vendor.las"
+    las.write_text(
+        "~V\nVERS. 2.0 :\nWRAP. NO :\n"
+        "~W\nSTRT.M 1 :\nSTOP.M 2 :\nSTEP.M 1 :\nNULL. -999.25 :\n"
+        "~C\nDEPT.M :\nGR_EDTC_1.GAPI :\nRHOB.G/C3 :\nRHOB_FLAG. :\nDT_ERR. :\n"
+        "~A\n1 10 2.3 0 1\n2 20 2.4 1 0\n"
+    )
+    for engine in ("lasio", "fast"):
+        df = parseLAS(las, verbose=False, engine=engine)
+        assert list(df.columns) == ["GR_EDTC_1", "RHOB", "RHOB_FLAG", "DT_ERR"]
+        df = parseLAS(las, verbose=False, engine=engine, fuzzy=True)
+        assert list(df.columns) == ["GR", "RHOB", "RHOB_FLAG", "DT_ERR"]
+        df = parseLAS(las, verbose=False, engine=engine, fuzzy=True, curve_types=["GR"])
+        assert list(df.columns) == ["GR"]
+
+
+def test_parseLAS_depth_range(monkeypatch):
+    """depth_range returns the rows inside the window on both engines."""
+    import LASMnemonicsID.LAS.LAS as las_module
+    monkeypatch.setattr(las_module, "DEPTH_CHUNK_ROWS", 100)
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    full = parseLAS(src, verbose=False)
+    top, base = full.index[len(full) // 4], full.index[len(full) // 2]
+    for engine in ("lasio", "fast"):
+        df = parseLAS(src, verbose=False, engine=engine, depth_range=(top, base))
+        pd.testing.assert_frame_equal(df, full.loc[top:base])
+    
+    with pytest.raises(ValueError):
+        parseLAS(src, depth_range=(base, top))
+
+
+def test_aparseLAS_matches_parseLAS():
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from LASMnemonicsID.LAS import aparseLAS, aiter_las
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    expected = parseLAS(src, verbose=False)
+    
+    async def run():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            single = await aparseLAS(src, verbose=False, executor=executor)
+            wells = [item async for item in aiter_las(src.parent, verbose=False, executor=executor)]
+        return single, wells
+    
+    single, wells = asyncio.run(run())
+    pd.testing.assert_frame_equal(single, expected)
+    assert [name for name, _ in wells] == [src.name]
+    pd.testing.assert_frame_equal(wells[0][1], expected)
+
+
+def test_parseLAS_instrument_metrics(tmp_path, capsys):
+    """instrument receives per-file metrics, also from the process pool, and verbose=False prints nothing."""
+    from LASMnemonicsID.utils import Instrumentation
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    (tmp_path / "good.las").write_bytes(src.read_bytes())
+    (tmp_path / "bad.las").write_text("not a LAS file")
+    
+    for workers in (None, 2):
+        instrument = Instrumentation()
+        parseLAS(tmp_path, verbose=False, engine="fast", workers=workers, instrument=instrument)
+        stats = instrument.stats
+        assert stats.files == 2 and stats.status["ok"] == 1 and stats.status["error"] == 1
+        good = next(m for m in stats.slowest() if m.status == "ok")
+        assert {"header", "data", "build", "standardize"} <= set(good.phases)
+        assert good.rows > 0 and good.bytes_read == src.stat().st_size
+    assert capsys.readouterr().out == ""
+
+
+def test_parseLAS_batch_result(tmp_path):
+    """as_result reports failures with their phase; fail_fast stops at the first failure."""
+    from LASMnemonicsID import BatchResult, BatchReadError
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    (tmp_path / "good.las").write_bytes(src.read_bytes())
+    (tmp_path / "bad.las").write_text("not a LAS file")
+    
+    for workers in (None, 2):
+        result = parseLAS(tmp_path, verbose=False, workers=workers, as_result=True)
+        assert isinstance(result, BatchResult)
+        assert list(result) == ["good.las"] and not result.skipped
+        failure, = result.failures
+        assert failure.path.name == "bad.las" and failure.phase == "data"
+        assert isinstance(failure.error, str) and failure.message
+    
+    with pytest.raises(BatchReadError) as excinfo:
+        parseLAS(sorted(tmp_path.glob("*.las")), verbose=False, fail_fast=True)
+    assert excinfo.value.failure.path.name == "bad.las"
+    assert len(excinfo.value.result.failures) == 1
+
+
+def test_parseLAS_manifest_incremental(tmp_path):
+    """With a manifest only added/changed files are re-read and deletions are reported."""
+    import os
+    from LASMnemonicsID import Manifest
+    src = next((Path(__file__).parent / 'data').glob('*.las'))
+    wells = tmp_path / "wells"
+    wells.mkdir()
+    for name in ("a.las", "b.las", "c.las"):
+        (wells / name).write_bytes(src.read_bytes())
+    manifest = Manifest(tmp_path / "manifest.sqlite")
+    
+    first = parseLAS(wells, verbose=False, manifest=manifest, as_result=True)
+    assert sorted(first) == ["a.las", "b.las", "c.las"] and len(manifest) == 3
+    entry = manifest.entries("las")[0]
+    assert entry["rows"] == len(first["a.las"]) and entry["curves"] == list(first["a.las"].columns)
+    
+    # b touched only, c modified, a deleted, d added
+    os.utime(wells / "b.las", ns=(1, 1))
+    (wells / "c.las").write_bytes(src.read_bytes() + b"\n")
+    (wells / "a.las").unlink()
+    (wells / "d.las").write_bytes(src.read_bytes())
+    second = parseLAS(wells, verbose=False, manifest=manifest, as_result=True)
+    assert sorted(second) == ["c.las", "d.las"]
+    assert [path.name for path in second.unchanged] == ["b.las"]
+    assert [path.name for path in second.deleted] == ["a.las"]
+    
+    assert parseLAS(wells, verbose=False, manifest=manifest) == {}
+    assert parseLAS(wells, verbose=False, manifest=manifest, preferred_names={"gamma": "GAM"}).keys() == {
+        "b.las", "c.las", "d.las"}
+
+
+@pytest.mark.parametrize("engine", ["lasio", "fast"])
+def test_parseLAS_compact_float32(engine):
+    """compact=True returns float32 curves with a float64 depth index and the same values."""
+    from LASMnemonicsID import memory_report
+    path = next((Path(__file__).parent / 'data').glob('*.las'))
+    full = parseLAS(path, verbose=False, engine=engine)
+    compact = parseLAS(path, verbose=False, engine=engine, compact=True)
+    assert set(compact.dtypes) == {np.dtype(np.float32)} and compact.index.dtype == np.float64
+    pd.testing.assert_index_equal(compact.index, full.index)
+    np.testing.assert_allclose(compact.to_numpy(np.float64), full.to_numpy(), rtol=1e-6)
+    
+    report = memory_report({"full": full, "compact": compact})
+    assert report.loc["full", "saved_bytes"] == 0
+    assert report.loc["compact", "saved_bytes"] == 4 * compact.size
+    with pytest.raises(ValueError):
+        parseLAS(path, verbose=False, dtype="int32")
@@ -35,3 +35,411 @@ def test_find_column_exists(single_las_path, curve_type):
         col = find_column(df, curve_type)
         if col:
             assert col in df.columns
+
+def test_alias_index_lookup():
+    from LASMnemonicsID.utils.mnemonics import alias_index
+    assert alias_index["gr"] == ("gamma", 0)
+    assert alias_index["rhob"][0] == "density"
+    assert alias_index["denscorr"][0] == "density_correction"
+    # DTSC is listed under both dtc and dts; first curve type wins
+    assert alias_index["dtsc"][0] == "dtc"
+    with pytest.raises(TypeError):
+        alias_index["foo"] = ("gamma", 0)
+
+def test_standardize_all_curves_single_pass():
+    import pandas as pd
+    from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+    df = pd.DataFrame(columns=["DEPT", "GRC", "gr", "AT90", "ILD", "RHOZ", "FOO"])
+    std_names = {"gamma": "GR", "deepres": "RT", "density": "RHOB",
+                 "deepres_preferred_original": "AT90"}
+    df = _standardize_all_curves(None, df, std_names)
+    assert list(df.columns) == ["DEPT", "GR", "RT", "RHOB", "FOO"]
+
+def test_standardize_all_curves_projection_metadata():
+    """Dropped aliases are removed in one projection that shares the data of large frames."""
+    import numpy as np
+    import pandas as pd
+    from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+    df = pd.DataFrame(np.zeros((1 << 16, 6)), columns=["GRC", "gr", "FOO", "AT90", "ILD", "BAR"])
+    source = df._mgr.blocks[0].values
+    out = _standardize_all_curves(None, df, {"gamma": "GR", "deepres": "RT"})
+    assert list(out.columns) == ["GR", "FOO", "RT", "BAR"]
+    assert list(df.columns) == ["GRC", "gr", "FOO", "AT90", "ILD", "BAR"]
+    assert all(np.shares_memory(block.values, source) for block in out._mgr.blocks)
+    assert out.attrs["standardization"] == {
+        "renamed": {"GR": "GRC", "RT": "AT90"},
+        "dropped": {"GR": ["gr"], "RT": ["ILD"]},
+        "curve_types": {"GR": "gamma", "RT": "deepres"},
+    }
+    assert out.attrs["mnemonics"] == {"GR": "GRC", "FOO": "FOO", "RT": "AT90", "BAR": "BAR"}
+
+def test_match_mnemonic_families():
+    import pandas as pd
+    from LASMnemonicsID.utils.mnemonics import match_mnemonic, MnemonicMatcher
+    from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+    assert match_mnemonic("gr") == ("gamma", 0)
+    # Pattern matching is opt-in
+    assert match_mnemonic("GR_EDTC_1") is None
+    assert match_mnemonic("GR_EDTC_1", True)[0] == "gamma"
+    assert match_mnemonic("RHOB_TLD", True)[0] == "density"
+    assert match_mnemonic("DT_2", True)[0] == "dtc"
+    assert match_mnemonic("AHX90", True)[0] == "deepres"
+    assert match_mnemonic("TNPH_LS", True)[0] == "neutron"
+    assert match_mnemonic("GRAIN", True) is None and match_mnemonic("FOO_1", True) is None
+    # Only run numbers and tool codes are suffixes; quality-control channels never match
+    for name in ["GR_NORM", "NPHI_SS", "DT_QC", "RHOB_FLAG", "DT_ERR", "TNPH_QUAL", "DTCO_MASK"]:
+        assert match_mnemonic(name, True) is None, name
+    
+    matcher = MnemonicMatcher({"gamma": ["GR"]}, {"gamma": {"prefix": ["SGR"]}}, cache_size=2)
+    assert matcher.match("sgr_x", True)[0] == "gamma" and matcher.match("GR")[1] == 0
+    assert matcher.match("GR_2", True) == ("gamma", 1)
+    matcher.match("GR_2", True)
+    assert matcher.match.cache_info().hits == 1
+    
+    # Without fuzzy only exact aliases are standardized
+    columns = ["DEPT", "GR_EDTC_1", "GR", "DT_2"]
+    df = _standardize_all_curves(None, pd.DataFrame(columns=columns), {"gamma": "GR", "dtc": "DT"})
+    assert list(df.columns) == columns
+    
+    # A pattern match stands in for a missing curve type, but is never dropped
+    df = _standardize_all_curves(None, pd.DataFrame(columns=columns), {"gamma": "GR", "dtc": "DT"}, fuzzy=True)
+    assert list(df.columns) == ["DEPT", "GR_EDTC_1", "GR", "DT"]
+    assert df.attrs["standardization"]["renamed"] == {"DT": "DT_2"}
+    
+    # QC channels survive next to their curves, and nothing is renamed onto an existing name
+    columns = ["RHOB_FLAG", "DT_ERR", "SP_1", "SP", "CALI.2", "CALI", "DTCO_MASK", "TNPH_QUAL", "GR_NORM"]
+    std_names = {"caliper": "CALI", "sp": "SP"}
+    df = _standardize_all_curves(None, pd.DataFrame(columns=columns), std_names, fuzzy=True)
+    assert list(df.columns) == columns
+    df = _standardize_all_curves(None, pd.DataFrame(columns=["GR_EDTC_1", "FOO"]), {"gamma": "FOO"}, fuzzy=True)
+    assert list(df.columns) == ["GR_EDTC_1", "FOO"]
+
+def test_prefetch_preserves_order_and_errors():
+    from LASMnemonicsID.utils.parallel import prefetch
+    assert list(prefetch(iter(range(10)), size=2)) == list(range(10))
+
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    gen = prefetch(failing(), size=1)
+    assert next(gen) == 1
+    with pytest.raises(ValueError):
+        next(gen)
+
+def test_frame_cache_lru_eviction(tmp_path):
+    import numpy as np
+    import pandas as pd
+    from LASMnemonicsID.utils.cache import FrameCache
+
+    df = pd.DataFrame({"GR": np.arange(1000.0)}, index=pd.Index(np.arange(1000.0), name="DEPTH"))
+    files = []
+    for i in range(3):
+        path = tmp_path / f"well_{i}.las"
+        path.write_text(str(i))
+        files.append(path)
+
+    cache = FrameCache(tmp_path / "cache", max_bytes=10 ** 9)
+    for path in files:
+        cache.fetch(path, {}, lambda: df)
+    entry_size = cache.size() // 3
+
+    # Shrink the bound to two entries; the least recently used one goes first
+    cache.max_bytes = int(entry_size * 2.5)
+    cache.fetch(files[0], {}, lambda: None)  # hit, touches well_0
+    new = tmp_path / "well_3.las"
+    new.write_text("3")
+    cache.fetch(new, {}, lambda: df)
+    assert cache.size() <= cache.max_bytes
+    assert cache.fetch(files[0], {}, lambda: None) is not None
+    assert cache.fetch(files[1], {}, lambda: None) is None
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_export_archive_partitions(tmp_path):
+    """Each well is written per curve type with the DEPTH + standardized name schema."""
+    from pathlib import Path
+    import pandas as pd
+    from LASMnemonicsID import export_archive
+    from LASMnemonicsID.ASCII import parseASCII
+
+    src = Path(__file__).parent / "data" / "sample.csv"
+    written = export_archive(src, tmp_path, format="csv", verbose=False)
+    assert list(written) == ["sample"]
+
+    df = parseASCII(src, verbose=False)
+    gamma = pd.read_csv(tmp_path / "well=sample" / "curve_type=gamma" / "part-0.csv")
+    assert list(gamma.columns) == ["DEPTH", "GR"]
+    assert len(gamma) == len(df)
+
+    parts = {p.parent.name for p in written["sample"]}
+    assert "curve_type=density" in parts
+
+    with pytest.raises(ValueError):
+        export_archive(src, tmp_path, format="xlsx")
+
+
+def test_export_archive_parquet_row_group_per_well(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from pathlib import Path
+    from LASMnemonicsID import export_archive
+
+    written = export_archive(Path(__file__).parent / "data", tmp_path, verbose=False)
+    for paths in written.values():
+        for path in paths:
+            assert pq.ParquetFile(path).metadata.num_row_groups == 1
+
+
+def test_depth_rows_binary_search_and_mask():
+    import numpy as np
+    from LASMnemonicsID.LAS.LAS import _depth_rows
+
+    depth = np.arange(100.0, 110.0)
+    assert _depth_rows(depth, (102.5, 105.0)) == slice(3, 6)
+    assert _depth_rows(depth[::-1], (102.5, 105.0)) == slice(4, 7)
+    unsorted = np.array([3.0, 1.0, 2.0, 5.0])
+    assert list(_depth_rows(unsorted, (2.0, 3.0))) == [0, 2]
+
+
+def test_read_depth_window_stops_past_base():
+    import pandas as pd
+    from LASMnemonicsID.LAS.LAS import _read_depth_window
+
+    consumed = []
+
+    def chunks():
+        for start in range(0, 100, 10):
+            consumed.append(start)
+            yield pd.DataFrame({"DEPTH": [float(d) for d in range(start, start + 10)]})
+
+    window = _read_depth_window(chunks(), "DEPTH", (25.0, 41.0))
+    assert consumed == [0, 10, 20, 30, 40]
+    assert window["DEPTH"].min() == 20.0 and window["DEPTH"].max() == 49.0
+
+
+def test_aread_files_order_limit_and_cancel():
+    """Results come back in input order, concurrency is bounded and cancellation stops the reads."""
+    import asyncio
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from LASMnemonicsID.utils.aio import aread_files
+
+    lock = threading.Lock()
+    running, peak, started = [0], [0], []
+
+    def slow_read(path, delay):
+        with lock:
+            started.append(path)
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(delay * (5 - path % 5))
+        with lock:
+            running[0] -= 1
+        return path * 10
+
+    async def collect():
+        return [item async for item in aread_files(slow_read, range(10), {"delay": 0.002},
+                                                   executor, max_concurrency=3)]
+
+    async def cancel_early():
+        async def consume():
+            async for _ in aread_files(slow_read, range(100), {"delay": 0.01}, executor, max_concurrency=2):
+                pass
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert asyncio.run(collect()) == [(i, i * 10) for i in range(10)]
+        assert peak[0] <= 3
+
+        started.clear()
+        assert asyncio.run(cancel_early())
+        time.sleep(0.1)
+        assert len(started) < 100
+
+
+def test_measure_records_phases_and_failing_phase():
+    from LASMnemonicsID.utils.instrument import measure, phase, Instrumentation
+
+    def load(path):
+        with phase("header"):
+            pass
+        try:
+            with phase("data"):
+                raise ValueError("fast path")
+        except ValueError:
+            pass  # handled fallback must not be blamed
+        with phase("standardize"):
+            raise RuntimeError("boom")
+
+    df, metrics = measure(load, "missing.las")
+    assert df is None
+    assert (metrics.status, metrics.error, metrics.phase) == ("error", "RuntimeError", "standardize")
+    assert set(metrics.phases) == {"header", "data", "standardize"}
+
+    seen = []
+    instrument = Instrumentation(on_file=seen.append, stats=None)
+    instrument.record(metrics)
+    assert seen == [metrics]
+    assert instrument.stats.errors["RuntimeError"] == 1
+    assert instrument.stats.slowest(1) == [metrics]
+
+def test_unit_conversion_factors():
+    import numpy as np
+    import pandas as pd
+    from LASMnemonicsID.utils.units import normalize_unit, unit_factor, resolve_units
+    from LASMnemonicsID.LAS.LAS import _standardize_all_curves
+    assert normalize_unit("0.1 in") == ("in", 0.1)
+    assert normalize_unit("G/CC") == ("g/cm3", 1.0)
+    assert unit_factor("FT", "m") == 0.3048
+    assert unit_factor("us/m", "us/ft") == 0.3048
+    assert unit_factor("kg/m3", "g/cm3") == 0.001
+    assert unit_factor("gAPI", "m") is None
+    with pytest.raises(ValueError):
+        resolve_units({"porosity": "%"})
+    
+    df = pd.DataFrame({"DTCO": [1000.0, 500.0], "ZDEN": [2400.0, 2650.0], "FOO": [1.0, 2.0]},
+                      index=pd.Index([100.0, 200.0], name="DEPT"))
+    df.attrs["units"] = {"DEPT": "F", "DTCO": "us/m", "ZDEN": "kg/m3", "FOO": "ft"}
+    df = _standardize_all_curves(None, df, {"dtc": "DT", "density": "RHOB"}, resolve_units("canonical"))
+    np.testing.assert_allclose(df.index, [30.48, 60.96])
+    np.testing.assert_allclose(df["DT"], [304.8, 152.4])
+    np.testing.assert_allclose(df["RHOB"], [2.4, 2.65])
+    assert list(df["FOO"]) == [1.0, 2.0]
+    assert df.attrs["units"] == {"DEPT": "m", "DT": "us/ft", "RHOB": "g/cm3", "FOO": "ft"}
+    assert df.attrs["unit_conversions"]["DT"] == {"from": "us/m", "to": "us/ft", "factor": 0.3048}
+
+def test_stack_wells_resamples_onto_grid(tmp_path):
+    import numpy as np
+    import pandas as pd
+    from LASMnemonicsID import stack_wells, open_stack
+    a = pd.DataFrame({"GR": [10.0, 20.0, np.nan, 40.0], "RHOB": [2.0, 2.1, 2.2, 2.3]},
+                     index=pd.Index([100.0, 101.0, 102.0, 103.0], name="DEPTH"))
+    b = pd.DataFrame({"GR": [60.0, 50.0]}, index=[100.5, 101.5])
+    
+    stack = stack_wells({"a": a, "b": b}, step=0.5)
+    assert stack.data.shape == (2, 7, 2) and stack.data.dtype == np.float32
+    assert stack.wells == ["a", "b"] and stack.curves == ["GR", "RHOB"]
+    np.testing.assert_allclose(stack.depth, np.arange(100.0, 103.5, 0.5))
+    np.testing.assert_allclose(stack.data[0, :, 0], [10, 15, 20, np.nan, np.nan, np.nan, 40])
+    np.testing.assert_allclose(stack.data[1, :, 0], [np.nan, 60, 55, 50, np.nan, np.nan, np.nan])
+    assert np.isnan(stack.data[1, :, 1]).all()
+    
+    nearest = stack_wells({"a": a}, step=0.5, method="nearest")
+    np.testing.assert_allclose(nearest.data[0, :3, 1], [2.0, 2.1, 2.1])
+    
+    # Streaming into a memory map gives the same array
+    path = tmp_path / "stack.npy"
+    stack_wells(iter([("a", a), ("b", b)]), step=0.5, curves=["GR", "RHOB"], top=100, base=103, out=path)
+    mapped = open_stack(path)
+    assert isinstance(mapped.data, np.memmap) and mapped.wells == ["a", "b"]
+    np.testing.assert_array_equal(mapped.data, stack.data)
+    with pytest.raises(ValueError):
+        stack_wells(iter([("a", a)]), step=0.5)
+
+def test_curve_inventory_build_and_query(tmp_path):
+    """The inventory indexes curve types per file and answers queries without reading the logs."""
+    import os
+    from pathlib import Path
+    from LASMnemonicsID import CurveInventory
+    data = Path(__file__).parent / 'data'
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    for name in ("WalkerSmith#31.las", "sample.csv"):
+        (archive / name).write_bytes((data / name).read_bytes())
+    inventory = CurveInventory(tmp_path / "inventory.sqlite")
+
+    assert inventory.build(archive, verbose=False)["indexed"] == 2 and len(inventory) == 2
+    las, csv = archive.resolve() / "WalkerSmith#31.las", archive.resolve() / "sample.csv"
+    assert inventory.query(["gamma"]) == [las, csv]
+    assert inventory.query(["GR"], kind="las") == [las]
+    assert inventory.query(["dts"]) == []
+    assert inventory.query(["gamma"], depth_range=(None, 100)) == [las]    # canonical metres
+    assert inventory.query(well="walker%") == [las]
+    gr = inventory.curves(las)[0]
+    assert gr["curve_type"] == "gamma" and gr["mnemonic"] == "GR" and gr["unit"] == "gAPI"
+    assert gr["null_fraction"] == 0.0
+
+    # Text columns are summarized too instead of failing the file
+    (archive / "litho.csv").write_text("DEPTH,GR,LITH\n100,50,sand\n101,,shale\n102,60,\n")
+    assert inventory.build(archive, verbose=False)["failed"] == 0
+    curves = {curve["name"]: curve for curve in inventory.curves(archive.resolve() / "litho.csv")}
+    assert curves["LITH"]["null_fraction"] == pytest.approx(1 / 3) and curves["LITH"]["depth_max"] == 101
+    (archive / "litho.csv").unlink()
+
+    os.utime(las, ns=(1, 1))
+    (archive / "sample.csv").unlink()
+    counts = inventory.build(archive, verbose=False)
+    assert counts == {"indexed": 1, "unchanged": 0, "removed": 2, "failed": 0}
+    assert inventory.query(["gamma"]) == [las]
+
+def test_compressed_and_archived_sources(tmp_path):
+    """Compressed files and zip/tar members are found and parsed in place, like the plain files."""
+    import gzip
+    import tarfile
+    import zipfile
+    from pathlib import Path
+    import pandas as pd
+    from LASMnemonicsID import parseLAS, parseDLIS, parseASCII
+    from LASMnemonicsID.utils.compression import find_sources, open_source
+    data = Path(__file__).parent / 'data'
+    las, csv, dlis = data / "WalkerSmith#31.las", data / "sample.csv", data / "15_9-F-9_WLC_COMPOSITE_1.DLIS"
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    with zipfile.ZipFile(archive / "logs.zip", "w", zipfile.ZIP_DEFLATED) as z:
+        z.write(las, "run1/well.las")
+        z.write(csv, "run1/well.csv")
+        z.write(dlis, "well.dlis")
+        z.writestr("run2/well2.las.gz", gzip.compress(las.read_bytes()))
+    with tarfile.open(archive / "logs.tar.gz", "w:gz") as tar:
+        tar.add(las, "a.las")
+        tar.add(csv, "b.csv")
+        tar.add(las, "c.las")
+    (archive / "single.las.gz").write_bytes(gzip.compress(las.read_bytes()))
+
+    root = archive.resolve()
+    assert sorted(find_sources(root, (".las",))) == sorted([
+        root / "logs.tar.gz" / "a.las", root / "logs.tar.gz" / "c.las", root / "logs.zip" / "run1" / "well.las",
+        root / "logs.zip" / "run2" / "well2.las.gz", root / "single.las.gz"])
+    with open_source(root / "logs.zip" / "run2" / "well2.las.gz") as f:
+        assert f.read() == las.read_bytes()
+
+    expected = parseLAS(las, verbose=False)
+    wells = parseLAS(archive, verbose=False, engine="fast")
+    assert sorted(wells) == ["a.las", "c.las", "single.las.gz", "well.las", "well2.las.gz"]
+    for df in wells.values():
+        pd.testing.assert_frame_equal(df, expected, check_exact=False)
+    pd.testing.assert_frame_equal(parseLAS(archive / "logs.tar.gz" / "c.las", verbose=False), expected)
+
+    csvs = parseASCII(archive / "logs.tar.gz", verbose=False)
+    pd.testing.assert_frame_equal(csvs, parseASCII(csv, verbose=False))
+    pd.testing.assert_frame_equal(parseDLIS(archive / "logs.zip", verbose=False), parseDLIS(dlis, verbose=False))
+
+def test_evicted_zip_keeps_open_members_readable(tmp_path, monkeypatch):
+    """A zip evicted from the open-container cache stays open until its member streams are closed."""
+    import zipfile
+    from LASMnemonicsID.utils import compression
+    monkeypatch.setattr(compression, "MAX_OPEN_CONTAINERS", 1)
+    for name in ("a.zip", "b.zip"):
+        with zipfile.ZipFile(tmp_path / name, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("well.las", name * 1000)
+    first = compression._container(tmp_path / "a.zip")
+    with compression.open_source(tmp_path / "a.zip" / "well.las") as f:
+        head = f.read(5)
+        compression._container(tmp_path / "b.zip")    # evicts a.zip
+        assert first.zip is not None
+        assert head + f.read() == b"a.zip" * 1000
+    assert first.zip is None
+    # Opening a member of the evicted container again reopens (and then closes) it
+    with first.open("well.las") as f:
+        assert f.read(5) == b"a.zip"
+    assert first.zip is None